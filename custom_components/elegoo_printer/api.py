@@ -32,7 +32,10 @@ from .const import (
 from .mqtt.client import ElegooMqttClient
 from .mqtt.const import MQTT_BROKER_PORT, MQTT_PORT
 from .mqtt.server import ElegooMQTTBroker
-from .sdcp.exceptions import ElegooPrinterConnectionError
+from .sdcp.exceptions import (
+    ElegooPrinterConnectionError,
+    ElegooPrinterTimeoutError,
+)
 from .sdcp.models.elegoo_image import ElegooImage
 from .sdcp.models.enums import TransportType
 from .sdcp.models.printer import Printer, PrinterData
@@ -120,6 +123,8 @@ class ElegooPrinterApiClient:
         self.mqtt_broker: ElegooMQTTBroker | None = None
         self.hass: HomeAssistant = hass
         self._config_entry = config_entry
+        # Data classes that loaded in the last async_get_printer_data() call
+        self.refreshed_data: frozenset[str] = frozenset()
 
     async def _discover_printer_with_fallback(
         self,
@@ -858,17 +863,34 @@ class ElegooPrinterApiClient:
         """Set the target bed temperature."""
         await self.client.set_target_bed_temp(temperature)
 
-    async def async_get_printer_data(self) -> PrinterData:
+    async def async_get_printer_data(
+        self, *, include_attributes: bool = True, include_history: bool = True
+    ) -> PrinterData:
         """
         Asynchronously retrieves and updates the printer's attribute data.
 
+        Attributes, status and print history are independent requests, so they
+        are sent together and awaited as a group; the current task depends on
+        the status and is fetched afterwards. The names of the requests that
+        loaded are left in refreshed_data.
+
+        Arguments:
+            include_attributes: Whether to refresh the printer attributes.
+            include_history: Whether to refresh the print history list.
+
         Returns:
             PrinterData: The latest attribute information for the printer.
 
         """
-        await self.async_get_attributes()
-        await self.async_get_status()
-        await self.async_get_print_history()
+        requests = {"status": self.async_get_status()}
+        if include_attributes:
+            requests["attributes"] = self.async_get_attributes()
+        if include_history:
+            requests["print history"] = self.async_get_print_history()
+        results = await asyncio.gather(*requests.values(), return_exceptions=True)
+        self.refreshed_data = self._raise_for_failed_requests(
+            dict(zip(requests, results, strict=True))
+        )
         await self.async_get_current_task()
         self.printer_data.calculate_current_job_end_time()
         status = (
@@ -883,6 +905,35 @@ class ElegooPrinterApiClient:
         )
         return self.printer_data
 
+    def _raise_for_failed_requests(self, results: dict[str, object]) -> frozenset[str]:
+        """
+        Apply partial-failure semantics to requests issued concurrently.
+
+        A failed status request or a lost connection fails the refresh. A
+        timed-out attributes or history request only keeps the values cached
+        from the previous refresh.
+
+        Arguments:
+            results: Request name mapped to its result or raised exception.
+
+        Returns:
+            The names of the requests that succeeded.
+
+        Raises:
+            BaseException: The first fatal exception among the results.
+
+        """
+        loaded = set()
+        for name, result in results.items():
+            if not isinstance(result, BaseException):
+                loaded.add(name)
+                continue
+            if name != "status" and isinstance(result, ElegooPrinterTimeoutError):
+                self._logger.debug("Timed out refreshing %s, keeping cached data", name)
+                continue
+            raise result
+        return frozenset(loaded)
+
     async def async_get_canvas_status(self) -> dict[str, Any] | None:
         """Get Canvas/AMS status."""
         if self.client and hasattr(self.client, "get_canvas_status"):
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
@@ -92,11 +92,26 @@ class ElegooPrinterBinarySensor(ElegooPrinterEntity, BinarySensorEntity):
 
         The attributes are generated by the entity descriptions extra_attributes method.
         """
+        if self._writing_fingerprint is not None:
+            return self._writing_fingerprint[2]
         return self.entity_description.extra_attributes(self)
 
     @property
     def is_on(self) -> bool:
         """Return true if the binary_sensor is on."""
+        if self._writing_fingerprint is not None:
+            return self._writing_fingerprint[1]
+        return self._compute_is_on()
+
+    def _compute_is_on(self) -> bool:
         if self.coordinator.data:
             return self.entity_description.value_fn(self.coordinator.data)
         return False
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return the availability, state and attributes written for the sensor."""
+        return (
+            self.available,
+            self._compute_is_on(),
+            self.entity_description.extra_attributes(self),
+        )
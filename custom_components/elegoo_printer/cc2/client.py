@@ -17,11 +17,11 @@ import json
 import secrets
 import time
 from collections import deque
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
 import aiomqtt
 
+from custom_components.elegoo_printer.sdcp import json_codec
 from custom_components.elegoo_printer.sdcp.exceptions import (
     ElegooPrinterConnectionError,
     ElegooPrinterNotConnectedError,
@@ -36,6 +36,7 @@ from custom_components.elegoo_printer.sdcp.models.printer import (
     PrinterData,
 )
 from custom_components.elegoo_printer.sdcp.models.video import ElegooVideo
+from custom_components.elegoo_printer.sdcp.push import DataListenerMixin
 
 from .const import (
     CC2_CMD_GET_ATTRIBUTES,
@@ -80,7 +81,7 @@ if TYPE_CHECKING:
     from .gcode_proxy import GCodeProxyClient
 
 
-class ElegooCC2Client:
+class ElegooCC2Client(DataListenerMixin):
     """
     MQTT client for CC2 printers.
 
@@ -175,10 +176,15 @@ class ElegooCC2Client:
         self._integration_data: dict[str, Any] = {}
         self._status_sequence = 0
         self._non_continuous_count = 0
-        # Queued snapshots: each distinct print_info.status between HA polls
+        # Queued snapshots: each distinct print_info.status between HA polls.
+        # Mapped statuses are never modified once published (the mapper builds a
+        # new object per change), so the queue holds references, not copies.
         self._print_status_transition_queue: deque[PrinterStatus] = deque(
             maxlen=CC2_PRINT_STATUS_TRANSITION_QUEUE_MAX
         )
+        # Last status produced by the mapper, the base for incremental remaps
+        self._mapped_status: PrinterStatus | None = None
+        self._mapped_filament_filename: str | None = None
 
         # Registration tracking
         self._registration_event: asyncio.Event | None = None
@@ -535,7 +541,7 @@ class ElegooCC2Client:
         self._registration_result: dict[str, Any] | None = None
 
         try:
-            await self.mqtt_client.publish(topic, json.dumps(payload))
+            await self.mqtt_client.publish(topic, json_codec.dumps_bytes(payload))
             self.logger.debug(
                 "Published registration request to topic %s, waiting for response...",
                 topic,
@@ -612,7 +618,7 @@ class ElegooCC2Client:
                 # Send PING
                 topic = f"elegoo/{self.serial_number}/{self._client_id}/api_request"
                 ping_msg = {"type": "PING"}
-                await self.mqtt_client.publish(topic, json.dumps(ping_msg))
+                await self.mqtt_client.publish(topic, json_codec.dumps_bytes(ping_msg))
                 self.logger.debug("Sent heartbeat PING")
 
             except asyncio.CancelledError:
@@ -683,11 +689,8 @@ class ElegooCC2Client:
                     break
 
                 try:
-                    payload = message.payload.decode("utf-8")
                     topic = str(message.topic)
-                    await self._handle_message(topic, payload)
-                except UnicodeDecodeError:
-                    self.logger.debug("Failed to decode MQTT message")
+                    await self._handle_message(topic, message.payload)
                 except (json.JSONDecodeError, KeyError, ValueError):
                     self.logger.debug("Error processing MQTT message")
         except asyncio.CancelledError:
@@ -708,12 +711,12 @@ class ElegooCC2Client:
                     )
             self.logger.info("CC2 MQTT listener stopped")
 
-    async def _handle_message(self, topic: str, payload: str) -> None:
+    async def _handle_message(self, topic: str, payload: str | bytes) -> None:
         """Handle an incoming MQTT message."""
         self.logger.debug("Received message on topic: %s", topic)
 
         try:
-            data = json.loads(payload)
+            data = json_codec.loads(payload)
         except json.JSONDecodeError:
             self.logger.debug("Invalid JSON in message")
             return
@@ -791,7 +794,9 @@ class ElegooCC2Client:
     def _handle_full_status(self, status_data: dict[str, Any]) -> None:
         """Handle a full status response (from method 1002)."""
         self.logger.debug("Received full status update")
-        self._cached_status = deepcopy(status_data)
+        # The payload was freshly decoded for this message: take ownership of it
+        # instead of copying, later deltas are merged into it in place.
+        self._cached_status = status_data
         self._status_sequence = status_data.get("sequence", 0)
         self._non_continuous_count = 0
 
@@ -822,18 +827,28 @@ class ElegooCC2Client:
         self._status_sequence = new_sequence
 
         # Deep merge delta into cached status
-        self._deep_merge(self._cached_status, delta_data)
+        changed_keys = self._deep_merge(self._cached_status, delta_data)
 
-        # Convert to PrinterStatus
-        self._update_printer_status()
+        # Convert to PrinterStatus, re-mapping only what the delta touched
+        self._update_printer_status(changed_keys)
+
+    def _deep_merge(self, base: dict, update: dict) -> set[str]:
+        """
+        Deep merge update into base dictionary.
 
-    def _deep_merge(self, base: dict, update: dict) -> None:
-        """Deep merge update into base dictionary."""
+        Returns:
+            The keys of base whose value changed.
+
+        """
+        changed_keys: set[str] = set()
         for key, value in update.items():
             if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
+                if self._deep_merge(base[key], value):
+                    changed_keys.add(key)
+            elif key not in base or base[key] != value:
                 base[key] = value
+                changed_keys.add(key)
+        return changed_keys
 
     def _cc2_status_view(self) -> dict[str, Any]:
         """Printer cache plus integration-only keys for status mappers."""
@@ -841,10 +856,14 @@ class ElegooCC2Client:
             return self._cached_status
         return self._cached_status | self._integration_data
 
-    def _update_printer_status(self) -> None:
+    def _update_printer_status(self, changed_keys: set[str] | None = None) -> None:
         """
         Update printer_data.status from cached status.
 
+        When changed_keys is given and printer_data.status is still the status
+        last mapped here, only the parts fed by those top-level keys are
+        re-mapped; otherwise the whole cache is mapped.
+
         Concurrency note: all callers run on the same asyncio event loop and
         never ``await`` between mutating ``_cached_status`` /
         ``_integration_data`` and calling this method, so no lock is needed.
@@ -853,32 +872,47 @@ class ElegooCC2Client:
         """
         try:
             cc2_view = self._cc2_status_view()
-            previous_print_status = self.printer_data.status.print_info.status
+            previous_status = self.printer_data.status
+            previous_print_status = previous_status.print_info.status
             # Map CC2 status format to PrinterStatus
+            if previous_status is not self._mapped_status:
+                changed_keys = None
             mapped_status = CC2StatusMapper.map_status(
-                cc2_view, self.printer.printer_type
+                cc2_view,
+                self.printer.printer_type,
+                previous=previous_status,
+                changed_keys=changed_keys,
             )
+            self._mapped_status = mapped_status
             new_print_status = mapped_status.print_info.status
             if new_print_status != previous_print_status:
-                self._print_status_transition_queue.append(deepcopy(mapped_status))
+                self._print_status_transition_queue.append(mapped_status)
             self.printer_data.status = mapped_status
             self.logger.debug(
                 "Updated printer status: %s",
                 self.printer_data.status.current_status,
             )
 
-            # Map filament data from cached file details
+            # Map filament data from cached file details when it may have changed
             current_filename = self._cached_status.get("print_status", {}).get(
                 "filename"
             )
-            self.printer_data.gcode_filament_data = CC2StatusMapper.map_filament_data(
-                cc2_view, current_filename
-            )
+            if (
+                changed_keys is None
+                or "_file_details" in changed_keys
+                or current_filename != self._mapped_filament_filename
+            ):
+                self.printer_data.gcode_filament_data = (
+                    CC2StatusMapper.map_filament_data(cc2_view, current_filename)
+                )
+                self._mapped_filament_filename = current_filename
 
             # Update current job for begin_time/end_time sensors
             self._update_current_job()
         except Exception:
             self.logger.exception("Failed to map CC2 status to PrinterStatus")
+        else:
+            self._notify_data_listener()
 
     def _clear_stale_caches(self, filename: str, file_info: dict[str, Any]) -> None:
         """Drop proxy, MQTT file-detail, and thumbnail caches for a re-used filename."""
@@ -1040,7 +1074,7 @@ class ElegooCC2Client:
                 file_info["proxy_filament"] = data
                 file_info["proxy_filament_status"] = "success"
                 self.logger.debug("Proxy filament data cached for %s", filename)
-                self._update_printer_status()
+                self._update_printer_status({"_file_details"})
         except (TimeoutError, OSError) as exc:
             self.logger.debug(
                 "Failed to fetch proxy filament data for %s: %s",
@@ -1132,7 +1166,7 @@ class ElegooCC2Client:
                 total_filament_used,
                 len(color_map) if color_map else 0,
             )
-            self._update_printer_status()
+            self._update_printer_status({"_file_details"})
         else:
             self.logger.debug(
                 "File detail response for %s had no enrichment markers. Keys: %s",
@@ -1181,7 +1215,7 @@ class ElegooCC2Client:
             self._integration_data["_file_thumbnails"][filename] = thumbnail
             self.logger.debug("Cached file thumbnail for %s", filename)
             # Update printer status so the thumbnail propagates to the job
-            self._update_printer_status()
+            self._update_printer_status({"_file_thumbnails"})
         else:
             self.logger.debug(
                 "File thumbnail response for %s had no thumbnail. Keys: %s",
@@ -1217,6 +1251,8 @@ class ElegooCC2Client:
                 self.printer.sync_from_attributes(mapped_attrs)
         except Exception:
             self.logger.exception("Failed to map CC2 attributes")
+        else:
+            self._notify_data_listener()
 
     def _handle_video_response(self, video_data: dict[str, Any]) -> None:
         """Handle video stream response."""
@@ -1295,7 +1331,7 @@ class ElegooCC2Client:
 
         try:
             if self.mqtt_client:
-                await self.mqtt_client.publish(topic, json.dumps(payload))
+                await self.mqtt_client.publish(topic, json_codec.dumps_bytes(payload))
 
                 if wait_for_response:
                     try:
@@ -14,6 +14,7 @@ import socket
 from typing import TYPE_CHECKING, Any
 
 from custom_components.elegoo_printer.const import DEFAULT_BROADCAST_ADDRESS
+from custom_components.elegoo_printer.sdcp import json_codec
 
 from .const import (
     CC2_DISCOVERY_MESSAGE,
@@ -117,7 +118,7 @@ class CC2Discovery:
     ) -> None:
         """Process a discovery response and add to discovered printers if valid."""
         try:
-            response = json.loads(data.decode("utf-8"))
+            response = json_codec.loads(data)
             LOGGER.debug("CC2 discovery response: %s", response)
 
             # Validate response has expected structure
@@ -197,7 +198,7 @@ class CC2Discovery:
             retries,
         )
 
-        msg = json.dumps(CC2_DISCOVERY_MESSAGE).encode("utf-8")
+        msg = json_codec.dumps_bytes(CC2_DISCOVERY_MESSAGE)
 
         with socket.socket(
             socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
@@ -7,6 +7,7 @@ models used by the rest of the integration.
 
 from __future__ import annotations
 
+from copy import copy
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from custom_components.elegoo_printer.sdcp.models.attributes import PrinterAttributes
@@ -61,6 +62,8 @@ from .const import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from custom_components.elegoo_printer.sdcp.models.enums import PrinterType
 
 
@@ -115,34 +118,94 @@ class CC2StatusMapper:
         CC2_SUBSTATUS_AUTO_LEVELING_COMPLETED: ElegooPrintStatus.LEVELING,
     }
 
+    # Top-level CC2 status keys each part of PrinterStatus is mapped from
+    STATUS_SECTION_KEYS: ClassVar[dict[str, frozenset[str]]] = {
+        "machine_status": frozenset({"machine_status"}),
+        "temperatures": frozenset({"extruder", "heater_bed", "ztemperature_sensor"}),
+        "fans": frozenset({"fans"}),
+        "light": frozenset({"led"}),
+        "print_info": frozenset(
+            {
+                "machine_status",
+                "print_status",
+                "gcode_move_inf",
+                "gcode_move",
+                "error_code",
+                "_file_details",
+            }
+        ),
+        "position": frozenset({"gcode_move_inf", "gcode_move", "z_offset"}),
+    }
+
     @classmethod
     def map_status(
         cls,
         cc2_data: dict[str, Any],
         printer_type: PrinterType | None = None,
+        previous: PrinterStatus | None = None,
+        changed_keys: Collection[str] | None = None,
     ) -> PrinterStatus:
         """
         Map CC2 status data to PrinterStatus.
 
+        With a previous status and the top-level keys that changed since it was
+        mapped, only the affected parts are rebuilt. The result is a new object
+        that shares the untouched nested objects with ``previous``, which is
+        never modified. If nothing relevant changed, ``previous`` is returned.
+
         Arguments:
             cc2_data: The raw CC2 status data (real CC2 nested format).
             printer_type: The type of printer (for FDM-specific handling).
+            previous: The status last mapped from the same cache, if any.
+            changed_keys: Top-level keys of cc2_data changed since ``previous``.
 
         Returns:
             A PrinterStatus object compatible with the existing integration.
 
         """
-        # Create status object with mapped data
-        status = PrinterStatus()
+        if previous is None or changed_keys is None:
+            # Create status object with mapped data
+            status = PrinterStatus()
+            sections = cls.STATUS_SECTION_KEYS.keys()
+        else:
+            sections = {
+                section
+                for section, keys in cls.STATUS_SECTION_KEYS.items()
+                if not keys.isdisjoint(changed_keys)
+            }
+            if not sections:
+                return previous
+            status = copy(previous)
+
+        if "machine_status" in sections:
+            cls._map_machine_status(status, cc2_data)
+        if "temperatures" in sections:
+            cls._map_temperatures(status, cc2_data)
+        if "fans" in sections:
+            status.current_fan_speed = cls._map_fan_speed(cc2_data)
+        if "light" in sections:
+            status.light_status = cls._map_light_status(cc2_data)
+        if "print_info" in sections:
+            status.print_info = cls._map_print_info(cc2_data, printer_type)
+        if "position" in sections:
+            cls._map_position(status, cc2_data)
+
+        return status
 
-        # Map machine status from nested structure
+    @classmethod
+    def _map_machine_status(
+        cls, status: PrinterStatus, cc2_data: dict[str, Any]
+    ) -> None:
+        """Map the CC2 machine status onto status.current_status."""
         machine_status = cc2_data.get("machine_status", {})
         cc2_status = machine_status.get("status", CC2_STATUS_IDLE)
         status.current_status = cls.MACHINE_STATUS_MAP.get(
             cc2_status, ElegooMachineStatus.IDLE
         )
 
-        # Map temperatures from nested structure
+    @staticmethod
+    def _map_temperatures(status: PrinterStatus, cc2_data: dict[str, Any]) -> None:
+        """Map the CC2 nozzle, bed and box temperatures onto status."""
         extruder = cc2_data.get("extruder", {})
         heater_bed = cc2_data.get("heater_bed", {})
         status.temp_of_nozzle = round(extruder.get("temperature", 0), 2)
@@ -154,7 +217,9 @@ class CC2StatusMapper:
         status.temp_of_box = round(ztemp.get("temperature", 0), 2)
         status.temp_target_box = 0.0  # CC2 may not have box target
 
-        # Map fan speeds from nested structure (CC2 uses 0-255, convert to %)
+    @staticmethod
+    def _map_fan_speed(cc2_data: dict[str, Any]) -> CurrentFanSpeed:
+        """Map CC2 fan speeds (0-255) to a CurrentFanSpeed in percent."""
         fans = cc2_data.get("fans", {})
         fan_speed = fans.get("fan", {}).get("speed", 0)
         aux_fan_speed = fans.get("aux_fan", {}).get("speed", 0)
@@ -164,30 +229,27 @@ class CC2StatusMapper:
         def to_pct(val: float) -> int:
             return round(val / 255 * 100) if val else 0
 
-        status.current_fan_speed = CurrentFanSpeed(
-            {
-                "ModelFan": to_pct(fan_speed),
-                "AuxiliaryFan": to_pct(aux_fan_speed),
-                "BoxFan": to_pct(box_fan_speed),
-            }
-        )
+        current_fan_speed = CurrentFanSpeed()
+        current_fan_speed.model_fan = to_pct(fan_speed)
+        current_fan_speed.auxiliary_fan = to_pct(aux_fan_speed)
+        current_fan_speed.box_fan = to_pct(box_fan_speed)
+        return current_fan_speed
 
-        # Map light status from nested structure
+    @staticmethod
+    def _map_light_status(cc2_data: dict[str, Any]) -> LightStatus:
+        """Map the CC2 LED brightness to a LightStatus."""
         led = cc2_data.get("led", {})
         led_status = led.get("status", 0)
         # Convert LED brightness (0-255) to on/off state
-        status.light_status = LightStatus(
-            {
-                "SecondLight": 1 if led_status > 0 else 0,
-                "RgbLight": [led_status, led_status, led_status],
-            }
-        )
-
-        # Map print info
-        print_info = cls._map_print_info(cc2_data, printer_type)
-        status.print_info = print_info
+        light_status = LightStatus()
+        light_status.second_light = 1 if led_status > 0 else 0
+        light_status.rgb_light = [led_status, led_status, led_status]
+        return light_status
 
-        # Map position - try gcode_move_inf first (official), fallback to gcode_move
+    @staticmethod
+    def _map_position(status: PrinterStatus, cc2_data: dict[str, Any]) -> None:
+        """Map the CC2 toolhead position and z offset onto status."""
+        # Try gcode_move_inf first (official), fallback to gcode_move
         pos = cc2_data.get("gcode_move_inf", {})
         if not pos:
             pos = cc2_data.get("gcode_move", {})
@@ -197,8 +259,6 @@ class CC2StatusMapper:
         status.current_coord = f"{x:.2f},{y:.2f},{z:.2f}"
         status.z_offset = cc2_data.get("z_offset", 0.0)
 
-        return status
-
     @classmethod
     def _map_print_info(
         cls,
@@ -0,0 +1,154 @@
+"""
+Tests for incremental CC2 status mapping.
+
+Delta events re-map only the parts of PrinterStatus fed by the top-level keys
+the merge changed, and share the rest with the previous status.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+from custom_components.elegoo_printer.cc2.client import ElegooCC2Client
+from custom_components.elegoo_printer.cc2.const import (
+    CC2_STATUS_PRINTING,
+    CC2_SUBSTATUS_PRINTING,
+)
+from custom_components.elegoo_printer.cc2.models import CC2StatusMapper
+from custom_components.elegoo_printer.sdcp.models.enums import PrinterType
+from custom_components.elegoo_printer.sdcp.models.printer import Printer
+
+FULL_STATUS = {
+    "sequence": 1,
+    "machine_status": {
+        "status": CC2_STATUS_PRINTING,
+        "sub_status": CC2_SUBSTATUS_PRINTING,
+    },
+    "extruder": {"temperature": 210.0, "target": 210},
+    "heater_bed": {"temperature": 60.0, "target": 60},
+    "fans": {"fan": {"speed": 255}},
+    "led": {"status": 255},
+    "print_status": {"filename": "benchy.gcode"},
+}
+
+STATUS_FIELDS = (
+    "current_status",
+    "temp_of_nozzle",
+    "temp_target_nozzle",
+    "temp_of_hotbed",
+    "current_coord",
+    "z_offset",
+)
+
+
+def _slot_values(obj: object) -> dict[str, object]:
+    return {name: getattr(obj, name) for name in type(obj).__slots__}
+
+
+def _client() -> ElegooCC2Client:
+    printer = Printer()
+    printer.printer_type = PrinterType.FDM
+    client = ElegooCC2Client("192.168.1.1", "TESTSN", printer=printer)
+    client._handle_full_status(deepcopy(FULL_STATUS))
+    return client
+
+
+class TestDeepMergeChangedKeys:
+    """_deep_merge reports the top-level keys whose value changed."""
+
+    def test_reports_changed_keys_only(self) -> None:
+        """Values equal to the cached ones are not reported."""
+        client = _client()
+
+        changed = client._deep_merge(
+            client._cached_status,
+            {
+                "extruder": {"temperature": 211.0},
+                "heater_bed": {"temperature": 60.0},
+                "led": {"status": 255},
+            },
+        )
+
+        assert changed == {"extruder"}
+
+    def test_reports_new_keys(self) -> None:
+        """Keys missing from the cache are reported."""
+        client = _client()
+
+        changed = client._deep_merge(client._cached_status, {"z_offset": 0.1})
+
+        assert changed == {"z_offset"}
+
+
+class TestIncrementalStatusMapping:
+    """Temperature deltas do not rebuild unrelated parts of the status."""
+
+    def test_temperature_delta_reuses_other_parts(self) -> None:
+        """A temperature delta shares fans, lights and print info."""
+        client = _client()
+        previous = client.printer_data.status
+
+        client._handle_delta_status({"sequence": 2, "extruder": {"temperature": 215}})
+
+        status = client.printer_data.status
+        assert status is not previous
+        assert status.temp_of_nozzle == 215  # noqa: PLR2004
+        assert previous.temp_of_nozzle == 210  # noqa: PLR2004
+        assert status.print_info is previous.print_info
+        assert status.current_fan_speed is previous.current_fan_speed
+        assert status.light_status is previous.light_status
+
+    def test_print_status_delta_rebuilds_print_info(self) -> None:
+        """A print_status delta rebuilds print_info only."""
+        client = _client()
+        previous = client.printer_data.status
+
+        client._handle_delta_status(
+            {"sequence": 2, "print_status": {"current_layer": 42}}
+        )
+
+        status = client.printer_data.status
+        assert status.print_info is not previous.print_info
+        assert status.print_info.current_layer == 42  # noqa: PLR2004
+        assert previous.print_info.current_layer is None
+        assert status.current_fan_speed is previous.current_fan_speed
+
+    def test_unchanged_delta_keeps_status(self) -> None:
+        """A delta that changes nothing keeps the previous status."""
+        client = _client()
+        previous = client.printer_data.status
+
+        client._handle_delta_status({"sequence": 2, "extruder": {"target": 210}})
+
+        assert client.printer_data.status is previous
+
+    def test_incremental_matches_full_mapping(self) -> None:
+        """Incremental mapping gives the same values as a full one."""
+        client = _client()
+
+        client._handle_delta_status(
+            {
+                "sequence": 2,
+                "extruder": {"temperature": 220},
+                "fans": {"fan": {"speed": 128}},
+                "gcode_move_inf": {"x": 1, "y": 2, "z": 3},
+            }
+        )
+
+        incremental = client.printer_data.status
+        full = CC2StatusMapper.map_status(client._cached_status, PrinterType.FDM)
+        for name in STATUS_FIELDS:
+            assert getattr(incremental, name) == getattr(full, name), name
+        assert _slot_values(incremental.current_fan_speed) == _slot_values(
+            full.current_fan_speed
+        )
+        assert _slot_values(incremental.print_info) == _slot_values(full.print_info)
+
+    def test_foreign_status_triggers_full_mapping(self) -> None:
+        """A status not produced by the mapper is fully re-mapped."""
+        client = _client()
+        client.printer_data.status = CC2StatusMapper.map_status({}, PrinterType.FDM)
+
+        client._handle_delta_status({"sequence": 2, "extruder": {"temperature": 215}})
+
+        assert client.printer_data.status.temp_of_hotbed == 60  # noqa: PLR2004
@@ -87,3 +87,19 @@ def test_consume_clears_queue() -> None:
     client._update_printer_status()
     assert len(client.consume_print_status_transition_queue()) == 1
     assert client.consume_print_status_transition_queue() == []
+
+
+def test_queue_holds_published_status_without_copying() -> None:
+    """Queued snapshots are the published status objects, not deep copies."""
+    client = _client()
+    client._cached_status = {
+        "print_status": {},
+        "machine_status": {
+            "status": CC2_STATUS_PRINTING,
+            "sub_status": CC2_SUBSTATUS_PRINTING,
+        },
+    }
+    client._update_printer_status()
+
+    (snapshot,) = client.consume_print_status_transition_queue()
+    assert snapshot is client.printer_data.status
@@ -25,19 +25,24 @@ from .cc2.const import CC2_CONFIG_FLOW_DISCOVERY_TIMEOUT
 from .cc2.discovery import CC2Discovery
 from .cc2.gcode_proxy import GCodeProxyClient
 from .const import (
+    CONF_ATTRIBUTES_REFRESH_INTERVAL,
     CONF_CAMERA_ENABLED,
     CONF_CC2_ACCESS_CODE,
     CONF_EXTERNAL_IP,
     CONF_GCODE_PROXY_URL,
     CONF_HAS_CANVAS,
+    CONF_HISTORY_REFRESH_INTERVAL,
     CONF_MQTT_EXTERNAL_HOST,
     CONF_MQTT_EXTERNAL_PORT,
     CONF_PROXY_ENABLED,
     CONFIG_VERSION_5,
+    DEFAULT_ATTRIBUTES_REFRESH_INTERVAL,
+    DEFAULT_HISTORY_REFRESH_INTERVAL,
     DOMAIN,
     LOGGER,
     WEBSOCKET_PORT,
 )
+from .sdcp import json_codec
 from .sdcp.exceptions import (
     ElegooConfigFlowConnectionError,
     ElegooConfigFlowGeneralError,
@@ -415,7 +420,7 @@ class ElegooFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 async for msg in ws:
                     if msg.type != aiohttp.WSMsgType.TEXT:
                         break
-                    parsed = json.loads(msg.data)
+                    parsed = json_codec.loads(msg.data)
                     topic = parsed.get("Topic", "")
                     if "status" in topic:
                         status_data = (
@@ -1175,6 +1180,7 @@ class ElegooOptionsFlowHandler(config_entries.OptionsFlow):
                 printer_data[CONF_GCODE_PROXY_URL] = proxy_url
             else:
                 printer_data.pop(CONF_GCODE_PROXY_URL, None)
+            self._apply_refresh_intervals(printer_data, user_input)
 
             return self.async_create_entry(
                 title=printer.name,
@@ -1204,8 +1210,41 @@ class ElegooOptionsFlowHandler(config_entries.OptionsFlow):
             vol.Optional(CONF_GCODE_PROXY_URL, default=""): selector.TextSelector(
                 selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT),
             ),
+            **ElegooOptionsFlowHandler._refresh_interval_schema(),
         }
 
+    @staticmethod
+    def _refresh_interval_schema() -> dict:
+        """Build the refresh-interval fields shared by every options form."""
+        interval_selector = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=30,
+                max=86400,
+                step=1,
+                mode=selector.NumberSelectorMode.BOX,
+                unit_of_measurement="s",
+            ),
+        )
+        return {
+            vol.Optional(
+                CONF_ATTRIBUTES_REFRESH_INTERVAL,
+                default=DEFAULT_ATTRIBUTES_REFRESH_INTERVAL,
+            ): interval_selector,
+            vol.Optional(
+                CONF_HISTORY_REFRESH_INTERVAL,
+                default=DEFAULT_HISTORY_REFRESH_INTERVAL,
+            ): interval_selector,
+        }
+
+    @staticmethod
+    def _apply_refresh_intervals(printer_data: dict, user_input: dict) -> None:
+        """Copy the refresh intervals from the form into the saved options."""
+        for key, default in (
+            (CONF_ATTRIBUTES_REFRESH_INTERVAL, DEFAULT_ATTRIBUTES_REFRESH_INTERVAL),
+            (CONF_HISTORY_REFRESH_INTERVAL, DEFAULT_HISTORY_REFRESH_INTERVAL),
+        ):
+            printer_data[key] = int(user_input.get(key, default))
+
     @staticmethod
     def _suggested_with_normalized_proxy(settings: dict) -> dict:
         suggested = dict(settings)
@@ -1243,6 +1282,7 @@ class ElegooOptionsFlowHandler(config_entries.OptionsFlow):
             vol.Optional(CONF_MQTT_EXTERNAL_PORT): selector.TextSelector(
                 selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT),
             ),
+            **self._refresh_interval_schema(),
         }
 
         if user_input is not None:
@@ -1268,9 +1308,11 @@ class ElegooOptionsFlowHandler(config_entries.OptionsFlow):
             else:
                 printer.mqtt_external_port = None
 
+            printer_data = printer.to_dict()
+            self._apply_refresh_intervals(printer_data, user_input)
             return self.async_create_entry(
                 title=printer.name,
-                data=printer.to_dict(),
+                data=printer_data,
             )
 
         return self.async_show_form(
@@ -1334,6 +1376,7 @@ class ElegooOptionsFlowHandler(config_entries.OptionsFlow):
                     printer_data[CONF_GCODE_PROXY_URL] = proxy_url
                 else:
                     printer_data.pop(CONF_GCODE_PROXY_URL, None)
+                self._apply_refresh_intervals(printer_data, user_input)
                 return self.async_create_entry(
                     title=tested_printer.name,
                     data=printer_data,
@@ -1386,4 +1429,5 @@ class ElegooOptionsFlowHandler(config_entries.OptionsFlow):
         schema[vol.Optional(CONF_EXTERNAL_IP)] = selector.TextSelector(
             selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT),
         )
+        schema.update(ElegooOptionsFlowHandler._refresh_interval_schema())
         return schema
@@ -34,6 +34,12 @@ CONF_CC2_ACCESS_CODE = "cc2_access_code"
 CONF_CC2_TOKEN_STATUS = "cc2_token_status"  # noqa: S105
 CONF_GCODE_PROXY_URL = "gcode_proxy_url"
 
+# Refresh scheduling (seconds)
+CONF_ATTRIBUTES_REFRESH_INTERVAL = "attributes_refresh_interval"
+CONF_HISTORY_REFRESH_INTERVAL = "history_refresh_interval"
+DEFAULT_ATTRIBUTES_REFRESH_INTERVAL = 300
+DEFAULT_HISTORY_REFRESH_INTERVAL = 3600
+
 # Websocket and proxy settings
 DEFAULT_BROADCAST_ADDRESS = "255.255.255.255"
 DEFAULT_FALLBACK_IP = "8.8.8.8"
@@ -45,6 +51,9 @@ VIDEO_ENDPOINT = "video"
 VIDEO_PORT = 3031
 WEBSOCKET_PORT = 3030
 
+# Events
+EVENT_UPLOAD_PROGRESS = f"{DOMAIN}_upload_progress"
+
 # Firmware service settings
 FIRMWARE_SERVICE_BASE_URL = "https://mms.chituiot.com"
 FIRMWARE_UPDATE_ENDPOINT = "/mainboardVersionUpdate/getInfo.do7"
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+from copy import copy
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 import httpx
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from custom_components.elegoo_printer.cc2.client import ElegooCC2Client
-from custom_components.elegoo_printer.const import CONF_HAS_CANVAS, LOGGER
+from custom_components.elegoo_printer.const import (
+    CONF_ATTRIBUTES_REFRESH_INTERVAL,
+    CONF_HAS_CANVAS,
+    CONF_HISTORY_REFRESH_INTERVAL,
+    DEFAULT_ATTRIBUTES_REFRESH_INTERVAL,
+    DEFAULT_HISTORY_REFRESH_INTERVAL,
+    LOGGER,
+)
 from custom_components.elegoo_printer.sdcp.exceptions import (
     ElegooPrinterConnectionError,
     ElegooPrinterNotConnectedError,
@@ -20,6 +29,11 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .data import ElegooPrinterConfigEntry
+    from .sdcp.models.printer import PrinterData
+
+# Listener context for entities that also receive intermediate CC2 print status
+# transitions, not only the final state of each update.
+PRINT_STATUS_TRANSITION_CONTEXT = "print_status_transition"
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -40,11 +54,41 @@ class ElegooDataUpdateCoordinator(DataUpdateCoordinator):
         self._firmware_check_interval = timedelta(hours=12)  # Check every 12 hours
         self._last_canvas_check: datetime | None = None
         self._canvas_check_interval = timedelta(seconds=30)  # Check every 30 seconds
+        # Attributes and the history list rarely change: refresh them on their
+        # own intervals, and the history also whenever the print job changes.
+        self._last_attributes_refresh: datetime | None = None
+        self._attributes_refresh_interval = timedelta(
+            seconds=merged_config.get(
+                CONF_ATTRIBUTES_REFRESH_INTERVAL, DEFAULT_ATTRIBUTES_REFRESH_INTERVAL
+            )
+        )
+        self._last_history_refresh: datetime | None = None
+        self._history_refresh_interval = timedelta(
+            seconds=merged_config.get(
+                CONF_HISTORY_REFRESH_INTERVAL, DEFAULT_HISTORY_REFRESH_INTERVAL
+            )
+        )
+        self._last_job_key: tuple[Any, Any] | None = None
+        # While the printer pushes status/attributes frames on its own, polling
+        # is only a liveness fallback and a refresh of data it never pushes.
+        self._poll_interval = timedelta(seconds=2)
+        self._push_poll_interval = timedelta(seconds=30)
+        self._push_enabled = False
+        self._last_push: datetime | None = None
+        self._poll_in_progress = False
         super().__init__(
             hass,
             LOGGER,
             name=f"{entry.title}",
-            update_interval=timedelta(seconds=2),
+            update_interval=self._poll_interval,
+        )
+        # Coalesce bursts of pushed frames into one listener update
+        self._push_debouncer = Debouncer(
+            hass,
+            LOGGER,
+            cooldown=0.5,
+            immediate=True,
+            function=self._async_handle_pushed_data,
         )
 
     async def _async_update_data(self) -> Any:
@@ -60,14 +104,11 @@ class ElegooDataUpdateCoordinator(DataUpdateCoordinator):
             UpdateFailed: If communication with the printer fails.
 
         """  # noqa: E501
+        self._poll_in_progress = True
         try:
-            self.data = (
-                await self.config_entry.runtime_data.api.async_get_printer_data()
-            )
-
-            # Get API reference for periodic checks
             api = self.config_entry.runtime_data.api
             now = datetime.now(UTC)
+            self.data = await self._async_fetch_printer_data(now)
 
             # Check if we need to update firmware info
             if (
@@ -102,10 +143,10 @@ class ElegooDataUpdateCoordinator(DataUpdateCoordinator):
                     self._last_canvas_check = now
 
             self._replay_cc2_print_status_transitions()
+            self._enable_push_updates()
 
             self.online = True
-            if self.update_interval != timedelta(seconds=2):
-                self.update_interval = timedelta(seconds=2)
+            self._adjust_poll_interval(now)
             return self.data  # noqa: TRY300
         except (
             ElegooPrinterConnectionError,
@@ -135,6 +176,119 @@ class ElegooDataUpdateCoordinator(DataUpdateCoordinator):
             )
             msg = f"Unexpected Error: {e.strerror}"
             raise UpdateFailed(msg) from e
+        finally:
+            self._poll_in_progress = False
+
+    async def _async_fetch_printer_data(self, now: datetime) -> PrinterData:
+        """
+        Fetch the printer data, including only the data classes that are due.
+
+        Status is fetched on every poll. Attributes and the print history list
+        follow their own intervals, and the history is also refreshed after the
+        print job changes. A data class that failed to load keeps its previous
+        refresh time, so it is requested again on the next poll.
+
+        Arguments:
+            now: The time of the current poll.
+
+        Returns:
+            The printer data returned by the API client.
+
+        """
+        refresh_attributes = (
+            self._last_attributes_refresh is None
+            or now - self._last_attributes_refresh >= self._attributes_refresh_interval
+        )
+        refresh_history = (
+            self._last_history_refresh is None
+            or now - self._last_history_refresh >= self._history_refresh_interval
+        )
+        api = self.config_entry.runtime_data.api
+        data = await api.async_get_printer_data(
+            include_attributes=refresh_attributes,
+            include_history=refresh_history,
+        )
+        # A data class that timed out is retried on the next poll
+        if refresh_attributes and "attributes" in api.refreshed_data:
+            self._last_attributes_refresh = now
+        if refresh_history and "print history" in api.refreshed_data:
+            self._last_history_refresh = now
+        self.data = data
+        self._invalidate_history_on_job_change()
+        return data
+
+    def _invalidate_history_on_job_change(self) -> None:
+        """Schedule a history refresh when the print job or its status changed."""
+        print_info = self.data.status.print_info
+        job_key = (print_info.task_id, print_info.status)
+        if self._last_job_key is not None and job_key != self._last_job_key:
+            LOGGER.debug("Print job changed, refreshing history on next poll")
+            self._last_history_refresh = None
+        self._last_job_key = job_key
+
+    def _enable_push_updates(self) -> None:
+        """
+        Subscribe to data pushed by the printer client.
+
+        Called after every successful poll so a client replaced on reconnect is
+        re-subscribed.
+        """
+        client = self.config_entry.runtime_data.api.client
+        if not hasattr(client, "set_data_listener"):
+            return
+        client.set_data_listener(self._handle_client_push)
+        self._push_enabled = True
+
+    def _adjust_poll_interval(self, now: datetime) -> None:
+        """
+        Pick the poll interval from whether the printer is pushing data.
+
+        Polling only drops to the slow fallback interval while unsolicited
+        frames keep arriving, and returns to the fast interval once they stop.
+        """
+        receiving_pushes = (
+            self._push_enabled
+            and self._last_push is not None
+            and now - self._last_push < self._push_poll_interval
+        )
+        interval = self._push_poll_interval if receiving_pushes else self._poll_interval
+        if self.update_interval != interval:
+            self.update_interval = interval
+
+    def _handle_client_push(self) -> None:
+        """Schedule a debounced listener update for data pushed by the client."""
+        if self._poll_in_progress:
+            # The reply to the coordinator's own request; the poll publishes it
+            return
+        self._last_push = datetime.now(UTC)
+        self._push_debouncer.async_schedule_call()
+
+    async def _async_handle_pushed_data(self) -> None:
+        """
+        Publish pushed printer data to entities without an API round trip.
+
+        Uses async_update_listeners rather than async_set_updated_data so the
+        fallback poll keeps its schedule and still detects a dead connection.
+        """
+        if self.data is None or not self.online:
+            return
+        api = self.config_entry.runtime_data.api
+        api.printer_data.calculate_current_job_end_time()
+        self._replay_cc2_print_status_transitions()
+        self.data = api.printer_data
+        self._invalidate_history_on_job_change()
+        self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Detach from the client and cancel pending pushed updates."""
+        await super().async_shutdown()
+        self._push_debouncer.async_shutdown()
+        runtime_data = getattr(self.config_entry, "runtime_data", None)
+        client = getattr(getattr(runtime_data, "api", None), "client", None)
+        if self._push_enabled and hasattr(client, "set_data_listener"):
+            client.set_data_listener(None)
+        self._push_enabled = False
+        self._last_push = None
 
     def _replay_cc2_print_status_transitions(self) -> None:
         """
@@ -142,8 +296,12 @@ class ElegooDataUpdateCoordinator(DataUpdateCoordinator):
 
         CC2 MQTT can deliver several status deltas within seconds; the client keeps only the
         latest merged state. After a normal data fetch, this drains the client's transition
-        queue, calls async_set_updated_data for each snapshot, then restores the live status
-        from the client so printer_data stays authoritative.
+        queue and writes each intermediate snapshot, in order, only to the entities that
+        registered with PRINT_STATUS_TRANSITION_CONTEXT. The final state is left to the
+        single full listener update that follows every poll or pushed update.
+
+        Snapshots are published on a shallow copy of printer_data, so the client's live
+        object is never touched, and coordinator data points back at it afterwards.
 
         Returns:
             None
@@ -153,13 +311,29 @@ class ElegooDataUpdateCoordinator(DataUpdateCoordinator):
         if not isinstance(api.client, ElegooCC2Client):
             return
         pending = api.client.consume_print_status_transition_queue()
+        live_data = api.printer_data
+        # The full update writes the live state, so a trailing snapshot with the
+        # same print status would only repeat it.
+        if (
+            pending
+            and pending[-1].print_info.status == live_data.status.print_info.status
+        ):
+            pending.pop()
         if not pending:
             return
-        original_status = api.printer_data.status
-        for status_snapshot in pending:
-            api.printer_data.status = status_snapshot
-            self.async_set_updated_data(api.printer_data)
-        api.printer_data.status = original_status
+        listeners = [
+            update_callback
+            for update_callback, context in list(self._listeners.values())
+            if context == PRINT_STATUS_TRANSITION_CONTEXT
+        ]
+        if listeners:
+            for status_snapshot in pending:
+                snapshot_data = copy(live_data)
+                snapshot_data.status = status_snapshot
+                self.data = snapshot_data
+                for update_callback in listeners:
+                    update_callback()
+        self.data = live_data
 
     def generate_unique_id(self, key: str) -> str:
         """
@@ -290,6 +290,8 @@ class ElegooPrinterSensorEntityDescription(
     exists_fn: Callable[..., bool] = lambda _: True
     extra_attributes: Callable[..., dict] = lambda _: {}
     icon_fn: Callable[..., str] = lambda _: "mdi:eye"
+    # Also write intermediate CC2 print status transitions replayed after a poll
+    replay_transitions: bool = False
 
 
 @dataclass
@@ -421,6 +423,7 @@ def _print_status_sensor(
         icon="mdi:file",
         device_class=SensorDeviceClass.ENUM,
         options=options,
+        replay_transitions=True,
         value_fn=lambda printer_data: (
             printer_data.status.print_info.status.name.lower()
             if printer_data
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -27,10 +31,16 @@ class ElegooPrinterEntity(CoordinatorEntity[ElegooDataUpdateCoordinator]):
 
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
+    # Outputs written on the last coordinator update, see _state_fingerprint
+    _last_state_fingerprint: tuple[Any, ...] | None = None
+    # The fingerprint being written, so properties can reuse its values
+    _writing_fingerprint: tuple[Any, ...] | None = None
 
-    def __init__(self, coordinator: ElegooDataUpdateCoordinator) -> None:
+    def __init__(
+        self, coordinator: ElegooDataUpdateCoordinator, context: Any = None
+    ) -> None:
         """Initialize."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context)
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -72,3 +82,31 @@ class ElegooPrinterEntity(CoordinatorEntity[ElegooDataUpdateCoordinator]):
     def available(self) -> bool:
         """Return if entity is available."""
         return super().available
+
+    def _state_fingerprint(self) -> tuple[Any, ...] | None:
+        """
+        Return the outputs this entity writes to the state machine.
+
+        Entities that return a tuple here skip the state write when it equals
+        the one from the previous coordinator update. None always writes.
+        The outputs are still computed on every update; only the write to the
+        state machine, and the events and recorder rows it causes, is saved.
+        While the state is written the tuple is kept in _writing_fingerprint,
+        so properties can return it instead of computing their values again.
+        A deep copy is kept for the next comparison, since attribute values can
+        be live lists or dicts of the printer data that change in place.
+        """
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Compute the entity's outputs and write state only if they changed."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint is not None and fingerprint == self._last_state_fingerprint:
+            return
+        self._last_state_fingerprint = deepcopy(fingerprint)
+        self._writing_fingerprint = fingerprint
+        try:
+            super()._handle_coordinator_update()
+        finally:
+            self._writing_fingerprint = None
@@ -23,6 +23,7 @@ from custom_components.elegoo_printer.const import (
     DISCOVERY_PORT,
     DISCOVERY_TIMEOUT,
 )
+from custom_components.elegoo_printer.sdcp import json_codec
 from custom_components.elegoo_printer.sdcp.const import (
     CMD_CONTINUE_PRINT,
     CMD_CONTROL_DEVICE,
@@ -56,10 +57,13 @@ from custom_components.elegoo_printer.sdcp.models.status import (
     PrinterStatus,
 )
 from custom_components.elegoo_printer.sdcp.models.video import ElegooVideo
+from custom_components.elegoo_printer.sdcp.push import DataListenerMixin
 
 from .const import (
+    MQTT_COMMAND_TIMEOUT,
     MQTT_KEEPALIVE,
     MQTT_PORT,
+    MQTT_REPLAY_SAFE_COMMANDS,
     MQTT_TOPIC_MIN_PARTS,
     TOPIC_ATTRIBUTES,
     TOPIC_ERROR,
@@ -74,7 +78,7 @@ if TYPE_CHECKING:
     from custom_components.elegoo_printer.sdcp.models.enums import ElegooFan
 
 
-class ElegooMqttClient:
+class ElegooMqttClient(DataListenerMixin):
     """
     MQTT client for interacting with an Elegoo printer via MQTT bridge.
 
@@ -344,10 +348,7 @@ class ElegooMqttClient:
         try:
             async for message in self.mqtt_client.messages:
                 try:
-                    payload = message.payload.decode("utf-8")
-                    self._parse_response(payload, str(message.topic))
-                except UnicodeDecodeError:
-                    self.logger.exception("Failed to decode MQTT message")
+                    self._parse_response(message.payload, str(message.topic))
                 except (json.JSONDecodeError, KeyError, ValueError):
                     self.logger.exception("Error processing MQTT message")
         except asyncio.CancelledError:
@@ -695,8 +696,13 @@ class ElegooMqttClient:
             try:
                 # Leading slash required to match printer's subscription pattern
                 topic = f"/{TOPIC_PREFIX}/{TOPIC_REQUEST}/{self.printer.id}"
-                await self.mqtt_client.publish(topic, json.dumps(payload))
-                await asyncio.wait_for(event.wait(), timeout=10)
+                # QoS 1 so the broker redelivers commands lost in a Wi-Fi blip,
+                # for commands that may safely reach the printer twice
+                qos = 1 if cmd in MQTT_REPLAY_SAFE_COMMANDS else 0
+                await self.mqtt_client.publish(
+                    topic, json_codec.dumps_bytes(payload), qos=qos
+                )
+                await asyncio.wait_for(event.wait(), timeout=MQTT_COMMAND_TIMEOUT)
             except asyncio.TimeoutError as e:
                 self.logger.debug(
                     "Timed out waiting for response to cmd %s (RequestID=%s)",
@@ -715,7 +721,7 @@ class ElegooMqttClient:
             msg = "Not connected"
             raise ElegooPrinterNotConnectedError(msg)
 
-    def _parse_response(self, response: str, topic: str) -> None:
+    def _parse_response(self, response: str | bytes, topic: str) -> None:
         """
         Parse and route an incoming JSON response message from the printer.
 
@@ -728,7 +734,7 @@ class ElegooMqttClient:
 
         """
         try:
-            data = json.loads(response)
+            data = json_codec.loads(response)
             self.logger.debug("Received MQTT message on topic: %s", topic)
             self.logger.debug("Message structure keys: %s", list(data.keys()))
             # Extract topic type from MQTT topic
@@ -832,10 +838,8 @@ class ElegooMqttClient:
             return
 
         try:
-            printer_status = PrinterStatus.from_json(
-                json.dumps(status_data), self.printer.printer_type
-            )
-            self.logger.debug("PrinterStatus.from_json() succeeded")
+            printer_status = PrinterStatus(status_data, self.printer.printer_type)
+            self.logger.debug("PrinterStatus() succeeded")
             self.printer_data.status = printer_status
             print_info_status = (
                 printer_status.print_info.status if printer_status.print_info else None
@@ -848,6 +852,8 @@ class ElegooMqttClient:
             )
         except Exception:
             self.logger.exception("Exception in _status_handler")
+        else:
+            self._notify_data_listener()
 
     def _attributes_handler(self, data: dict[str, Any]) -> None:
         """
@@ -886,16 +892,16 @@ class ElegooMqttClient:
             return
 
         try:
-            printer_attributes = PrinterAttributes.from_json(
-                json.dumps(attributes_data)
-            )
-            self.logger.debug("PrinterAttributes.from_json() succeeded")
+            printer_attributes = PrinterAttributes(attributes_data)
+            self.logger.debug("PrinterAttributes() succeeded")
             self.printer_data.attributes = printer_attributes
             self.logger.debug("Assigned printer_data.attributes successfully")
             if self.printer:
                 self.printer.sync_from_attributes(printer_attributes)
         except Exception:
             self.logger.exception("Exception in _attributes_handler")
+        else:
+            self._notify_data_listener()
 
     def _print_history_handler(self, data_data: dict[str, Any]) -> None:
         """Parse and update the printer's print history details from the data."""
@@ -2,12 +2,35 @@
 
 from logging import Logger, getLogger
 
+from custom_components.elegoo_printer.sdcp.const import (
+    CMD_CONTROL_DEVICE,
+    CMD_REQUEST_ATTRIBUTES,
+    CMD_REQUEST_STATUS_REFRESH,
+    CMD_RETRIEVE_HISTORICAL_TASKS,
+    CMD_RETRIEVE_TASK_DETAILS,
+    CMD_SET_STATUS_UPDATE_PERIOD,
+    CMD_SET_VIDEO_STREAM,
+)
+
 LOGGER: Logger = getLogger(__package__)
 
 # MQTT Connection Settings
 MQTT_PORT = 1883
 MQTT_KEEPALIVE = 60
 
+# MQTT Message Types
+MQTT_CONNECT = 1
+MQTT_CONNACK = 2
+MQTT_PUBLISH = 3
+MQTT_PUBACK = 4
+MQTT_SUBSCRIBE = 8
+MQTT_SUBACK = 9
+MQTT_UNSUBSCRIBE = 10
+MQTT_UNSUBACK = 11
+MQTT_PINGREQ = 12
+MQTT_PINGRESP = 13
+MQTT_DISCONNECT = 14
+
 # Embedded MQTT Broker Settings
 # Using 18830 to avoid conflict with Home Assistant's MQTT integration (1883)
 MQTT_BROKER_PORT = 18830
@@ -25,3 +48,42 @@ TOPIC_ERROR = "error"
 
 # MQTT topic parsing: sdcp/{message_type}/{printer_id}
 MQTT_TOPIC_MIN_PARTS = 3
+
+# Message types the embedded broker retains per printer, so new subscribers
+# get the last known state straight away
+RETAINED_TOPIC_TYPES = (TOPIC_STATUS, TOPIC_ATTRIBUTES)
+
+# Embedded broker per-client send queue
+MQTT_CLIENT_QUEUE_SIZE = 256  # Packets queued per client before overflow
+OVERFLOW_DROP_OLDEST = "drop_oldest"  # Drop the oldest queued packet
+OVERFLOW_DISCONNECT = "disconnect"  # Disconnect the client
+
+# Embedded broker QoS 1 delivery
+#
+# A command is only worth delivering while its sender still waits for the
+# response, so the broker stops resending and redelivering a publish once it
+# is MQTT_DELIVERY_LIFETIME old, which is kept below MQTT_COMMAND_TIMEOUT. A
+# caller that timed out and retries never has its first command run late too.
+MQTT_MAX_PACKET_ID = 65535  # Packet identifiers wrap back to 1 after this
+MQTT_INFLIGHT_WINDOW = 16  # Unacknowledged QoS 1 publishes per client
+MQTT_RETRY_INTERVAL = 2.0  # Seconds before an unacknowledged publish is resent
+MQTT_MAX_DELIVERY_ATTEMPTS = 4  # Sends of one publish before giving up on it
+MQTT_COMMAND_TIMEOUT = 10.0  # Seconds a client waits for a command's response
+MQTT_DELIVERY_LIFETIME = 8.0  # Seconds a publish is resent or redelivered for
+
+# Commands that are safe to replay, so they are sent with QoS 1 and may reach
+# the printer more than once. Queries are, and so are settings that carry an
+# absolute value (lights, fans, temperatures, video, push period). Print
+# control such as pause, resume and stop, and disconnect, is sent once with
+# QoS 0, since a repeat could act on a state the user has changed since.
+MQTT_REPLAY_SAFE_COMMANDS = frozenset(
+    {
+        CMD_REQUEST_STATUS_REFRESH,
+        CMD_REQUEST_ATTRIBUTES,
+        CMD_RETRIEVE_HISTORICAL_TASKS,
+        CMD_RETRIEVE_TASK_DETAILS,
+        CMD_CONTROL_DEVICE,
+        CMD_SET_VIDEO_STREAM,
+        CMD_SET_STATUS_UPDATE_PERIOD,
+    }
+)
@@ -0,0 +1,216 @@
+"""
+MQTT packet framing for the embedded broker.
+
+Incoming bytes are appended to one buffer and packets are cut out at a moving
+read offset. Consumed bytes are only dropped once they make up most of the
+buffer, so each byte is moved a bounded number of times however many packets
+arrive in one read. Outgoing packets are built as a list of buffers for
+``writelines`` so payloads are never concatenated with their headers.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+
+from .const import MQTT_PUBLISH
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# The Remaining Length field is at most four bytes long
+MAX_LENGTH_BYTES = 4
+
+# Smallest read requested from a client, to batch small packets
+MIN_READ_SIZE = 4096
+
+FIXED_HEADER_SIZE = 2
+
+# PUBLISH fixed header flag set when a packet is sent again
+PUBLISH_DUP = 0x08
+# PUBLISH fixed header flag for a retained message
+PUBLISH_RETAIN = 0x01
+
+
+def encode_length(length: int) -> bytes:
+    """
+    Encode a Remaining Length per the MQTT spec.
+
+    Args:
+        length: Length to encode
+
+    Returns:
+        Encoded length bytes
+
+    """
+    if length < 0x80:  # noqa: PLR2004
+        return bytes((length,))
+    encoded = bytearray()
+    while True:
+        digit = length % 128
+        length //= 128
+        if length > 0:
+            digit |= 0x80
+        encoded.append(digit)
+        if length == 0:
+            return bytes(encoded)
+
+
+def decode_length(data: bytes | bytearray, offset: int = 0) -> tuple[int, int] | None:
+    """
+    Decode a Remaining Length per the MQTT spec.
+
+    Args:
+        data: Bytes containing the encoded length
+        offset: Position of the first length byte in ``data``
+
+    Returns:
+        Tuple of (decoded_length, bytes_consumed), or None if ``data`` ends
+        before the length does
+
+    Raises:
+        ValueError: If the length is longer than four bytes.
+
+    """
+    value = 0
+    multiplier = 1
+    for index in range(MAX_LENGTH_BYTES):
+        if offset + index >= len(data):
+            return None
+        byte = data[offset + index]
+        value += (byte & 0x7F) * multiplier
+        if byte & 0x80 == 0:
+            return value, index + 1
+        multiplier *= 128
+    msg = "Malformed MQTT Remaining Length"
+    raise ValueError(msg)
+
+
+def encode_packet(
+    msg_type: int,
+    flags: int = 0,
+    packet_ident: int = 0,
+    payload: bytes | list[bytes] = b"",
+) -> list[bytes]:
+    """
+    Build an MQTT packet as a list of buffers for ``writelines``.
+
+    Args:
+        msg_type: MQTT message type
+        flags: Message flags
+        packet_ident: Packet identifier, omitted when 0
+        payload: Message payload, as one buffer or several
+
+    Returns:
+        The fixed header followed by the payload buffers
+
+    """
+    # Empty buffers are left out: some transports never flush them
+    parts = [
+        part for part in (payload if isinstance(payload, list) else [payload]) if part
+    ]
+    length = sum(len(part) for part in parts)
+    if packet_ident > 0:
+        length += 2
+    head = bytes((msg_type << 4 | flags,)) + encode_length(length)
+    if packet_ident > 0:
+        head += struct.pack("!H", packet_ident)
+    return [head, *parts]
+
+
+def encode_publish(  # noqa: PLR0913
+    topic: str,
+    payload: str | bytes,
+    qos: int = 0,
+    packet_id: int = 0,
+    *,
+    dup: bool = False,
+    retain: bool = False,
+) -> list[bytes]:
+    """
+    Build an MQTT PUBLISH packet as a list of buffers for ``writelines``.
+
+    Args:
+        topic: Topic name
+        payload: Message payload, str payloads are sent UTF-8 encoded
+        qos: Quality of Service level
+        packet_id: Packet identifier, required for QoS > 0
+        dup: Whether this is a redelivery of an earlier packet
+        retain: Whether this is a retained message
+
+    Returns:
+        The fixed header, the variable header and the payload
+
+    """
+    topic_bytes = topic.encode("utf-8")
+    payload_bytes = payload.encode("utf-8") if isinstance(payload, str) else payload
+    header = struct.pack("!H", len(topic_bytes)) + topic_bytes
+    # Only QoS > 0 packets carry a packet identifier
+    if qos > 0:
+        header += struct.pack("!H", packet_id)
+    flags = (qos << 1) & 0x06
+    if dup:
+        flags |= PUBLISH_DUP
+    if retain:
+        flags |= PUBLISH_RETAIN
+    return encode_packet(MQTT_PUBLISH, flags, payload=[header, payload_bytes])
+
+
+class PacketFramer:
+    """Split a client's byte stream into MQTT packets."""
+
+    def __init__(self) -> None:
+        """Initialize an empty framer."""
+        self._buffer = bytearray()
+        self._start = 0
+        self._missing = FIXED_HEADER_SIZE
+
+    @property
+    def buffered(self) -> int:
+        """Return the number of bytes received but not yet framed."""
+        return len(self._buffer) - self._start
+
+    @property
+    def read_size(self) -> int:
+        """Return how many bytes to ask for so the next packet can complete."""
+        return max(self._missing, MIN_READ_SIZE)
+
+    def feed(self, data: bytes) -> None:
+        """Append bytes read from the client."""
+        if self._start and self._start * 2 >= len(self._buffer):
+            # Drop consumed bytes once they are at least half the buffer
+            del self._buffer[: self._start]
+            self._start = 0
+        self._buffer += data
+
+    def packets(self) -> Iterator[tuple[int, int, bytes]]:
+        """
+        Yield every complete packet in the buffer.
+
+        Yields:
+            Tuples of (msg_type, flags, body)
+
+        Raises:
+            ValueError: If a packet's Remaining Length is malformed.
+
+        """
+        buffer = self._buffer
+        while True:
+            available = len(buffer) - self._start
+            if available < FIXED_HEADER_SIZE:
+                self._missing = FIXED_HEADER_SIZE - available
+                return
+            decoded = decode_length(buffer, self._start + 1)
+            if decoded is None:
+                self._missing = 1
+                return
+            length, length_bytes = decoded
+            body_start = self._start + 1 + length_bytes
+            body_end = body_start + length
+            if body_end > len(buffer):
+                self._missing = body_end - len(buffer)
+                return
+            first_byte = buffer[self._start]
+            body = bytes(buffer[body_start:body_end])
+            self._start = body_end
+            yield first_byte >> 4, first_byte & 0xF, body
@@ -9,22 +9,51 @@ Adapted for Home Assistant Elegoo Printer Integration.
 import asyncio
 import logging
 import struct
+import time
 from typing import Any
 
-from .const import MQTT_BROKER_HOST, MQTT_BROKER_PORT
+from .const import (
+    MQTT_BROKER_HOST,
+    MQTT_BROKER_PORT,
+    MQTT_CLIENT_QUEUE_SIZE,
+    MQTT_CONNACK,
+    MQTT_CONNECT,
+    MQTT_DISCONNECT,
+    MQTT_PINGREQ,
+    MQTT_PINGRESP,
+    MQTT_PUBACK,
+    MQTT_PUBLISH,
+    MQTT_RETRY_INTERVAL,
+    MQTT_SUBACK,
+    MQTT_SUBSCRIBE,
+    MQTT_TOPIC_MIN_PARTS,
+    MQTT_UNSUBACK,
+    MQTT_UNSUBSCRIBE,
+    OVERFLOW_DROP_OLDEST,
+    RETAINED_TOPIC_TYPES,
+    TOPIC_PREFIX,
+)
+from .framing import PUBLISH_RETAIN, PacketFramer, encode_packet
+from .session import ClientSession, InflightMessage
+from .topics import SubscriptionTrie, topic_matches
 
 _LOGGER = logging.getLogger(__name__)
 
-# MQTT Message Types
-MQTT_CONNECT = 1
-MQTT_CONNACK = 2
-MQTT_PUBLISH = 3
-MQTT_PUBACK = 4
-MQTT_SUBSCRIBE = 8
-MQTT_SUBACK = 9
-MQTT_PINGREQ = 12
-MQTT_PINGRESP = 13
-MQTT_DISCONNECT = 14
+# SUBACK return code for a rejected topic filter
+SUBACK_FAILURE = 0x80
+# Highest QoS granted to subscribers
+MAX_GRANTED_QOS = 1
+
+
+def _is_state_topic(topic: str) -> bool:
+    """Return whether a topic carries printer state the broker retains."""
+    # Printers publish both with and without a leading slash
+    parts = topic.removeprefix("/").split("/")
+    return (
+        len(parts) == MQTT_TOPIC_MIN_PARTS
+        and parts[0] == TOPIC_PREFIX
+        and parts[1] in RETAINED_TOPIC_TYPES
+    )
 
 
 class ElegooMQTTBroker:
@@ -43,7 +72,13 @@ class ElegooMQTTBroker:
     _lock: asyncio.Lock = asyncio.Lock()
 
     def __init__(
-        self, host: str = MQTT_BROKER_HOST, port: int = MQTT_BROKER_PORT
+        self,
+        host: str = MQTT_BROKER_HOST,
+        port: int = MQTT_BROKER_PORT,
+        *,
+        client_queue_size: int = MQTT_CLIENT_QUEUE_SIZE,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+        retry_interval: float = MQTT_RETRY_INTERVAL,
     ) -> None:
         """
         Initialize the MQTT broker.
@@ -51,18 +86,31 @@ class ElegooMQTTBroker:
         Args:
             host: Host address to bind to (default: 0.0.0.0 for all interfaces)
             port: Port to listen on (default: 18830)
+            client_queue_size: Packets queued per client before it overflows
+            overflow_policy: What to do when a client's queue is full,
+                OVERFLOW_DROP_OLDEST or OVERFLOW_DISCONNECT
+            retry_interval: Seconds before an unacknowledged QoS 1 publish
+                is resent
 
         """
         self.host = host
         self.port = port
         self.server = None
+        self.client_queue_size = client_queue_size
+        self.overflow_policy = overflow_policy
+        self.retry_interval = retry_interval
         self.incoming_messages: asyncio.Queue = asyncio.Queue()
-        self.outgoing_messages: asyncio.Queue = asyncio.Queue()
         self.connected_clients: dict[str, Any] = {}
-        # Global subscription registry: {topic: {writer: qos}}
-        self.subscriptions: dict[str, dict[Any, int]] = {}
-        self.subscriptions_lock: asyncio.Lock = asyncio.Lock()
-        self.next_pack_id_value = 1
+        # Global subscription registry: topic filters -> {session: qos}.
+        # Only changed and read synchronously, so it needs no lock.
+        self.subscriptions = SubscriptionTrie()
+        self.sessions: set[ClientSession] = set()
+        # Unacknowledged QoS 1 publishes of disconnected clients, by client ID
+        self._undelivered: dict[str, list[InflightMessage]] = {}
+        # Last retained message per topic, as (payload, qos)
+        self.retained: dict[str, tuple[str | bytes, int]] = {}
+        # Client that published each retained printer state topic
+        self._state_owners: dict[str, ClientSession] = {}
         self._running = False
 
     @classmethod
@@ -126,6 +174,8 @@ class ElegooMQTTBroker:
         self._running = False
         if self.server:
             self.server.close()
+            for session in list(self.sessions):
+                session.close()
             try:
                 # Use timeout to prevent hanging during shutdown
                 await asyncio.wait_for(self.server.wait_closed(), timeout=5.0)
@@ -140,23 +190,108 @@ class ElegooMQTTBroker:
         if self.server:
             await self.server.serve_forever()
 
-    def publish(self, topic: str, payload: str) -> None:
+    def publish(
+        self,
+        topic: str,
+        payload: str | bytes,
+        qos: int = 0,
+        *,
+        retain: bool = False,
+    ) -> None:
         """
-        Queue a message to be published to subscribed clients.
+        Queue a message for every client subscribed to its topic.
 
         Args:
             topic: MQTT topic to publish to
+            payload: Message payload, str payloads are sent UTF-8 encoded
+            qos: Quality of Service level, capped per subscriber at the QoS
+                it subscribed with
+            retain: Keep the message for future subscribers; an empty
+                payload clears the retained message
+
+        """
+        self._retain(topic, payload, qos, retain=retain)
+        self._forward(topic, payload, qos)
+
+    def _retain(
+        self,
+        topic: str,
+        payload: str | bytes,
+        qos: int,
+        *,
+        retain: bool,
+        sender: ClientSession | None = None,
+    ) -> None:
+        """
+        Store the message as the retained message of its topic, if it is one.
+
+        Printers never set the RETAIN flag, so status and attributes messages
+        are retained regardless. A new subscriber then sees the printer's last
+        known state without waiting for the next update. That state is only
+        kept while the printer that published it stays connected.
+        """
+        if retain:
+            self._state_owners.pop(topic, None)
+            if payload:
+                self.retained[topic] = (payload, qos)
+            else:
+                self.retained.pop(topic, None)
+        elif _is_state_topic(topic):
+            self.retained[topic] = (payload, qos)
+            if sender is not None:
+                self._state_owners[topic] = sender
+            else:
+                self._state_owners.pop(topic, None)
+
+    def _replay_retained(
+        self, session: ClientSession, filters: list[tuple[str, int]]
+    ) -> None:
+        """
+        Send a new subscriber the retained messages matching its filters.
+
+        Args:
+            session: The subscribing client
+            filters: The accepted (topic_filter, granted_qos) pairs
+
+        """
+        for topic, (payload, qos) in list(self.retained.items()):
+            granted = [
+                granted_qos
+                for topic_filter, granted_qos in filters
+                if topic_matches(topic_filter, topic)
+            ]
+            if granted:
+                session.publish(topic, payload, min(qos, max(granted)), retain=True)
+
+    def _forward(
+        self,
+        topic: str,
+        payload: str | bytes,
+        qos: int = 0,
+        sender: ClientSession | None = None,
+    ) -> None:
+        """
+        Queue a message for the subscribers of its topic.
+
+        Nothing is awaited, so a slow subscriber cannot hold up the publisher.
+
+        Args:
+            topic: MQTT topic of the message
             payload: Message payload
+            qos: QoS the message was published with
+            sender: The publishing client, which does not get its own message
 
         """
-        self.outgoing_messages.put_nowait({"topic": topic, "payload": payload})
+        for session, granted_qos in self.subscriptions.match(topic).items():
+            if session is not sender:
+                session.publish(topic, payload, min(qos, granted_qos))
 
-    async def next_published_message(self) -> dict[str, str]:
+    async def next_published_message(self) -> dict[str, str | bytes]:
         """
         Wait for and return the next published message from a client.
 
         Returns:
-            Dictionary with 'topic' and 'payload' keys
+            Dictionary with 'topic' and raw 'payload' bytes keys
 
         """
         return await self.incoming_messages.get()
@@ -177,7 +312,7 @@ class ElegooMQTTBroker:
         except Exception:
             _LOGGER.exception("Exception handling MQTT client")
 
-    async def _handle_client_inner(  # noqa: C901, PLR0912, PLR0915
+    async def _handle_client_inner(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
         """
@@ -190,274 +325,244 @@ class ElegooMQTTBroker:
         """
         addr = writer.get_extra_info("peername")
         _LOGGER.debug("MQTT client connected from %s", addr)
-        data = b""
+        framer = PacketFramer()
+        session = ClientSession(
+            writer,
+            addr,
+            queue_size=self.client_queue_size,
+            overflow_policy=self.overflow_policy,
+            retry_interval=self.retry_interval,
+            on_close=self._remove_session,
+        )
+        self.sessions.add(session)
 
-        subscribed_topics: dict[str, int] = {}
-        client_id: str | None = None
+        try:
+            while self._running and not session.closed:
+                # Ask for at least the rest of a partially received packet
+                data = await reader.read(framer.read_size)
+                if not data:  # Connection closed
+                    break
+                framer.feed(data)
 
-        read_future = asyncio.ensure_future(reader.read(1024))
-        outgoing_messages_future = asyncio.ensure_future(self.outgoing_messages.get())
+                for msg_type, msg_flags, message in framer.packets():
+                    if not self._handle_packet(session, msg_type, msg_flags, message):
+                        return
+        finally:
+            session.close()
+            await session.wait_closed()
 
-        while self._running:
-            completed, _pending = await asyncio.wait(
-                [read_future, outgoing_messages_future],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
+    def _handle_packet(
+        self, session: ClientSession, msg_type: int, msg_flags: int, message: bytes
+    ) -> bool:
+        """
+        Process one MQTT packet from a client.
 
-            # Handle outgoing messages to this client
-            if outgoing_messages_future in completed:
-                outmsg = outgoing_messages_future.result()
-                topic = outmsg["topic"]
-                payload = outmsg["payload"]
-
-                if topic in subscribed_topics:
-                    qos = subscribed_topics[topic]
-                    # Only include packet ID for QoS > 0
-                    packid = self._next_pack_id() if qos > 0 else 0
-                    flags = (qos << 1) & 0x06  # Set QoS bits in flags
-                    await self._send_msg(
-                        writer,
-                        MQTT_PUBLISH,
-                        flags=flags,
-                        payload=self._encode_publish(topic, payload, packid),
-                    )
-                else:
-                    _LOGGER.debug("MQTT SEND: Client not subscribed to %s", topic)
-                outgoing_messages_future = asyncio.ensure_future(
-                    self.outgoing_messages.get()
-                )
+        Args:
+            session: The client that sent the packet
+            msg_type: MQTT message type
+            msg_flags: Fixed header flags
+            message: Packet body after the fixed header
 
-            # Handle incoming data from client
-            if read_future in completed:
-                d = read_future.result()
-                if not d:  # Connection closed
-                    break
-                data += d
-                read_future = asyncio.ensure_future(reader.read(1024))
-            else:
-                continue
+        Returns:
+            False if the client has to be disconnected
 
-            # Process MQTT packets
-            while True:
-                if len(data) < 2:  # noqa: PLR2004
-                    break
+        """
+        addr = session.addr
+        if msg_type == MQTT_CONNECT:
+            if message[0:6] != b"\x00\x04MQTT":
+                _LOGGER.error("MQTT client %s: bad CONNECT", addr)
+                return False
+
+            client_id_len = struct.unpack("!H", message[10:12])[0]
+            session.client_id = message[12 : 12 + client_id_len].decode("utf-8")
+
+            _LOGGER.info("MQTT client %s at %s connected", session.client_id, addr)
+            self._take_over(session)
+            self.connected_clients[session.client_id] = addr
+            self._send_msg(session, MQTT_CONNACK, payload=b"\x00\x00")
+            self._redeliver(session)
+
+        elif msg_type == MQTT_PUBLISH:
+            qos = (msg_flags >> 1) & 0x3
+            topic, packid, content = self._parse_publish(message, qos)
+
+            _LOGGER.debug("MQTT received message on topic: %s", topic)
+            max_log_len = 500
+            payload_preview = (
+                content[:max_log_len] if len(content) > max_log_len else content
+            )
+            _LOGGER.debug("MQTT message payload: %s", payload_preview)
+            self.incoming_messages.put_nowait({"topic": topic, "payload": content})
+
+            self._retain(
+                topic,
+                content,
+                qos,
+                retain=bool(msg_flags & PUBLISH_RETAIN),
+                sender=session,
+            )
+            # Forward message to all subscribed clients
+            self._forward(topic, content, qos, sender=session)
 
-                msg_type = data[0] >> 4
-                msg_flags = data[0] & 0xF
-                msg_length, len_bytes_consumed = self._decode_length(data[1:])
+            if qos > 0:
+                self._send_msg(session, MQTT_PUBACK, packet_ident=packid)
 
-                # Check if we have the full packet
-                head_len = len_bytes_consumed + 1
-                if msg_length + head_len > len(data):
-                    break
+        elif msg_type == MQTT_PUBACK:
+            packid = struct.unpack("!H", message[0:2])[0]
+            if not session.acknowledge(packid):
+                _LOGGER.debug(
+                    "MQTT client %s acknowledged unknown packet %s", addr, packid
+                )
 
-                # Extract message payload and advance buffer
-                message = data[head_len : head_len + msg_length]
-                data = data[head_len + msg_length :]
+        elif msg_type == MQTT_SUBSCRIBE:
+            self._handle_subscribe(session, message)
 
-                # Process MQTT packet types
-                if msg_type == MQTT_CONNECT:
-                    if message[0:6] != b"\x00\x04MQTT":
-                        _LOGGER.error("MQTT client %s: bad CONNECT", addr)
-                        writer.close()
-                        return
+        elif msg_type == MQTT_UNSUBSCRIBE:
+            packid = message[0] << 8 | message[1]
+            for topic, _ in self._parse_subscribe(message[2:], has_qos=False):
+                self.subscriptions.unsubscribe(topic, session)
+                _LOGGER.info("MQTT client %s unsubscribed from '%s'", addr, topic)
+            self._send_msg(session, MQTT_UNSUBACK, packet_ident=packid)
 
-                    client_id_len = struct.unpack("!H", message[10:12])[0]
-                    client_id = message[12 : 12 + client_id_len].decode("utf-8")
-
-                    _LOGGER.info("MQTT client %s at %s connected", client_id, addr)
-                    self.connected_clients[client_id] = addr
-                    await self._send_msg(writer, MQTT_CONNACK, payload=b"\x00\x00")
-
-                elif msg_type == MQTT_PUBLISH:
-                    qos = (msg_flags >> 1) & 0x3
-                    topic, packid, content = self._parse_publish(message, qos)
-
-                    _LOGGER.debug("MQTT received message on topic: %s", topic)
-                    max_log_len = 500
-                    payload_preview = (
-                        content[:max_log_len] if len(content) > max_log_len else content
-                    )
-                    _LOGGER.debug("MQTT message payload: %s", payload_preview)
-                    self.incoming_messages.put_nowait(
-                        {"topic": topic, "payload": content}
-                    )
-
-                    # Forward message to all subscribed clients
-                    async with self.subscriptions_lock:
-                        if topic in self.subscriptions:
-                            for client_writer in self.subscriptions[topic]:
-                                # Don't send back to the publishing client
-                                if client_writer != writer:
-                                    try:
-                                        # Forward with QoS 0 (no packet ID needed)
-                                        await self._send_msg(
-                                            client_writer,
-                                            MQTT_PUBLISH,
-                                            flags=0,
-                                            payload=self._encode_publish(
-                                                topic, content, packid=0
-                                            ),
-                                        )
-                                    except Exception as e:  # noqa: BLE001
-                                        _LOGGER.debug(
-                                            "Failed to forward message to client: %s", e
-                                        )
-
-                    if qos > 0:
-                        await self._send_msg(writer, MQTT_PUBACK, packet_ident=packid)
-
-                elif msg_type == MQTT_SUBSCRIBE:
-                    qos = (msg_flags >> 1) & 0x3
-                    packid = message[0] << 8 | message[1]
-                    message = message[2:]
-                    topic = self._parse_subscribe(message)
-                    _LOGGER.info(
-                        "MQTT client %s subscribed to '%s' (QoS %s)", addr, topic, qos
-                    )
-                    subscribed_topics[topic] = qos
-
-                    # Add to global subscription registry
-                    async with self.subscriptions_lock:
-                        if topic not in self.subscriptions:
-                            self.subscriptions[topic] = {}
-                        self.subscriptions[topic][writer] = qos
-
-                    await self._send_msg(
-                        writer, MQTT_SUBACK, packet_ident=packid, payload=bytes([qos])
-                    )
-
-                elif msg_type == MQTT_PINGREQ:
-                    # Respond to keep-alive ping
-                    await self._send_msg(writer, MQTT_PINGRESP)
-
-                elif msg_type == MQTT_DISCONNECT:
-                    _LOGGER.info("MQTT client %s disconnected", addr)
-
-                    # Cancel pending futures to avoid "Task was destroyed" warnings
-                    if not read_future.done():
-                        read_future.cancel()
-                    if not outgoing_messages_future.done():
-                        outgoing_messages_future.cancel()
-
-                    writer.close()
-                    await writer.wait_closed()
-
-                    if client_id is not None:
-                        del self.connected_clients[client_id]
-
-                    # Remove from subscription registry
-                    async with self.subscriptions_lock:
-                        for topic in list(self.subscriptions.keys()):
-                            if writer in self.subscriptions[topic]:
-                                del self.subscriptions[topic][writer]
-                            if not self.subscriptions[topic]:
-                                del self.subscriptions[topic]
-                    return
-
-        # Cleanup on exit
-        # Cancel pending futures to avoid "Task was destroyed" warnings
-        if not read_future.done():
-            read_future.cancel()
-        if not outgoing_messages_future.done():
-            outgoing_messages_future.cancel()
-
-        writer.close()
-        await writer.wait_closed()
-        if client_id and client_id in self.connected_clients:
-            del self.connected_clients[client_id]
-
-        # Remove from subscription registry on unexpected disconnect
-        async with self.subscriptions_lock:
-            for topic in list(self.subscriptions.keys()):
-                if writer in self.subscriptions[topic]:
-                    del self.subscriptions[topic][writer]
-                if not self.subscriptions[topic]:
-                    del self.subscriptions[topic]
-
-    async def _send_msg(
-        self,
-        writer: asyncio.StreamWriter,
-        msg_type: int,
-        flags: int = 0,
-        packet_ident: int = 0,
-        payload: bytes = b"",
-    ) -> None:
-        """
-        Send an MQTT message to a client.
+        elif msg_type == MQTT_PINGREQ:
+            # Respond to keep-alive ping
+            self._send_msg(session, MQTT_PINGRESP)
 
-        Args:
-            writer: Stream writer to send to
-            msg_type: MQTT message type
-            flags: Message flags
-            packet_ident: Packet identifier
-            payload: Message payload
+        elif msg_type == MQTT_DISCONNECT:
+            _LOGGER.info("MQTT client %s disconnected", addr)
+            return False
 
-        """
-        head = bytes([msg_type << 4 | flags])
-        payload_length = len(payload)
-        if packet_ident > 0:
-            payload_length += 2
-        head += self._encode_length(payload_length)
-        if packet_ident > 0:
-            head += bytes([packet_ident >> 8, packet_ident & 0xFF])
-        data = head + payload
-        writer.write(data)
-        await writer.drain()
+        return True
 
-    def _encode_length(self, length: int) -> bytearray:
+    def _handle_subscribe(self, session: ClientSession, message: bytes) -> None:
         """
-        Encode message length per MQTT spec.
+        Subscribe a client to topic filters and send their retained messages.
 
         Args:
-            length: Length to encode
+            session: The subscribing client
+            message: SUBSCRIBE packet body
 
-        Returns:
-            Encoded length bytes
+        """
+        addr = session.addr
+        packid = message[0] << 8 | message[1]
+        granted = []
+        accepted = []
+
+        # Add to global subscription registry
+        for topic, requested_qos in self._parse_subscribe(message[2:]):
+            qos = min(requested_qos, MAX_GRANTED_QOS)
+            try:
+                self.subscriptions.subscribe(topic, session, qos)
+            except ValueError:
+                _LOGGER.warning(
+                    "MQTT client %s: invalid topic filter '%s'", addr, topic
+                )
+                granted.append(SUBACK_FAILURE)
+                continue
+            _LOGGER.info("MQTT client %s subscribed to '%s' (QoS %s)", addr, topic, qos)
+            granted.append(qos)
+            accepted.append((topic, qos))
+
+        self._send_msg(
+            session, MQTT_SUBACK, packet_ident=packid, payload=bytes(granted)
+        )
+        self._replay_retained(session, accepted)
+
+    def _remove_session(self, session: ClientSession) -> None:
+        """Forget a client once its connection is closing."""
+        self.sessions.discard(session)
+        # Remove from subscription registry
+        self.subscriptions.remove(session)
+        # A printer that went offline is not replayed as its last state
+        for topic, owner in list(self._state_owners.items()):
+            if owner is session:
+                del self._state_owners[topic]
+                self.retained.pop(topic, None)
+        if session.client_id is None:
+            return
+        if self.connected_clients.get(session.client_id) == session.addr:
+            del self.connected_clients[session.client_id]
+        # Keep unacknowledged publishes for a client that reconnects soon,
+        # such as a printer whose Wi-Fi dropped out
+        now = time.monotonic()
+        self._undelivered = {
+            client_id: messages
+            for client_id, messages in self._undelivered.items()
+            if not all(session.expired(message, now) for message in messages)
+        }
+        unacknowledged = [
+            message
+            for message in session.unacknowledged()
+            if not session.expired(message, now)
+        ]
+        if unacknowledged:
+            self._undelivered[session.client_id] = unacknowledged
+
+    def _take_over(self, session: ClientSession) -> None:
+        """Close an older connection that used the same client ID."""
+        for other in list(self.sessions):
+            if other is not session and other.client_id == session.client_id:
+                _LOGGER.info(
+                    "MQTT client %s reconnected, closing its old connection from %s",
+                    session.client_id,
+                    other.addr,
+                )
+                other.close()
 
+    def _redeliver(self, session: ClientSession) -> None:
         """
-        encoded = bytearray()
-        while True:
-            digit = length % 128
-            length //= 128
-            if length > 0:
-                digit |= 0x80
-            encoded.append(digit)
-            if length == 0:
-                break
-        return encoded
+        Resend the publishes a reconnecting client had not acknowledged.
 
-    def _decode_length(self, data: bytes) -> tuple[int, int]:
+        Publishes are kept until their delivery lifetime has passed whatever
+        the client's Clean Session flag, since printers reconnect with a clean
+        session after a dropped connection yet still expect their commands.
+        The lifetime ends before the sender stops waiting for a response, so
+        a command is never redelivered after its sender gave up on it.
+        """
+        if session.client_id is None:
+            return
+        now = time.monotonic()
+        messages = [
+            message
+            for message in self._undelivered.pop(session.client_id, [])
+            if not session.expired(message, now)
+        ]
+        if not messages:
+            return
+        _LOGGER.info(
+            "MQTT client %s: redelivering %d unacknowledged publishes",
+            session.client_id,
+            len(messages),
+        )
+        session.redeliver(messages)
+
+    def _send_msg(
+        self,
+        session: ClientSession,
+        msg_type: int,
+        flags: int = 0,
+        packet_ident: int = 0,
+        payload: bytes | list[bytes] = b"",
+    ) -> None:
         """
-        Decode message length per MQTT spec.
+        Queue an MQTT message for a client.
 
         Args:
-            data: Bytes containing encoded length
-
-        Returns:
-            Tuple of (decoded_length, bytes_consumed)
+            session: Client to send to
+            msg_type: MQTT message type
+            flags: Message flags
+            packet_ident: Packet identifier
+            payload: Message payload, as one buffer or several
 
         """
-        multiplier = 1
-        value = 0
-        bytes_read = 0
+        session.send(encode_packet(msg_type, flags, packet_ident, payload))
 
-        for byte in data:
-            bytes_read += 1
-            value += (byte & 0x7F) * multiplier
-            if byte & 0x80 == 0:
-                break
-            multiplier *= 128
-            if multiplier > 2097152:  # noqa: PLR2004
-                msg = "Malformed MQTT Remaining Length"
-                raise ValueError(msg)
-
-        return value, bytes_read
-
-    def _parse_publish(self, data: bytes, qos: int = 0) -> tuple[str, int, str]:
+    def _parse_publish(self, data: bytes, qos: int = 0) -> tuple[str, int, bytes]:
         """
         Parse MQTT PUBLISH message.
 
+        The payload is returned undecoded so it can be forwarded as-is.
+
         Args:
             data: Message data
             qos: Quality of Service level (0, 1, or 2)
@@ -472,62 +577,38 @@ class ElegooMQTTBroker:
         # QoS 0 messages don't have a packet ID
         if qos == 0:
             message_start = 2 + topic_len
-            message = data[message_start:].decode("utf-8")
-            return topic, 0, message
+            return topic, 0, data[message_start:]
 
         # QoS > 0 messages have a packet ID
         packid = struct.unpack("!H", data[2 + topic_len : 4 + topic_len])[0]
         message_start = 4 + topic_len
-        message = data[message_start:].decode("utf-8")
-        return topic, packid, message
-
-    def _parse_subscribe(self, data: bytes) -> str:
-        """
-        Parse MQTT SUBSCRIBE message.
-
-        Args:
-            data: Message data
-
-        Returns:
-            Topic string
-
-        """
-        topic_len = struct.unpack("!H", data[0:2])[0]
-        return data[2 : 2 + topic_len].decode("utf-8")
+        return topic, packid, data[message_start:]
 
-    def _encode_publish(self, topic: str, message: str, packid: int = 0) -> bytes:
+    def _parse_subscribe(
+        self, data: bytes, *, has_qos: bool = True
+    ) -> list[tuple[str, int]]:
         """
-        Encode MQTT PUBLISH message.
+        Parse the topic filters of an MQTT SUBSCRIBE or UNSUBSCRIBE message.
 
         Args:
-            topic: Topic name
-            message: Message content
-            packid: Packet identifier (0 for QoS 0)
-
-        Returns:
-            Encoded PUBLISH message bytes
-
-        """
-        topic_len = len(topic)
-        topic_bytes = topic.encode("utf-8")
-        message_bytes = message.encode("utf-8")
-
-        # For QoS 0, don't include packet ID
-        if packid == 0:
-            return struct.pack("!H", topic_len) + topic_bytes + message_bytes
-
-        # For QoS > 0, include packet ID
-        packid_bytes = struct.pack("!H", packid)
-        return struct.pack("!H", topic_len) + topic_bytes + packid_bytes + message_bytes
-
-    def _next_pack_id(self) -> int:
-        """
-        Get next packet identifier.
+            data: Message data after the packet identifier
+            has_qos: Whether each filter is followed by a requested QoS byte
+                (SUBSCRIBE) or not (UNSUBSCRIBE)
 
         Returns:
-            Packet ID
+            List of (topic_filter, requested_qos) tuples
 
         """
-        pack_id = self.next_pack_id_value
-        self.next_pack_id_value += 1
-        return pack_id
+        filters = []
+        offset = 0
+        while offset + 2 <= len(data):
+            topic_len = struct.unpack_from("!H", data, offset)[0]
+            offset += 2
+            topic = data[offset : offset + topic_len].decode("utf-8")
+            offset += topic_len
+            qos = 0
+            if has_qos and offset < len(data):
+                qos = data[offset] & 0x3
+                offset += 1
+            filters.append((topic, qos))
+        return filters
@@ -0,0 +1,329 @@
+"""
+Per-client send queues for the embedded MQTT broker.
+
+Every connected client gets a bounded queue of outgoing packets and one writer
+task that drains it. Publishing only enqueues, so a slow client never holds
+up the publisher or the other subscribers. When a client's queue is full the
+broker either drops the oldest queued packet or disconnects the client.
+
+QoS 1 publishes are also tracked per client: each gets a packet identifier and
+stays in flight until the client acknowledges it, and is resent with the DUP
+flag if no PUBACK arrives in time. Only a window of publishes is in flight at
+once; the rest wait in a bounded backlog. A publish that is still
+unacknowledged once its delivery lifetime has passed is given up on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    MQTT_CLIENT_QUEUE_SIZE,
+    MQTT_DELIVERY_LIFETIME,
+    MQTT_INFLIGHT_WINDOW,
+    MQTT_MAX_DELIVERY_ATTEMPTS,
+    MQTT_MAX_PACKET_ID,
+    MQTT_RETRY_INTERVAL,
+    OVERFLOW_DISCONNECT,
+    OVERFLOW_DROP_OLDEST,
+)
+from .framing import encode_publish
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class InflightMessage:
+    """A QoS 1 publish waiting to be acknowledged by the client."""
+
+    topic: str
+    payload: str | bytes
+    packet_id: int = 0
+    attempts: int = 0
+    sent_at: float = 0.0
+    retain: bool = False
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class ClientSession:
+    """One connected MQTT client and its outgoing packet queue."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        writer: asyncio.StreamWriter,
+        addr: Any = None,
+        *,
+        queue_size: int = MQTT_CLIENT_QUEUE_SIZE,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+        on_close: Callable[[ClientSession], None] | None = None,
+        inflight_window: int = MQTT_INFLIGHT_WINDOW,
+        retry_interval: float = MQTT_RETRY_INTERVAL,
+        max_attempts: int = MQTT_MAX_DELIVERY_ATTEMPTS,
+        lifetime: float = MQTT_DELIVERY_LIFETIME,
+    ) -> None:
+        """
+        Initialize the session and start its writer.
+
+        Args:
+            writer: Stream writer of the client connection
+            addr: Peer address, for logging
+            queue_size: Packets queued before the overflow policy applies
+            overflow_policy: OVERFLOW_DROP_OLDEST or OVERFLOW_DISCONNECT
+            on_close: Called once when the writer stops
+            inflight_window: Unacknowledged QoS 1 publishes at a time
+            retry_interval: Seconds before an unacknowledged publish is resent
+            max_attempts: Sends of one publish before it is given up on
+            lifetime: Seconds after it was queued that a publish is given up on
+
+        """
+        self.writer = writer
+        self.addr = addr
+        self.client_id: str | None = None
+        self.overflow_policy = overflow_policy
+        self.on_close = on_close
+        self.sent = 0
+        self.dropped = 0
+        self.closed = False
+        self.inflight_window = min(inflight_window, MQTT_MAX_PACKET_ID)
+        self.retry_interval = retry_interval
+        self.max_attempts = max_attempts
+        self.lifetime = lifetime
+        self.inflight: OrderedDict[int, InflightMessage] = OrderedDict()
+        self._backlog: deque[InflightMessage] = deque()
+        self._backlog_size = queue_size
+        self._last_packet_id = 0
+        # Set when the in-flight window goes from empty to non-empty
+        self._inflight_added = asyncio.Event()
+        self._queue: asyncio.Queue[list[bytes]] = asyncio.Queue(queue_size)
+        self._writer_task = asyncio.create_task(self._write_loop())
+        self._retry_task = asyncio.create_task(self._retry_loop())
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of packets waiting to be written."""
+        return self._queue.qsize()
+
+    def send(self, packet: list[bytes]) -> bool:
+        """
+        Queue a packet for the client without waiting for I/O.
+
+        Args:
+            packet: The packet buffers, as built by ``encode_packet``
+
+        Returns:
+            False if the client is closed or was disconnected for falling
+            behind.
+
+        """
+        if self.closed:
+            return False
+        if self._queue.full():
+            if self.overflow_policy == OVERFLOW_DISCONNECT:
+                _LOGGER.warning(
+                    "MQTT client %s is not keeping up, disconnecting", self.addr
+                )
+                self.close()
+                return False
+            self._queue.get_nowait()
+            self.dropped += 1
+            _LOGGER.debug(
+                "MQTT client %s is not keeping up, dropped a packet (%d dropped)",
+                self.addr,
+                self.dropped,
+            )
+        self._queue.put_nowait(packet)
+        return True
+
+    def publish(
+        self, topic: str, payload: str | bytes, qos: int = 0, *, retain: bool = False
+    ) -> bool:
+        """
+        Queue a PUBLISH for the client.
+
+        QoS 0 publishes are sent once. QoS 1 publishes are sent as soon as the
+        in-flight window has room and resent until the client acknowledges
+        them.
+
+        Args:
+            topic: Topic name
+            payload: Message payload
+            qos: Quality of Service level, 0 or 1
+            retain: Whether this is a retained message
+
+        Returns:
+            False if the client is closed.
+
+        """
+        if qos == 0:
+            return self.send(encode_publish(topic, payload, retain=retain))
+        return self.redeliver([InflightMessage(topic, payload, retain=retain)])
+
+    def redeliver(self, messages: list[InflightMessage]) -> bool:
+        """
+        Queue QoS 1 publishes, such as those left from an earlier connection.
+
+        Messages that were sent before are resent with the DUP flag.
+
+        Returns:
+            False if the client is closed.
+
+        """
+        if self.closed:
+            return False
+        for message in messages:
+            if len(self._backlog) >= self._backlog_size:
+                self._backlog.popleft()
+                self.dropped += 1
+                _LOGGER.debug(
+                    "MQTT client %s has too many unacknowledged publishes, "
+                    "dropped one (%d dropped)",
+                    self.addr,
+                    self.dropped,
+                )
+            self._backlog.append(message)
+        self._fill_window()
+        return not self.closed
+
+    def acknowledge(self, packet_id: int) -> bool:
+        """
+        Handle a PUBACK from the client.
+
+        Returns:
+            False if no publish with that packet identifier was in flight.
+
+        """
+        if self.inflight.pop(packet_id, None) is None:
+            return False
+        self._fill_window()
+        return True
+
+    def unacknowledged(self) -> list[InflightMessage]:
+        """Return the QoS 1 publishes not yet acknowledged, oldest first."""
+        return [*self.inflight.values(), *self._backlog]
+
+    def expired(self, message: InflightMessage, now: float) -> bool:
+        """Return whether a publish has outlived its delivery lifetime."""
+        return now - message.created_at >= self.lifetime
+
+    def _fill_window(self) -> None:
+        """Send backlogged publishes while the in-flight window has room."""
+        now = time.monotonic()
+        while self._backlog and len(self.inflight) < self.inflight_window:
+            message = self._backlog.popleft()
+            if self.expired(message, now):
+                self._give_up(message)
+                continue
+            message.packet_id = self._allocate_packet_id()
+            self.inflight[message.packet_id] = message
+            self._inflight_added.set()
+            self._transmit(message)
+
+    def _transmit(self, message: InflightMessage) -> None:
+        """Send an in-flight publish, marking it DUP if it was sent before."""
+        dup = message.attempts > 0
+        message.attempts += 1
+        message.sent_at = time.monotonic()
+        self.send(
+            encode_publish(
+                message.topic,
+                message.payload,
+                1,
+                message.packet_id,
+                dup=dup,
+                retain=message.retain,
+            )
+        )
+
+    def _give_up(self, message: InflightMessage) -> None:
+        """Count a publish that was never acknowledged."""
+        self.dropped += 1
+        _LOGGER.warning(
+            "MQTT client %s did not acknowledge '%s' after %d attempts",
+            self.addr,
+            message.topic,
+            message.attempts,
+        )
+
+    def _allocate_packet_id(self) -> int:
+        """Return the next packet identifier not in flight, wrapping to 1."""
+        while True:
+            self._last_packet_id = self._last_packet_id % MQTT_MAX_PACKET_ID + 1
+            if self._last_packet_id not in self.inflight:
+                return self._last_packet_id
+
+    def close(self) -> None:
+        """Stop writing and close the connection."""
+        if self.closed:
+            return
+        self.closed = True
+        self._writer_task.cancel()
+        self._retry_task.cancel()
+        self.writer.close()
+        if self.on_close is not None:
+            self.on_close(self)
+
+    async def wait_closed(self) -> None:
+        """Wait for the writer task and the connection to finish."""
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._writer_task
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._retry_task
+        with contextlib.suppress(ConnectionError, OSError):
+            await self.writer.wait_closed()
+
+    async def _write_loop(self) -> None:
+        """Write queued packets to the client in order."""
+        try:
+            while True:
+                packet = await self._queue.get()
+                self.writer.writelines(packet)
+                # Batch whatever else is queued before waiting on the socket
+                while not self._queue.empty():
+                    self.writer.writelines(self._queue.get_nowait())
+                    self.sent += 1
+                await self.writer.drain()
+                self.sent += 1
+        except (ConnectionError, OSError) as e:
+            _LOGGER.debug("MQTT client %s write failed: %s", self.addr, e)
+            self.close()
+
+    async def _retry_loop(self) -> None:
+        """Resend in-flight publishes the client has not acknowledged in time."""
+        while True:
+            now = time.monotonic()
+            delay = self.retry_interval
+            expired = False
+            for packet_id, message in list(self.inflight.items()):
+                deadline = message.created_at + self.lifetime
+                due = min(message.sent_at + self.retry_interval, deadline)
+                if due > now:
+                    delay = min(delay, due - now)
+                    continue
+                if self.expired(message, now) or message.attempts >= self.max_attempts:
+                    del self.inflight[packet_id]
+                    self._give_up(message)
+                    expired = True
+                    continue
+                _LOGGER.debug(
+                    "MQTT client %s: resending packet %d on '%s'",
+                    self.addr,
+                    packet_id,
+                    message.topic,
+                )
+                self._transmit(message)
+            if expired:
+                self._fill_window()
+            if self.inflight:
+                await asyncio.sleep(delay)
+            else:
+                self._inflight_added.clear()
+                await self._inflight_added.wait()
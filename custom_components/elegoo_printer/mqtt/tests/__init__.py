@@ -0,0 +1 @@
+"""Tests for the embedded MQTT broker."""
@@ -0,0 +1,133 @@
+"""Tests for MQTT packet framing."""
+
+import asyncio
+import struct
+
+import pytest
+
+from custom_components.elegoo_printer.mqtt.framing import (
+    MIN_READ_SIZE,
+    PacketFramer,
+    decode_length,
+    encode_length,
+    encode_packet,
+)
+from custom_components.elegoo_printer.mqtt.server import (
+    MQTT_CONNACK,
+    MQTT_PUBLISH,
+    ElegooMQTTBroker,
+)
+
+
+def _publish(topic: str, payload: bytes) -> bytes:
+    topic_bytes = topic.encode()
+    return b"".join(
+        encode_packet(
+            MQTT_PUBLISH,
+            payload=[struct.pack("!H", len(topic_bytes)) + topic_bytes, payload],
+        )
+    )
+
+
+def _connect(client_id: str) -> bytes:
+    body = b"\x00\x04MQTT\x04\x02\x00\x3c"
+    body += struct.pack("!H", len(client_id)) + client_id.encode()
+    return b"".join(encode_packet(1, payload=body))
+
+
+@pytest.mark.parametrize("length", [0, 127, 128, 16_383, 16_384, 2_097_152])
+def test_length_round_trip(length: int) -> None:
+    """Remaining Lengths decode to what was encoded."""
+    encoded = encode_length(length)
+
+    assert decode_length(b"\x30" + encoded, 1) == (length, len(encoded))
+
+
+def test_truncated_and_malformed_length() -> None:
+    """A partial length asks for more data; a five-byte length is rejected."""
+    assert decode_length(b"\x30\xff", 1) is None
+    with pytest.raises(ValueError, match="Remaining Length"):
+        decode_length(b"\x30\xff\xff\xff\xff\x01", 1)
+
+
+def test_encode_packet_keeps_payload_buffers() -> None:
+    """The payload is passed through without being copied into the header."""
+    payload = b"x" * 200
+
+    parts = encode_packet(MQTT_PUBLISH, 2, 7, [b"head", payload])
+
+    assert parts[0] == b"\x32" + encode_length(206) + b"\x00\x07"
+    assert parts[2] is payload
+
+
+def test_encode_packet_leaves_out_empty_payload() -> None:
+    """Packets without a payload are written as their header alone."""
+    assert encode_packet(13) == [b"\xd0\x00"]
+
+
+class TestPacketFramer:
+    """The framer splits a byte stream into packets."""
+
+    def test_packets_split_across_reads(self) -> None:
+        """Packets arriving a byte at a time are framed once complete."""
+        stream = _publish("a/b", b"one") + _publish("a/b", b"two" * 100)
+        framer = PacketFramer()
+
+        packets = []
+        for i in range(len(stream)):
+            framer.feed(stream[i : i + 1])
+            packets.extend(framer.packets())
+
+        assert [body[-3:] for _, _, body in packets] == [b"one", b"two"]
+        assert all(msg_type == MQTT_PUBLISH for msg_type, _, _ in packets)
+        assert framer.buffered == 0
+
+    def test_many_packets_in_one_read(self) -> None:
+        """Every complete packet in a read is framed, the rest is kept."""
+        stream = b"".join(_publish("t", bytes([i])) for i in range(50))
+        framer = PacketFramer()
+
+        framer.feed(stream + b"\x30")
+
+        assert len(list(framer.packets())) == 50
+        assert framer.buffered == 1
+
+    def test_read_size_covers_rest_of_large_packet(self) -> None:
+        """The read size hint asks for the remainder of a partial packet."""
+        packet = _publish("t", b"x" * 100_000)
+        framer = PacketFramer()
+
+        framer.feed(packet[:1000])
+
+        assert list(framer.packets()) == []
+        assert framer.read_size == len(packet) - 1000
+        framer.feed(packet[1000:])
+        assert len(list(framer.packets())) == 1
+        assert framer.read_size == MIN_READ_SIZE
+
+
+def test_broker_frames_large_publish() -> None:
+    """The broker receives a large PUBLISH written in small pieces."""
+
+    async def _run() -> None:
+        broker = ElegooMQTTBroker("127.0.0.1", 0)
+        await broker.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", broker.port)
+            writer.write(_connect("printer"))
+            connack = await reader.readexactly(4)
+            assert connack[0] >> 4 == MQTT_CONNACK
+
+            payload = b'{"Status": "' + b"x" * 300_000 + b'"}'
+            packet = _publish("sdcp/status/abc", payload)
+            for i in range(0, len(packet), 1500):
+                writer.write(packet[i : i + 1500])
+                await writer.drain()
+
+            message = await asyncio.wait_for(broker.next_published_message(), 1)
+            assert message == {"topic": "sdcp/status/abc", "payload": payload}
+            writer.close()
+        finally:
+            await broker.stop()
+
+    asyncio.run(_run())
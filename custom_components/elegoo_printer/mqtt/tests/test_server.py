@@ -0,0 +1,366 @@
+"""Tests for the embedded MQTT broker."""
+
+import asyncio
+import struct
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from custom_components.elegoo_printer.mqtt.framing import (
+    PUBLISH_DUP,
+    PUBLISH_RETAIN,
+    PacketFramer,
+    encode_packet,
+)
+from custom_components.elegoo_printer.mqtt.server import (
+    MQTT_CONNACK,
+    MQTT_CONNECT,
+    MQTT_PUBACK,
+    MQTT_PUBLISH,
+    MQTT_SUBACK,
+    MQTT_SUBSCRIBE,
+    MQTT_UNSUBACK,
+    MQTT_UNSUBSCRIBE,
+    SUBACK_FAILURE,
+    ElegooMQTTBroker,
+)
+
+
+def _string(value: str) -> bytes:
+    encoded = value.encode()
+    return struct.pack("!H", len(encoded)) + encoded
+
+
+class _Client:
+    """Minimal MQTT client speaking raw packets to the broker."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.framer = PacketFramer()
+        self.packets: list[tuple[int, int, bytes]] = []
+
+    async def send(self, msg_type: int, flags: int = 0, payload: bytes = b"") -> None:
+        self.writer.writelines(encode_packet(msg_type, flags, payload=payload))
+        await self.writer.drain()
+
+    async def receive(self) -> tuple[int, int, bytes]:
+        while not self.packets:
+            data = await asyncio.wait_for(self.reader.read(65536), 1.0)
+            assert data, "connection closed"
+            self.framer.feed(data)
+            self.packets.extend(self.framer.packets())
+        return self.packets.pop(0)
+
+    async def publish(self, topic: str, payload: bytes, packid: int = 0) -> None:
+        if packid:
+            await self.send(
+                MQTT_PUBLISH, 0x2, _string(topic) + struct.pack("!H", packid) + payload
+            )
+        else:
+            await self.send(MQTT_PUBLISH, payload=_string(topic) + payload)
+
+    async def subscribe(self, *filters: tuple[str, int], packid: int = 1) -> bytes:
+        body = struct.pack("!H", packid)
+        for topic_filter, qos in filters:
+            body += _string(topic_filter) + bytes([qos])
+        await self.send(MQTT_SUBSCRIBE, 0x2, body)
+        msg_type, _, suback = await self.receive()
+        assert msg_type == MQTT_SUBACK
+        assert suback[:2] == struct.pack("!H", packid)
+        return suback[2:]
+
+    async def receive_publish(self) -> tuple[str, bytes]:
+        msg_type, flags, body = await self.receive()
+        assert msg_type == MQTT_PUBLISH
+        topic_len = struct.unpack("!H", body[:2])[0]
+        offset = 2 + topic_len + (2 if flags & 0x6 else 0)
+        return body[2 : 2 + topic_len].decode(), body[offset:]
+
+    async def receive_qos1(self) -> tuple[int, bool, bytes]:
+        """Return the packet id, DUP flag and payload of a QoS 1 PUBLISH."""
+        msg_type, flags, body = await self.receive()
+        assert (msg_type, flags & 0x6) == (MQTT_PUBLISH, 0x2)
+        topic_len = struct.unpack("!H", body[:2])[0]
+        packid = struct.unpack("!H", body[2 + topic_len : 4 + topic_len])[0]
+        return packid, bool(flags & PUBLISH_DUP), body[4 + topic_len :]
+
+
+class _Harness:
+    """A broker on a free port and the clients connected to it."""
+
+    def __init__(self, **kwargs: object) -> None:
+        self.broker = ElegooMQTTBroker("127.0.0.1", 0, **kwargs)
+        self.clients: list[_Client] = []
+
+    async def connect(self, client_id: str) -> _Client:
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.broker.port)
+        client = _Client(reader, writer)
+        self.clients.append(client)
+        await client.send(
+            MQTT_CONNECT, payload=b"\x00\x04MQTT\x04\x02\x00\x3c" + _string(client_id)
+        )
+        msg_type, _, _ = await client.receive()
+        assert msg_type == MQTT_CONNACK
+        return client
+
+
+@asynccontextmanager
+async def _broker(**kwargs: object) -> AsyncIterator[_Harness]:
+    harness = _Harness(**kwargs)
+    await harness.broker.start()
+    try:
+        yield harness
+    finally:
+        for client in harness.clients:
+            client.writer.close()
+        await harness.broker.stop()
+
+
+class TestSubscriptions:
+    """Subscribers receive publishes matching any of their filters."""
+
+    def test_wildcards_and_multiple_filters(self) -> None:
+        """One SUBSCRIBE can carry several filters, including wildcards."""
+
+        async def _run() -> None:
+            async with _broker() as harness:
+                mirror = await harness.connect("mirror")
+                printer = await harness.connect("printer")
+
+                granted = await mirror.subscribe(
+                    ("sdcp/status/+", 0), ("sdcp/response/#", 1), ("bad/#/x", 0)
+                )
+                assert granted == bytes([0, 1, SUBACK_FAILURE])
+
+                await printer.publish("sdcp/status/abc", b"status")
+                await printer.publish("sdcp/notice/abc", b"notice")
+                await printer.publish("sdcp/response/abc", b"response")
+
+                assert await mirror.receive_publish() == ("sdcp/status/abc", b"status")
+                assert await mirror.receive_publish() == (
+                    "sdcp/response/abc",
+                    b"response",
+                )
+
+        asyncio.run(_run())
+
+    def test_unsubscribe(self) -> None:
+        """A client stops receiving a topic after unsubscribing."""
+
+        async def _run() -> None:
+            async with _broker() as harness:
+                mirror = await harness.connect("mirror")
+                printer = await harness.connect("printer")
+                await mirror.subscribe(("sdcp/#", 0))
+
+                await mirror.send(
+                    MQTT_UNSUBSCRIBE, 0x2, struct.pack("!H", 2) + _string("sdcp/#")
+                )
+                msg_type, _, body = await mirror.receive()
+                assert (msg_type, body) == (MQTT_UNSUBACK, struct.pack("!H", 2))
+
+                await printer.publish("sdcp/status/abc", b"status")
+                await asyncio.sleep(0.05)
+                assert harness.broker.subscriptions.match("sdcp/status/abc") == {}
+                assert not mirror.packets
+
+        asyncio.run(_run())
+
+
+class TestForwarding:
+    """Publishes are queued per subscriber instead of awaited in turn."""
+
+    def test_stalled_subscriber_does_not_block_others(self) -> None:
+        """A subscriber that stops reading does not delay anyone else."""
+
+        async def _run() -> None:
+            async with _broker() as harness:
+                stalled = await harness.connect("stalled")
+                healthy = await harness.connect("healthy")
+                printer = await harness.connect("printer")
+                await stalled.subscribe(("sdcp/#", 0))
+                await healthy.subscribe(("sdcp/#", 0))
+
+                stalled_session = next(
+                    session
+                    for session in harness.broker.sessions
+                    if session.client_id == "stalled"
+                )
+                stalled_session.writer.drain = asyncio.Event().wait
+                stalled_session.send([b"\xd0\x00"])
+
+                for i in range(5):
+                    await printer.publish("sdcp/status/abc", bytes([i]))
+                received = [(await healthy.receive_publish())[1] for _ in range(5)]
+
+                assert received == [bytes([i]) for i in range(5)]
+                assert stalled_session.queue_depth == 5
+
+        asyncio.run(_run())
+
+    def test_many_publishers_and_subscribers(self) -> None:
+        """Every subscriber gets every message, in order per publisher."""
+        publishers, subscribers, messages = 8, 8, 50
+
+        async def _run() -> None:
+            async with _broker(client_queue_size=publishers * messages) as harness:
+                subs = [await harness.connect(f"sub-{i}") for i in range(subscribers)]
+                for sub in subs:
+                    await sub.subscribe(("sdcp/status/+", 0))
+                pubs = [await harness.connect(f"pub-{i}") for i in range(publishers)]
+
+                async def _publish(index: int, pub: _Client) -> None:
+                    for seq in range(messages):
+                        await pub.publish(
+                            f"sdcp/status/{index}", f"{index}:{seq}".encode()
+                        )
+                        if seq % 10 == 0:
+                            await asyncio.sleep(0)
+
+                async def _collect(sub: _Client) -> list[tuple[str, bytes]]:
+                    return [
+                        await sub.receive_publish()
+                        for _ in range(publishers * messages)
+                    ]
+
+                results = await asyncio.gather(
+                    *(_collect(sub) for sub in subs),
+                    *(_publish(i, pub) for i, pub in enumerate(pubs)),
+                )
+
+                for received in results[:subscribers]:
+                    for index in range(publishers):
+                        sequence = [
+                            payload
+                            for topic, payload in received
+                            if topic == f"sdcp/status/{index}"
+                        ]
+                        assert sequence == [
+                            f"{index}:{seq}".encode() for seq in range(messages)
+                        ]
+
+        asyncio.run(_run())
+
+
+class TestQos1:
+    """QoS 1 publishes are resent until the subscriber acknowledges them."""
+
+    def test_resent_until_acknowledged(self) -> None:
+        """A QoS 1 command is resent with DUP until the printer sends PUBACK."""
+
+        async def _run() -> None:
+            async with _broker(retry_interval=0.05) as harness:
+                printer = await harness.connect("printer")
+                home = await harness.connect("home")
+                await printer.subscribe(("/sdcp/request/abc", 1))
+                session = next(
+                    s for s in harness.broker.sessions if s.client_id == "printer"
+                )
+
+                await home.publish("/sdcp/request/abc", b"cmd", packid=7)
+                msg_type, _, body = await home.receive()
+                assert (msg_type, body) == (MQTT_PUBACK, struct.pack("!H", 7))
+
+                packid, dup, payload = await printer.receive_qos1()
+                assert (dup, payload) == (False, b"cmd")
+                assert await printer.receive_qos1() == (packid, True, b"cmd")
+
+                await printer.send(MQTT_PUBACK, payload=struct.pack("!H", packid))
+                await asyncio.sleep(0.15)
+                assert not session.inflight
+
+        asyncio.run(_run())
+
+    def test_redelivered_after_reconnect(self) -> None:
+        """A printer reconnecting with its client ID gets missed commands."""
+
+        async def _run() -> None:
+            async with _broker() as harness:
+                printer = await harness.connect("printer")
+                await printer.subscribe(("/sdcp/request/abc", 1))
+                harness.broker.publish("/sdcp/request/abc", b"cmd", qos=1)
+                _, dup, _ = await printer.receive_qos1()
+                assert not dup
+
+                # The Wi-Fi drops out; the printer reconnects with the same ID
+                printer.writer.close()
+                reconnected = await harness.connect("printer")
+
+                _, dup, payload = await reconnected.receive_qos1()
+                assert (dup, payload) == (True, b"cmd")
+
+        asyncio.run(_run())
+
+
+class TestRetained:
+    """New subscribers get the last known printer state straight away."""
+
+    def test_status_and_attributes_are_replayed(self) -> None:
+        """The latest status and attributes are sent on subscribe, flagged RETAIN."""
+
+        async def _run() -> None:
+            async with _broker() as harness:
+                printer = await harness.connect("printer")
+                for payload in (b"old", b"new"):
+                    await printer.publish("/sdcp/status/abc", payload)
+                await printer.publish("/sdcp/attributes/abc", b"attrs")
+                await printer.publish("/sdcp/notice/abc", b"notice")
+                await asyncio.sleep(0.05)
+
+                home = await harness.connect("home")
+                await home.subscribe(("/sdcp/+/abc", 0))
+                replayed = {}
+                for _ in range(2):
+                    _, flags, body = await home.receive()
+                    assert flags & PUBLISH_RETAIN
+                    topic_len = struct.unpack("!H", body[:2])[0]
+                    replayed[body[2 : 2 + topic_len].decode()] = body[2 + topic_len :]
+
+                assert replayed == {
+                    "/sdcp/status/abc": b"new",
+                    "/sdcp/attributes/abc": b"attrs",
+                }
+
+                # Live messages are forwarded without the RETAIN flag
+                await printer.publish("/sdcp/status/abc", b"live")
+                _, flags, _ = await home.receive()
+                assert not flags & PUBLISH_RETAIN
+
+        asyncio.run(_run())
+
+    def test_empty_retained_publish_clears(self) -> None:
+        """An empty PUBLISH with RETAIN set removes the retained message."""
+
+        async def _run() -> None:
+            async with _broker() as harness:
+                printer = await harness.connect("printer")
+                await printer.publish("/sdcp/status/abc", b"status")
+                await printer.send(
+                    MQTT_PUBLISH, PUBLISH_RETAIN, _string("/sdcp/status/abc")
+                )
+                await asyncio.sleep(0.05)
+
+                assert harness.broker.retained == {}
+
+        asyncio.run(_run())
+
+    def test_state_is_dropped_when_printer_disconnects(self) -> None:
+        """A printer's retained state goes once its connection closes."""
+
+        async def _run() -> None:
+            async with _broker() as harness:
+                printer = await harness.connect("printer")
+                other = await harness.connect("other_printer")
+                await printer.publish("/sdcp/status/abc", b"status")
+                await printer.publish("/sdcp/attributes/abc", b"attrs")
+                await other.publish("/sdcp/status/def", b"other")
+                await asyncio.sleep(0.05)
+
+                printer.writer.close()
+                await asyncio.sleep(0.05)
+
+                assert harness.broker.retained == {"/sdcp/status/def": (b"other", 0)}
+
+        asyncio.run(_run())
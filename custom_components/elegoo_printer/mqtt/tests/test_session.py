@@ -0,0 +1,282 @@
+"""Tests for the embedded broker's per-client send queues."""
+
+import asyncio
+import struct
+import time
+from unittest.mock import Mock
+
+from custom_components.elegoo_printer.mqtt.const import (
+    MQTT_COMMAND_TIMEOUT,
+    MQTT_DELIVERY_LIFETIME,
+    MQTT_MAX_DELIVERY_ATTEMPTS,
+    MQTT_MAX_PACKET_ID,
+    MQTT_RETRY_INTERVAL,
+    OVERFLOW_DISCONNECT,
+    OVERFLOW_DROP_OLDEST,
+)
+from custom_components.elegoo_printer.mqtt.framing import PUBLISH_DUP, PacketFramer
+from custom_components.elegoo_printer.mqtt.session import (
+    ClientSession,
+    InflightMessage,
+)
+
+
+class _StalledWriter:
+    """Stream writer whose drain blocks until ``accept`` is set."""
+
+    def __init__(self) -> None:
+        self.written: list[bytes] = []
+        self.accept = asyncio.Event()
+        self.closed = False
+
+    def writelines(self, parts: list[bytes]) -> None:
+        self.written.append(b"".join(parts))
+
+    async def drain(self) -> None:
+        await self.accept.wait()
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        return
+
+
+async def _drain() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def _publishes(writer: _StalledWriter) -> list[tuple[int, int, bytes]]:
+    """Return (packet_id, flags, payload) of every QoS 1 PUBLISH written."""
+    framer = PacketFramer()
+    framer.feed(b"".join(writer.written))
+    publishes = []
+    for _, flags, body in framer.packets():
+        topic_len = struct.unpack("!H", body[:2])[0]
+        packet_id = struct.unpack("!H", body[2 + topic_len : 4 + topic_len])[0]
+        publishes.append((packet_id, flags, body[4 + topic_len :]))
+    return publishes
+
+
+class TestClientSession:
+    """Packets are queued per client and written by its own task."""
+
+    def test_send_does_not_wait_for_the_socket(self) -> None:
+        """Queued packets are written in order once the socket drains."""
+
+        async def _run() -> None:
+            writer = _StalledWriter()
+            session = ClientSession(writer)
+
+            assert session.send([b"\x00"])
+            await _drain()
+            for i in (1, 2):
+                assert session.send([bytes([i])])
+            await _drain()
+            assert writer.written == [b"\x00"]
+            assert session.queue_depth == 2
+
+            writer.accept.set()
+            await _drain()
+            assert writer.written == [b"\x00", b"\x01", b"\x02"]
+            assert session.sent == 3
+            session.close()
+            await session.wait_closed()
+
+        asyncio.run(_run())
+
+    def test_full_queue_drops_oldest(self) -> None:
+        """The drop-oldest policy keeps the newest packets."""
+
+        async def _run() -> None:
+            writer = _StalledWriter()
+            session = ClientSession(
+                writer, queue_size=2, overflow_policy=OVERFLOW_DROP_OLDEST
+            )
+            session.send([b"in flight"])
+            await _drain()
+
+            for payload in (b"a", b"b", b"c"):
+                assert session.send([payload])
+
+            assert session.dropped == 1
+            writer.accept.set()
+            await _drain()
+            assert writer.written == [b"in flight", b"b", b"c"]
+            session.close()
+            await session.wait_closed()
+
+        asyncio.run(_run())
+
+    def test_full_queue_disconnects(self) -> None:
+        """The disconnect policy closes a client that falls behind."""
+
+        async def _run() -> None:
+            writer = _StalledWriter()
+            on_close = Mock()
+            session = ClientSession(
+                writer,
+                queue_size=1,
+                overflow_policy=OVERFLOW_DISCONNECT,
+                on_close=on_close,
+            )
+            session.send([b"in flight"])
+            await _drain()
+
+            assert session.send([b"queued"])
+            assert not session.send([b"overflow"])
+
+            assert session.closed
+            assert writer.closed
+            on_close.assert_called_once_with(session)
+            await session.wait_closed()
+
+        asyncio.run(_run())
+
+
+class TestQos1Delivery:
+    """QoS 1 publishes stay in flight until acknowledged."""
+
+    def test_window_and_acknowledge(self) -> None:
+        """Publishes beyond the window wait until earlier ones are acknowledged."""
+
+        async def _run() -> None:
+            writer = _StalledWriter()
+            writer.accept.set()
+            session = ClientSession(writer, inflight_window=2)
+
+            for payload in (b"a", b"b", b"c"):
+                assert session.publish("sdcp/request/abc", payload, qos=1)
+            await _drain()
+            assert [(pid, p) for pid, _, p in _publishes(writer)] == [
+                (1, b"a"),
+                (2, b"b"),
+            ]
+            assert list(session.inflight) == [1, 2]
+
+            assert session.acknowledge(1)
+            assert not session.acknowledge(1)
+            await _drain()
+            assert [(pid, p) for pid, _, p in _publishes(writer)][-1] == (3, b"c")
+            assert [m.payload for m in session.unacknowledged()] == [b"b", b"c"]
+            session.close()
+            await session.wait_closed()
+
+        asyncio.run(_run())
+
+    def test_packet_ids_wrap_and_skip_inflight(self) -> None:
+        """Packet identifiers wrap to 1 and never reuse one still in flight."""
+
+        async def _run() -> None:
+            writer = _StalledWriter()
+            writer.accept.set()
+            session = ClientSession(writer)
+            session._last_packet_id = MQTT_MAX_PACKET_ID - 1
+
+            session.publish("t", b"a", qos=1)
+            session.publish("t", b"b", qos=1)
+            session._last_packet_id = MQTT_MAX_PACKET_ID - 1
+            session.acknowledge(MQTT_MAX_PACKET_ID)
+            session.publish("t", b"c", qos=1)
+
+            assert list(session.inflight) == [1, MQTT_MAX_PACKET_ID]
+            assert session.inflight[MQTT_MAX_PACKET_ID].payload == b"c"
+            session.close()
+            await session.wait_closed()
+
+        asyncio.run(_run())
+
+    def test_unacknowledged_publish_is_resent_then_dropped(self) -> None:
+        """A publish is resent with DUP until the attempts run out."""
+
+        async def _run() -> None:
+            writer = _StalledWriter()
+            writer.accept.set()
+            session = ClientSession(writer, retry_interval=0.01, max_attempts=3)
+
+            session.publish("sdcp/request/abc", b"cmd", qos=1)
+            await asyncio.sleep(0.1)
+
+            publishes = _publishes(writer)
+            assert [(pid, p) for pid, _, p in publishes] == [(1, b"cmd")] * 3
+            assert [flags & PUBLISH_DUP for _, flags, _ in publishes] == [
+                0,
+                PUBLISH_DUP,
+                PUBLISH_DUP,
+            ]
+            assert not session.inflight
+            assert session.dropped == 1
+            session.close()
+            await session.wait_closed()
+
+        asyncio.run(_run())
+
+    def test_publish_is_given_up_after_its_lifetime(self) -> None:
+        """A publish is no longer resent once its lifetime has passed."""
+
+        async def _run() -> None:
+            writer = _StalledWriter()
+            writer.accept.set()
+            session = ClientSession(
+                writer, retry_interval=0.01, max_attempts=100, lifetime=0.05
+            )
+
+            session.publish("sdcp/request/abc", b"cmd", qos=1)
+            await asyncio.sleep(0.1)
+            sent = len(_publishes(writer))
+            await asyncio.sleep(0.05)
+
+            assert 1 < sent < 100
+            assert len(_publishes(writer)) == sent
+            assert not session.inflight
+            assert session.dropped == 1
+            session.close()
+            await session.wait_closed()
+
+        asyncio.run(_run())
+
+    def test_expired_publishes_are_not_redelivered(self) -> None:
+        """Publishes older than their lifetime are dropped, not sent."""
+
+        async def _run() -> None:
+            writer = _StalledWriter()
+            writer.accept.set()
+            session = ClientSession(writer)
+
+            stale = InflightMessage(
+                "t", b"old", attempts=1, created_at=time.monotonic() - 60
+            )
+            session.redeliver([stale, InflightMessage("t", b"new")])
+            await _drain()
+
+            assert [payload for _, _, payload in _publishes(writer)] == [b"new"]
+            assert session.dropped == 1
+            session.close()
+            await session.wait_closed()
+
+        asyncio.run(_run())
+
+    def test_delivery_ends_before_the_sender_gives_up(self) -> None:
+        """Resends and redelivery stop before a command's caller times out."""
+        assert MQTT_DELIVERY_LIFETIME < MQTT_COMMAND_TIMEOUT
+        assert (
+            MQTT_MAX_DELIVERY_ATTEMPTS - 1
+        ) * MQTT_RETRY_INTERVAL < MQTT_DELIVERY_LIFETIME
+
+    def test_redelivered_messages_are_marked_dup(self) -> None:
+        """Publishes carried over from an earlier connection are sent as DUP."""
+
+        async def _run() -> None:
+            writer = _StalledWriter()
+            writer.accept.set()
+            session = ClientSession(writer)
+
+            session.redeliver([InflightMessage("t", b"cmd", packet_id=9, attempts=1)])
+            await _drain()
+
+            assert _publishes(writer) == [(1, 0x02 | PUBLISH_DUP, b"cmd")]
+            session.close()
+            await session.wait_closed()
+
+        asyncio.run(_run())
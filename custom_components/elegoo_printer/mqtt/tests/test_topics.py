@@ -0,0 +1,71 @@
+"""Tests for MQTT topic filter matching."""
+
+import pytest
+
+from custom_components.elegoo_printer.mqtt.topics import (
+    SubscriptionTrie,
+    topic_matches,
+    validate_filter,
+)
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("sdcp/status/abc", "sdcp/status/abc", True),
+        ("sdcp/status/abc", "sdcp/status/abd", False),
+        ("sdcp/+/abc", "sdcp/status/abc", True),
+        ("sdcp/+/abc", "sdcp/status/abc/extra", False),
+        ("sdcp/#", "sdcp/status/abc", True),
+        ("sdcp/#", "sdcp", True),
+        ("#", "sdcp/status/abc", True),
+        ("+/+", "/status", True),
+        ("/sdcp/#", "sdcp/status/abc", False),
+        ("#", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+    ],
+)
+def test_filter_matching(topic_filter: str, topic: str, *, matches: bool) -> None:
+    """Filters match topics per the MQTT wildcard rules."""
+    trie = SubscriptionTrie()
+    trie.subscribe(topic_filter, "client", 0)
+
+    assert ("client" in trie.match(topic)) is matches
+    assert topic_matches(topic_filter, topic) is matches
+
+
+@pytest.mark.parametrize("topic_filter", ["", "sdcp/#/status", "sdcp/st#", "a/b+"])
+def test_invalid_filters_are_rejected(topic_filter: str) -> None:
+    """Malformed wildcards are rejected."""
+    with pytest.raises(ValueError, match=r"."):
+        validate_filter(topic_filter)
+
+
+class TestSubscriptionTrie:
+    """Subscribers are indexed by filter and removed cleanly."""
+
+    def test_overlapping_filters_use_highest_qos(self) -> None:
+        """A subscriber matched by several filters is returned once."""
+        trie = SubscriptionTrie()
+        trie.subscribe("sdcp/#", "a", 0)
+        trie.subscribe("sdcp/status/+", "a", 1)
+        trie.subscribe("sdcp/status/abc", "b", 0)
+
+        assert trie.match("sdcp/status/abc") == {"a": 1, "b": 0}
+        assert trie.match("sdcp/response/abc") == {"a": 0}
+
+    def test_unsubscribe_and_remove_prune_the_trie(self) -> None:
+        """Removing every subscription leaves an empty trie."""
+        trie = SubscriptionTrie()
+        trie.subscribe("sdcp/status/abc", "a", 0)
+        trie.subscribe("sdcp/status/+", "a", 0)
+        trie.subscribe("sdcp/#", "b", 0)
+
+        trie.unsubscribe("sdcp/status/abc", "a")
+        assert trie.filters("a") == {"sdcp/status/+"}
+        trie.remove("a")
+        trie.remove("b")
+
+        assert len(trie) == 0
+        assert trie.match("sdcp/status/abc") == {}
+        assert trie._root.children == {}
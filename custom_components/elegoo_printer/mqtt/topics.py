@@ -0,0 +1,171 @@
+"""
+Topic filter matching for the embedded MQTT broker.
+
+Subscriptions are kept in a trie keyed by topic level, so routing a PUBLISH
+walks one path per matching filter shape instead of testing every
+subscription. Filters may use the ``+`` (one level) and ``#`` (all remaining
+levels) wildcards.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+SINGLE_LEVEL = "+"
+MULTI_LEVEL = "#"
+
+
+def validate_filter(topic_filter: str) -> None:
+    """
+    Check that a topic filter is well formed.
+
+    Raises:
+        ValueError: If the filter is empty or misuses a wildcard.
+
+    """
+    if not topic_filter:
+        msg = "Empty topic filter"
+        raise ValueError(msg)
+    levels = topic_filter.split("/")
+    for index, level in enumerate(levels):
+        if MULTI_LEVEL in level and (level != MULTI_LEVEL or index != len(levels) - 1):
+            msg = f"'#' must be the whole last level: {topic_filter}"
+            raise ValueError(msg)
+        if SINGLE_LEVEL in level and level != SINGLE_LEVEL:
+            msg = f"'+' must be a whole level: {topic_filter}"
+            raise ValueError(msg)
+
+
+def topic_matches(topic_filter: str, topic: str) -> bool:
+    """Return whether a topic name matches a topic filter."""
+    if topic.startswith("$") and topic_filter[:1] in (SINGLE_LEVEL, MULTI_LEVEL):
+        return False
+    filter_levels = topic_filter.split("/")
+    levels = topic.split("/")
+    for index, level in enumerate(filter_levels):
+        if level == MULTI_LEVEL:
+            return True
+        if index >= len(levels) or level not in (SINGLE_LEVEL, levels[index]):
+            return False
+    return len(filter_levels) == len(levels)
+
+
+class _Node:
+    """One topic level in the trie."""
+
+    __slots__ = ("children", "subscribers")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.subscribers: dict[Hashable, int] = {}
+
+
+class SubscriptionTrie:
+    """Topic filters and their subscribers, matched level by level."""
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root = _Node()
+        # Filters per subscriber, so a client can be removed in one call
+        self._filters: dict[Hashable, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of subscribers with at least one filter."""
+        return len(self._filters)
+
+    def subscribe(self, topic_filter: str, subscriber: Hashable, qos: int) -> None:
+        """
+        Add or update a subscription.
+
+        Raises:
+            ValueError: If the filter is malformed.
+
+        """
+        validate_filter(topic_filter)
+        node = self._root
+        for level in topic_filter.split("/"):
+            node = node.children.setdefault(level, _Node())
+        node.subscribers[subscriber] = qos
+        self._filters.setdefault(subscriber, set()).add(topic_filter)
+
+    def unsubscribe(self, topic_filter: str, subscriber: Hashable) -> None:
+        """Remove one subscription, if it exists."""
+        filters = self._filters.get(subscriber)
+        if filters is None or topic_filter not in filters:
+            return
+        filters.discard(topic_filter)
+        if not filters:
+            del self._filters[subscriber]
+
+        path = [self._root]
+        levels = topic_filter.split("/")
+        for level in levels:
+            path.append(path[-1].children[level])
+        del path[-1].subscribers[subscriber]
+        # Prune nodes left without subscribers or children
+        for depth in range(len(levels), 0, -1):
+            node = path[depth]
+            if node.subscribers or node.children:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
+
+    def remove(self, subscriber: Hashable) -> None:
+        """Remove every subscription of a subscriber."""
+        for topic_filter in list(self._filters.get(subscriber, ())):
+            self.unsubscribe(topic_filter, subscriber)
+
+    def filters(self, subscriber: Hashable) -> set[str]:
+        """Return the filters a subscriber is subscribed to."""
+        return set(self._filters.get(subscriber, ()))
+
+    def match(self, topic: str) -> dict[Hashable, int]:
+        """
+        Return the subscribers of a topic.
+
+        Args:
+            topic: The topic name of a PUBLISH.
+
+        Returns:
+            Each matching subscriber with the highest QoS of its matching
+            filters.
+
+        """
+        matches: dict[Hashable, int] = {}
+        levels = topic.split("/")
+        # Wildcards do not match topics starting with "$" at the first level
+        wildcards = not topic.startswith("$")
+        nodes = [self._root]
+        for level in levels:
+            next_nodes = []
+            for node in nodes:
+                if wildcards:
+                    multi = node.children.get(MULTI_LEVEL)
+                    if multi is not None:
+                        _merge(matches, multi.subscribers)
+                    single = node.children.get(SINGLE_LEVEL)
+                    if single is not None:
+                        next_nodes.append(single)
+                child = node.children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+            if not next_nodes:
+                return matches
+            nodes = next_nodes
+            wildcards = True
+        for node in nodes:
+            _merge(matches, node.subscribers)
+            # "a/#" also matches "a"
+            multi = node.children.get(MULTI_LEVEL)
+            if multi is not None:
+                _merge(matches, multi.subscribers)
+        return matches
+
+
+def _merge(matches: dict[Hashable, int], subscribers: dict[Hashable, int]) -> None:
+    """Add subscribers to a match, keeping the highest QoS per subscriber."""
+    for subscriber, qos in subscribers.items():
+        if qos > matches.get(subscriber, -1):
+            matches[subscriber] = qos
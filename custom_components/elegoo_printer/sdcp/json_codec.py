@@ -0,0 +1,83 @@
+"""
+JSON codec for printer wire traffic.
+
+Uses orjson or msgspec when one of them is installed and falls back to the
+standard library otherwise. ``loads`` accepts str or bytes-like input so MQTT
+and UDP payloads can be parsed without decoding them to str first, and
+``dumps_bytes`` produces bytes ready to publish.
+
+Decode errors are always raised as ``json.JSONDecodeError`` so callers can keep
+catching the standard library exception whatever the backend.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+
+    def loads(data: str | bytes | bytearray | memoryview) -> Any:
+        """Parse a JSON document from str or bytes."""
+        return orjson.loads(data)
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 encoded JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+elif msgspec is not None:
+    BACKEND = "msgspec"
+    _encoder = msgspec.json.Encoder()
+    _decoder = msgspec.json.Decoder()
+
+    def loads(data: str | bytes | bytearray | memoryview) -> Any:
+        """Parse a JSON document from str or bytes."""
+        try:
+            return _decoder.decode(data)
+        except (msgspec.DecodeError, UnicodeDecodeError) as err:
+            raise JSONDecodeError(str(err), "", 0) from err
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 encoded JSON."""
+        return _encoder.encode(obj)
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return _encoder.encode(obj).decode()
+
+else:
+    BACKEND = "json"
+
+    def loads(data: str | bytes | bytearray | memoryview) -> Any:
+        """Parse a JSON document from str or bytes."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        try:
+            return json.loads(data)
+        except UnicodeDecodeError as err:
+            raise JSONDecodeError(str(err), "", 0) from err
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 encoded JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def dumps(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
@@ -0,0 +1,124 @@
+"""
+Cached lookup of the local IP address used to reach a printer.
+
+Finding the source address for a route means creating and connecting a UDP
+socket. The proxy needs that address for every rewritten page chunk and
+VideoUrl frame, and entities need it for their configuration URL, so results
+are cached per target IP.
+
+Entries expire after ``ROUTE_CACHE_TTL`` seconds. The cache is also flushed
+when the set of network interfaces changes, which is checked at most every
+``INTERFACE_CHECK_INTERVAL`` seconds.
+"""
+
+from __future__ import annotations
+
+import socket
+import time
+from typing import TYPE_CHECKING
+
+from custom_components.elegoo_printer.const import DEFAULT_FALLBACK_IP
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ROUTE_CACHE_TTL = 300.0
+FAILED_ROUTE_TTL = 10.0
+INTERFACE_CHECK_INTERVAL = 30.0
+
+
+def _route_source_ip(target_ip: str) -> str | None:
+    """Return the local address the OS would use to reach ``target_ip``."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            # Doesn't have to be reachable
+            s.connect((target_ip, 1))
+            return s.getsockname()[0]
+    except (socket.gaierror, OSError):
+        return None
+
+
+def _interface_names() -> frozenset[str] | None:
+    """Return the names of the host's network interfaces, if available."""
+    try:
+        return frozenset(name for _, name in socket.if_nameindex())
+    except (AttributeError, OSError):
+        return None
+
+
+class LocalRouteCache:
+    """Cache of local source addresses keyed by target IP."""
+
+    def __init__(
+        self,
+        ttl: float = ROUTE_CACHE_TTL,
+        interface_check_interval: float = INTERFACE_CHECK_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl: Seconds a resolved address stays valid.
+            interface_check_interval: Seconds between interface change checks.
+            clock: Monotonic clock, replaceable for tests.
+
+        """
+        self.ttl = ttl
+        self.interface_check_interval = interface_check_interval
+        self._clock = clock
+        self._routes: dict[str, tuple[str | None, float]] = {}
+        self._interfaces: frozenset[str] | None = None
+        self._next_interface_check = 0.0
+
+    def resolve(self, target_ip: str | None) -> str | None:
+        """
+        Return the local IP used to reach ``target_ip``.
+
+        Args:
+            target_ip: The address to route to; a public address is used if
+                it is empty.
+
+        Returns:
+            The local IP address, or None if no route could be found.
+
+        """
+        target_ip = target_ip or DEFAULT_FALLBACK_IP
+        now = self._clock()
+        if now >= self._next_interface_check:
+            self._check_interfaces(now)
+
+        cached = self._routes.get(target_ip)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+
+        local_ip = _route_source_ip(target_ip)
+        # Retry failed lookups sooner so a late network comes up quickly
+        ttl = self.ttl if local_ip else min(self.ttl, FAILED_ROUTE_TTL)
+        self._routes[target_ip] = (local_ip, now + ttl)
+        return local_ip
+
+    def invalidate(self) -> None:
+        """Forget every cached route."""
+        self._routes.clear()
+
+    def _check_interfaces(self, now: float) -> None:
+        """Flush the cache if network interfaces were added or removed."""
+        self._next_interface_check = now + self.interface_check_interval
+        interfaces = _interface_names()
+        if interfaces != self._interfaces:
+            self._interfaces = interfaces
+            self.invalidate()
+
+
+_cache = LocalRouteCache()
+
+
+def resolve_local_ip(target_ip: str | None) -> str | None:
+    """Return the cached local IP used to reach ``target_ip``."""
+    return _cache.resolve(target_ip)
+
+
+def invalidate_local_routes() -> None:
+    """Forget every cached route, e.g. after a network change."""
+    _cache.invalidate()
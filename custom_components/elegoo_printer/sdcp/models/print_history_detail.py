@@ -9,6 +9,22 @@ from .enums import ElegooErrorStatusReason
 class PrintHistoryDetail:
     """Represents the details of a print history entry."""
 
+    __slots__ = (
+        "MD5",
+        "already_print_layer",
+        "begin_time",
+        "current_layer_tal_volume",
+        "end_time",
+        "error_status_reason",
+        "slice_information",
+        "task_id",
+        "task_name",
+        "task_status",
+        "thumbnail",
+        "time_lapse_video_status",
+        "time_lapse_video_url",
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:
         """
         Initialize a PrintHistoryDetail instance with print job details from a dictionary.
@@ -53,7 +69,7 @@ class PrintHistoryDetail:
 
     def __repr__(self) -> str:
         """Return a string representation of the instance's attributes as a dict."""
-        return str(self.__dict__)
+        return str({name: getattr(self, name) for name in self.__slots__})
 
 
 class SliceInformation:
@@ -114,6 +130,59 @@ class SliceInformation:
 
     """  # noqa: E501
 
+    __slots__ = (
+        "bottom_layer_drop_height2",
+        "bottom_layer_drop_speed",
+        "bottom_layer_drop_speed2",
+        "bottom_layer_exposure_time",
+        "bottom_layer_lift_height",
+        "bottom_layer_lift_height2",
+        "bottom_layer_lift_speed",
+        "bottom_layer_lift_speed2",
+        "bottom_layer_light_off_time",
+        "bottom_layer_numbers",
+        "bottom_layer_pwm",
+        "bottom_layer_rest_time_after_drop",
+        "bottom_layer_rest_time_after_lift",
+        "bottom_layer_rest_time_before_lift",
+        "independent_supports",
+        "layer_height",
+        "machine_name",
+        "machine_size_x",
+        "machine_size_y",
+        "machine_size_z",
+        "model_size_x",
+        "model_size_y",
+        "model_size_z",
+        "normal_layer_drop_height2",
+        "normal_layer_drop_speed",
+        "normal_layer_drop_speed2",
+        "normal_layer_exposure_time",
+        "normal_layer_lift_height",
+        "normal_layer_lift_height2",
+        "normal_layer_lift_speed",
+        "normal_layer_lift_speed2",
+        "normal_layer_light_off_time",
+        "normal_layer_pwm",
+        "normal_layer_rest_time_after_drop",
+        "normal_layer_rest_time_after_lift",
+        "normal_layer_rest_time_before_lift",
+        "price",
+        "print_time",
+        "profile_name",
+        "resin_color",
+        "resin_density",
+        "resin_name",
+        "resin_type",
+        "resolution_x",
+        "resolution_y",
+        "total_layer_numbers",
+        "transition_layer_numbers",
+        "transition_type",
+        "volume",
+        "weight",
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:  # noqa: PLR0915
         """
         Initialize a SliceInformation object.
@@ -221,4 +290,4 @@ class SliceInformation:
             A string representation of the object's attributes.
 
         """
-        return str(self.__dict__)
+        return str({name: getattr(self, name) for name in self.__slots__})
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 import re
-import socket
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from types import MappingProxyType
@@ -20,9 +19,10 @@ from custom_components.elegoo_printer.const import (
     CONF_MQTT_EXTERNAL_HOST,
     CONF_MQTT_EXTERNAL_PORT,
     CONF_PROXY_ENABLED,
-    DEFAULT_FALLBACK_IP,
     WEBSOCKET_PORT,
 )
+from custom_components.elegoo_printer.sdcp import json_codec
+from custom_components.elegoo_printer.sdcp.local_route import resolve_local_ip
 from custom_components.elegoo_printer.sdcp.models.enums import ElegooMachineStatus
 
 from .attributes import PrinterAttributes
@@ -189,7 +189,7 @@ class Printer:
             self.has_canvas = False
         else:
             try:
-                j: dict[str, Any] = json.loads(json_string)  # Decode the JSON string
+                j: dict[str, Any] = json_codec.loads(json_string)
                 self.connection = j.get("Id")
                 data_dict = j.get("Data", j)
 
@@ -574,13 +574,7 @@ class PrinterData:
         if external_ip:
             return external_ip
 
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-                # Doesn't have to be reachable
-                s.connect((target_ip or DEFAULT_FALLBACK_IP, 1))
-                return s.getsockname()[0]
-        except (socket.gaierror, OSError):
-            return "127.0.0.1"
+        return resolve_local_ip(target_ip) or "127.0.0.1"
 
     @property
     def printer_url(self) -> str | None:
@@ -9,6 +9,12 @@ from .enums import ElegooMachineStatus, ElegooPrintError, ElegooPrintStatus, Pri
 class CurrentFanSpeed:
     """Represents the speed of the various fans."""
 
+    __slots__ = (
+        "auxiliary_fan",
+        "box_fan",
+        "model_fan",
+    )
+
     def __init__(self, data: dict[str, Any] | None = None) -> None:
         """Initialize a new CurrentFanSpeed object."""
         if data is None:
@@ -21,6 +27,11 @@ class CurrentFanSpeed:
 class LightStatus:
     """Represents the status of the printer's lights."""
 
+    __slots__ = (
+        "rgb_light",
+        "second_light",
+    )
+
     def __init__(self, data: dict[str, Any] | None = None) -> None:
         """
         Initialize a LightStatus instance with secondary and RGB light values.
@@ -149,6 +160,25 @@ class PrintInfo:
 
     """
 
+    __slots__ = (
+        "current_extrusion",
+        "current_layer",
+        "current_ticks",
+        "end_time",
+        "error_number",
+        "filename",
+        "percent_complete",
+        "print_speed_pct",
+        "progress",
+        "remaining_layers",
+        "remaining_ticks",
+        "status",
+        "task_id",
+        "total_extrusion",
+        "total_layers",
+        "total_ticks",
+    )
+
     def __init__(
         self,
         data: dict[str, Any] | None = None,
@@ -252,6 +282,30 @@ class PrinterStatus:
 
     """
 
+    __slots__ = (
+        "current_coord",
+        "current_fan_speed",
+        "current_status",
+        "heat_status",
+        "light_status",
+        "platform_type",
+        "previous_status",
+        "print_info",
+        "print_screen",
+        "release_film",
+        "temp_of_box",
+        "temp_of_hotbed",
+        "temp_of_nozzle",
+        "temp_of_tank",
+        "temp_of_uvled",
+        "temp_target_box",
+        "temp_target_hotbed",
+        "temp_target_nozzle",
+        "temp_target_tank",
+        "time_lapse_status",
+        "z_offset",
+    )
+
     def __init__(
         self,
         data: dict[str, Any] | None = None,
@@ -0,0 +1,30 @@
+"""Push notification from printer clients to the coordinator."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class DataListenerMixin:
+    """Let a printer client tell one listener when printer_data changes."""
+
+    _data_listener: Callable[[], None] | None = None
+
+    def set_data_listener(self, listener: Callable[[], None] | None) -> None:
+        """
+        Register a callback invoked whenever the printer pushes new data.
+
+        Arguments:
+            listener: Callback run on the event loop after printer_data
+                changed, or None to detach the current listener.
+
+        """
+        self._data_listener = listener
+
+    def _notify_data_listener(self) -> None:
+        """Tell the registered listener that printer_data has changed."""
+        if self._data_listener is not None:
+            self._data_listener()
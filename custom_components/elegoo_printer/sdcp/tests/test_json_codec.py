@@ -0,0 +1,60 @@
+"""Tests for the wire JSON codec."""
+
+import importlib
+import json
+import sys
+from collections.abc import Iterator
+from types import ModuleType
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.elegoo_printer.sdcp import json_codec
+
+FRAME = {"Topic": "sdcp/status/ABCDEF", "Status": {"CurrentStatus": [1]}}
+
+
+@pytest.fixture(params=["installed", "stdlib"])
+def codec(request: pytest.FixtureRequest) -> Iterator[ModuleType]:
+    """Yield the codec with the installed backend and with the stdlib fallback."""
+    if request.param == "installed":
+        yield json_codec
+        return
+    with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+        yield importlib.reload(json_codec)
+    importlib.reload(json_codec)
+
+
+def test_stdlib_fallback_is_selected_without_fast_backends() -> None:
+    """Test that the codec falls back to json when no fast backend imports."""
+    with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+        assert importlib.reload(json_codec).BACKEND == "json"
+    importlib.reload(json_codec)
+
+
+def test_loads_accepts_str_and_bytes(codec: ModuleType) -> None:
+    """Test that str, bytes, bytearray and memoryview payloads all decode."""
+    raw = json.dumps(FRAME)
+    encoded = raw.encode()
+
+    for payload in (raw, encoded, bytearray(encoded), memoryview(encoded)):
+        assert codec.loads(payload) == FRAME
+
+
+def test_dumps_round_trip(codec: ModuleType) -> None:
+    """Test that dumps and dumps_bytes produce equivalent compact JSON."""
+    assert json.loads(codec.dumps(FRAME)) == FRAME
+    assert codec.dumps_bytes(FRAME) == codec.dumps(FRAME).encode()
+    assert " " not in codec.dumps({"a": 1, "b": [1, 2]})
+
+
+def test_invalid_json_raises_stdlib_error(codec: ModuleType) -> None:
+    """Test that decode errors surface as json.JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{not json")
+
+
+def test_invalid_utf8_raises_stdlib_error(codec: ModuleType) -> None:
+    """Test that undecodable bytes also surface as json.JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b'{"Topic": "\xff\xfe"}')
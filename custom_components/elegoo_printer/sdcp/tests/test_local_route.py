@@ -0,0 +1,111 @@
+"""Tests for the cached local route lookup."""
+
+# ruff: noqa: PLR2004
+
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from custom_components.elegoo_printer.sdcp.local_route import (
+    FAILED_ROUTE_TTL,
+    LocalRouteCache,
+)
+
+PRINTER_IP = "192.168.1.100"
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    """Return a clock starting at zero."""
+    return _Clock()
+
+
+@pytest.fixture
+def cache(clock: _Clock) -> LocalRouteCache:
+    """Return a cache driven by the test clock."""
+    return LocalRouteCache(ttl=60.0, interface_check_interval=5.0, clock=clock)
+
+
+@pytest.fixture
+def if_nameindex() -> Iterator[Mock]:
+    """Patch the interface list to a single interface."""
+    with patch("socket.if_nameindex", return_value=[(1, "eth0")]) as mock:
+        yield mock
+
+
+@pytest.fixture
+def socket_class(if_nameindex: Mock) -> Iterator[Mock]:  # noqa: ARG001
+    """Patch socket creation so routes resolve to 192.168.1.10."""
+    with patch("socket.socket") as mock_socket_class:
+        mock_socket = mock_socket_class.return_value.__enter__.return_value
+        mock_socket.getsockname.return_value = ("192.168.1.10", 12345)
+        yield mock_socket_class
+
+
+def test_route_is_resolved_once_within_ttl(
+    cache: LocalRouteCache, clock: _Clock, socket_class: Mock
+) -> None:
+    """Test that repeated lookups reuse the cached route until it expires."""
+    assert cache.resolve(PRINTER_IP) == "192.168.1.10"
+    clock.now = 30.0
+    assert cache.resolve(PRINTER_IP) == "192.168.1.10"
+    assert socket_class.call_count == 1
+
+    clock.now = 61.0
+    assert cache.resolve(PRINTER_IP) == "192.168.1.10"
+    assert socket_class.call_count == 2
+
+
+def test_routes_are_cached_per_target(
+    cache: LocalRouteCache, socket_class: Mock
+) -> None:
+    """Test that each target IP has its own cache entry."""
+    cache.resolve(PRINTER_IP)
+    cache.resolve("10.0.0.5")
+    cache.resolve(PRINTER_IP)
+
+    assert socket_class.call_count == 2
+
+
+def test_interface_change_flushes_cache(
+    cache: LocalRouteCache, clock: _Clock, socket_class: Mock, if_nameindex: Mock
+) -> None:
+    """Test that adding a network interface forces a new lookup."""
+    cache.resolve(PRINTER_IP)
+    if_nameindex.return_value = [(1, "eth0"), (2, "wlan0")]
+
+    # The interface list is only re-read once the check interval passes
+    clock.now = 1.0
+    cache.resolve(PRINTER_IP)
+    assert socket_class.call_count == 1
+
+    clock.now = 6.0
+    cache.resolve(PRINTER_IP)
+    assert socket_class.call_count == 2
+
+
+def test_failed_lookup_is_retried_sooner(
+    cache: LocalRouteCache, clock: _Clock, socket_class: Mock
+) -> None:
+    """Test that a failed lookup is cached only briefly."""
+    mock_socket = socket_class.return_value.__enter__.return_value
+    mock_socket.connect.side_effect = OSError("Network unreachable")
+
+    assert cache.resolve(PRINTER_IP) is None
+    assert cache.resolve(PRINTER_IP) is None
+    assert socket_class.call_count == 1
+
+    clock.now = FAILED_ROUTE_TTL + 1
+    cache.resolve(PRINTER_IP)
+    assert socket_class.call_count == 2
@@ -182,3 +182,17 @@ def test_extrusion_hex_fallback_priority() -> None:
 
     # Normal key should take priority
     assert status.print_info.total_extrusion == 9999.99
+
+
+def test_status_models_are_slotted() -> None:
+    """Test that status models keep no per-instance __dict__."""
+    status = PrinterStatus({"Status": {"PrintInfo": {"TaskId": "job-1"}}})
+
+    for model in (
+        status,
+        status.print_info,
+        status.current_fan_speed,
+        status.light_status,
+    ):
+        assert not hasattr(model, "__dict__")
+    assert status.print_info.task_id == "job-1"
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorEntity
 
 from .const import CONF_GCODE_PROXY_URL, LOGGER
+from .coordinator import PRINT_STATUS_TRANSITION_CONTEXT
 from .definitions import (
     PRINTER_ATTRIBUTES_COMMON,
     PRINTER_ATTRIBUTES_RESIN,
@@ -128,7 +129,12 @@ class ElegooPrinterSensor(ElegooPrinterEntity, SensorEntity):
 
         For duration sensors on FDM printers, sets the native unit of measurement to seconds.
         """  # noqa: E501
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            PRINT_STATUS_TRANSITION_CONTEXT
+            if entity_description.replay_transitions
+            else None,
+        )
         self.entity_description = entity_description
         self._attr_unique_id = coordinator.generate_unique_id(
             self.entity_description.key
@@ -137,9 +143,9 @@ class ElegooPrinterSensor(ElegooPrinterEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Use exists_fn when set (e.g. UV LED); otherwise entity stays available."""
-        if not super().available:
-            return False
-        return self.entity_description.exists_fn(self.coordinator.data)
+        if self._writing_fingerprint is not None:
+            return self._writing_fingerprint[0]
+        return self._compute_available()
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -148,11 +154,31 @@ class ElegooPrinterSensor(ElegooPrinterEntity, SensorEntity):
 
         The attributes are generated by the entity descriptions extra_attributes method.
         """
+        if self._writing_fingerprint is not None:
+            return self._writing_fingerprint[2]
         return self.entity_description.extra_attributes(self)
 
     @property
     def native_value(self) -> datetime | StateType:
         """Return the state of the sensor."""
+        if self._writing_fingerprint is not None:
+            return self._writing_fingerprint[1]
+        return self._compute_native_value()
+
+    def _compute_available(self) -> bool:
+        if not super().available:
+            return False
+        return self.entity_description.exists_fn(self.coordinator.data)
+
+    def _compute_native_value(self) -> datetime | StateType:
         if self.coordinator.data:
             return self.entity_description.value_fn(self.coordinator.data)
         return None
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return the availability, value and attributes written for the sensor."""
+        return (
+            self._compute_available(),
+            self._compute_native_value(),
+            self.entity_description.extra_attributes(self),
+        )
@@ -0,0 +1,55 @@
+"""Shared fixtures for the elegoo_printer tests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.elegoo_printer.coordinator import ElegooDataUpdateCoordinator
+from custom_components.elegoo_printer.sdcp.models.printer import PrinterData
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _build_coordinator(
+    client: object | None = None, options: dict | None = None
+) -> ElegooDataUpdateCoordinator:
+    """
+    Build a coordinator backed by a mocked config entry and API client.
+
+    Must be called while an event loop is running.
+
+    Arguments:
+        client: The printer client exposed as api.client.
+        options: The config entry options.
+
+    Returns:
+        The coordinator; its API client is at config_entry.runtime_data.api.
+
+    """
+    hass = MagicMock()
+    hass.loop = asyncio.get_running_loop()
+    entry = MagicMock()
+    entry.data = {}
+    entry.options = options or {}
+    entry.title = "Test Printer"
+    coordinator = ElegooDataUpdateCoordinator(hass, entry=entry)
+    coordinator.config_entry = entry
+    api = MagicMock()
+    api.client = object() if client is None else client
+    api.printer_data = PrinterData()
+    api.async_get_printer_data = AsyncMock(return_value=api.printer_data)
+    api.refreshed_data = frozenset({"status", "attributes", "print history"})
+    api.async_get_firmware_update_info = AsyncMock(return_value=None)
+    entry.runtime_data.api = api
+    return coordinator
+
+
+@pytest.fixture
+def make_coordinator() -> Callable[..., ElegooDataUpdateCoordinator]:
+    """Return a builder for coordinators with a mocked API client."""
+    return _build_coordinator
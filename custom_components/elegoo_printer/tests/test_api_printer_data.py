@@ -0,0 +1,97 @@
+"""Tests for the concurrent refresh in ElegooPrinterApiClient.async_get_printer_data."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.elegoo_printer.api import ElegooPrinterApiClient
+from custom_components.elegoo_printer.sdcp.exceptions import (
+    ElegooPrinterConnectionError,
+    ElegooPrinterTimeoutError,
+)
+from custom_components.elegoo_printer.sdcp.models.printer import PrinterData
+
+
+def _api_client() -> ElegooPrinterApiClient:
+    printer_data = PrinterData()
+    api_client = ElegooPrinterApiClient.__new__(ElegooPrinterApiClient)
+    api_client.printer_data = printer_data
+    api_client._logger = MagicMock()
+    api_client.client = MagicMock()
+    api_client.client.get_printer_attributes = AsyncMock(return_value=printer_data)
+    api_client.client.get_printer_status = AsyncMock(return_value=printer_data)
+    api_client.client.async_get_printer_historical_tasks = AsyncMock(
+        return_value=printer_data.print_history
+    )
+    api_client.client.async_get_printer_current_task = AsyncMock(return_value=None)
+    return api_client
+
+
+class TestAsyncGetPrinterData:
+    """Independent requests are pipelined with partial-failure semantics."""
+
+    def test_independent_requests_are_in_flight_together(self) -> None:
+        async def _run() -> None:
+            api_client = _api_client()
+            in_flight = 0
+            all_sent = asyncio.Event()
+
+            async def _request() -> PrinterData:
+                nonlocal in_flight
+                in_flight += 1
+                if in_flight == 3:
+                    all_sent.set()
+                await all_sent.wait()
+                return api_client.printer_data
+
+            api_client.client.get_printer_attributes.side_effect = _request
+            api_client.client.get_printer_status.side_effect = _request
+            api_client.client.async_get_printer_historical_tasks.side_effect = _request
+
+            result = await asyncio.wait_for(api_client.async_get_printer_data(), 1)
+
+            assert result is api_client.printer_data
+            api_client.client.async_get_printer_current_task.assert_awaited_once()
+
+        asyncio.run(_run())
+
+    def test_history_timeout_keeps_cached_data(self) -> None:
+        async def _run() -> None:
+            api_client = _api_client()
+            api_client.client.async_get_printer_historical_tasks.side_effect = (
+                ElegooPrinterTimeoutError
+            )
+
+            result = await api_client.async_get_printer_data()
+
+            assert result is api_client.printer_data
+            assert api_client.refreshed_data == {"status", "attributes"}
+            api_client.client.async_get_printer_current_task.assert_awaited_once()
+
+        asyncio.run(_run())
+
+    def test_status_timeout_fails_refresh(self) -> None:
+        async def _run() -> None:
+            api_client = _api_client()
+            api_client.client.get_printer_status.side_effect = ElegooPrinterTimeoutError
+
+            with pytest.raises(ElegooPrinterTimeoutError):
+                await api_client.async_get_printer_data()
+            api_client.client.async_get_printer_current_task.assert_not_awaited()
+
+        asyncio.run(_run())
+
+    def test_connection_error_fails_refresh(self) -> None:
+        async def _run() -> None:
+            api_client = _api_client()
+            api_client.client.get_printer_attributes.side_effect = (
+                ElegooPrinterConnectionError
+            )
+
+            with pytest.raises(ElegooPrinterConnectionError):
+                await api_client.async_get_printer_data()
+
+        asyncio.run(_run())
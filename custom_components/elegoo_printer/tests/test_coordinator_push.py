@@ -0,0 +1,182 @@
+"""Tests for push-driven coordinator updates."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import aiohttp
+
+from custom_components.elegoo_printer.cc2.client import ElegooCC2Client
+from custom_components.elegoo_printer.cc2.const import (
+    CC2_STATUS_PRINTING,
+    CC2_SUBSTATUS_PRINTING,
+)
+from custom_components.elegoo_printer.sdcp.models.enums import PrinterType
+from custom_components.elegoo_printer.sdcp.models.printer import Printer, PrinterData
+from custom_components.elegoo_printer.websocket.client import ElegooPrinterClient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from custom_components.elegoo_printer.coordinator import ElegooDataUpdateCoordinator
+
+
+class TestClientPushNotification:
+    """Clients notify their listener when pushed frames change printer_data."""
+
+    def test_websocket_status_frame_notifies_listener(self) -> None:
+        client = ElegooPrinterClient("192.0.2.1", MagicMock(spec=aiohttp.ClientSession))
+        listener = MagicMock()
+        client.set_data_listener(listener)
+
+        client._status_handler({"Status": {"CurrentStatus": [0]}})
+        client._attributes_handler({"Attributes": {"Name": "Saturn"}})
+
+        assert listener.call_count == 2
+
+    def test_cc2_status_update_notifies_listener(self) -> None:
+        printer = Printer()
+        printer.printer_type = PrinterType.FDM
+        client = ElegooCC2Client("192.0.2.1", "TESTSN", printer=printer)
+        listener = MagicMock()
+        client.set_data_listener(listener)
+        client._cached_status = {
+            "print_status": {},
+            "machine_status": {
+                "status": CC2_STATUS_PRINTING,
+                "sub_status": CC2_SUBSTATUS_PRINTING,
+            },
+        }
+
+        client._update_printer_status()
+
+        listener.assert_called_once_with()
+
+    def test_detached_listener_is_not_called(self) -> None:
+        client = ElegooPrinterClient("192.0.2.1", MagicMock(spec=aiohttp.ClientSession))
+        listener = MagicMock()
+        client.set_data_listener(listener)
+        client.set_data_listener(None)
+
+        client._status_handler({"Status": {"CurrentStatus": [0]}})
+
+        listener.assert_not_called()
+
+
+class TestCoordinatorPushMode:
+    """The coordinator slows its poll down while the printer pushes data."""
+
+    def test_successful_poll_subscribes_but_keeps_fast_poll(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            client = MagicMock()
+            coordinator = make_coordinator(client)
+
+            await coordinator._async_update_data()
+
+            client.set_data_listener.assert_called_once_with(
+                coordinator._handle_client_push
+            )
+            assert coordinator.update_interval == timedelta(seconds=2)
+
+        asyncio.run(_run())
+
+    def test_unsolicited_push_slows_the_poll(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator(MagicMock())
+            coordinator._push_debouncer = MagicMock()
+            await coordinator._async_update_data()
+
+            coordinator._handle_client_push()
+            await coordinator._async_update_data()
+
+            assert coordinator.update_interval == timedelta(seconds=30)
+            coordinator._push_debouncer.async_schedule_call.assert_called_once_with()
+
+        asyncio.run(_run())
+
+    def test_stopped_pushes_restore_fast_poll(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator(MagicMock())
+            coordinator._push_debouncer = MagicMock()
+            await coordinator._async_update_data()
+            coordinator._handle_client_push()
+            await coordinator._async_update_data()
+
+            coordinator._last_push -= timedelta(seconds=31)
+            await coordinator._async_update_data()
+
+            assert coordinator.update_interval == timedelta(seconds=2)
+
+        asyncio.run(_run())
+
+    def test_reply_to_own_poll_is_not_a_push(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator(MagicMock())
+            api = coordinator.config_entry.runtime_data.api
+            coordinator._push_debouncer = MagicMock()
+
+            async def _fetch(**_kwargs: bool) -> PrinterData:
+                coordinator._handle_client_push()
+                return api.printer_data
+
+            api.async_get_printer_data.side_effect = _fetch
+
+            await coordinator._async_update_data()
+            await coordinator._async_update_data()
+
+            coordinator._push_debouncer.async_schedule_call.assert_not_called()
+            assert coordinator.update_interval == timedelta(seconds=2)
+
+        asyncio.run(_run())
+
+    def test_client_without_push_support_keeps_fast_poll(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator(object())
+
+            await coordinator._async_update_data()
+
+            assert coordinator.update_interval == timedelta(seconds=2)
+
+        asyncio.run(_run())
+
+    def test_pushed_data_updates_listeners_without_rescheduling(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator(MagicMock())
+            await coordinator._async_update_data()
+            coordinator.async_update_listeners = MagicMock()
+            coordinator.async_set_updated_data = MagicMock()
+
+            await coordinator._async_handle_pushed_data()
+
+            coordinator.async_update_listeners.assert_called_once_with()
+            coordinator.async_set_updated_data.assert_not_called()
+
+        asyncio.run(_run())
+
+    def test_push_ignored_before_first_refresh(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator(MagicMock())
+            coordinator.async_update_listeners = MagicMock()
+
+            await coordinator._async_handle_pushed_data()
+
+            coordinator.async_update_listeners.assert_not_called()
+
+        asyncio.run(_run())
@@ -0,0 +1,116 @@
+"""Tests for the coordinator's tiered attributes/history refresh schedule."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from custom_components.elegoo_printer.const import (
+    CONF_ATTRIBUTES_REFRESH_INTERVAL,
+    CONF_HISTORY_REFRESH_INTERVAL,
+)
+from custom_components.elegoo_printer.sdcp.models.status import PrinterStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from custom_components.elegoo_printer.coordinator import ElegooDataUpdateCoordinator
+
+
+def _requested(coordinator: ElegooDataUpdateCoordinator) -> dict:
+    api = coordinator.config_entry.runtime_data.api
+    return api.async_get_printer_data.await_args.kwargs
+
+
+class TestRefreshSchedule:
+    """Attributes and history are fetched on their own schedule."""
+
+    def test_first_poll_fetches_everything(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator()
+
+            await coordinator._async_update_data()
+
+            assert _requested(coordinator) == {
+                "include_attributes": True,
+                "include_history": True,
+            }
+
+        asyncio.run(_run())
+
+    def test_next_poll_fetches_status_only(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator()
+            await coordinator._async_update_data()
+
+            await coordinator._async_update_data()
+
+            assert _requested(coordinator) == {
+                "include_attributes": False,
+                "include_history": False,
+            }
+
+        asyncio.run(_run())
+
+    def test_elapsed_interval_refetches_attributes(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator(
+                options={CONF_ATTRIBUTES_REFRESH_INTERVAL: 60}
+            )
+            await coordinator._async_update_data()
+            coordinator._last_attributes_refresh -= timedelta(seconds=61)
+
+            await coordinator._async_update_data()
+
+            assert _requested(coordinator)["include_attributes"] is True
+            assert _requested(coordinator)["include_history"] is False
+
+        asyncio.run(_run())
+
+    def test_job_change_refetches_history(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator(
+                options={CONF_HISTORY_REFRESH_INTERVAL: 86400}
+            )
+            await coordinator._async_update_data()
+            api = coordinator.config_entry.runtime_data.api
+            api.printer_data.status = PrinterStatus.from_json(
+                '{"Status": {"PrintInfo": {"TaskId": "job-2", "Status": 13}}}'
+            )
+
+            await coordinator._async_update_data()
+            await coordinator._async_update_data()
+
+            assert _requested(coordinator)["include_history"] is True
+
+        asyncio.run(_run())
+
+    def test_timed_out_history_is_retried_next_poll(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = make_coordinator(
+                options={CONF_HISTORY_REFRESH_INTERVAL: 3600}
+            )
+            api = coordinator.config_entry.runtime_data.api
+            api.refreshed_data = frozenset({"status", "attributes"})
+            await coordinator._async_update_data()
+
+            await coordinator._async_update_data()
+
+            assert coordinator._last_history_refresh is None
+            assert _requested(coordinator) == {
+                "include_attributes": False,
+                "include_history": True,
+            }
+
+        asyncio.run(_run())
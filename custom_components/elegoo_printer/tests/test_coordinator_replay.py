@@ -0,0 +1,98 @@
+"""Tests for replaying queued CC2 print status transitions."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+from custom_components.elegoo_printer.cc2.client import ElegooCC2Client
+from custom_components.elegoo_printer.coordinator import (
+    PRINT_STATUS_TRANSITION_CONTEXT,
+    ElegooDataUpdateCoordinator,
+)
+from custom_components.elegoo_printer.sdcp.models.enums import ElegooPrintStatus
+from custom_components.elegoo_printer.sdcp.models.status import PrinterStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _status(print_status: ElegooPrintStatus) -> PrinterStatus:
+    status = PrinterStatus()
+    status.print_info.status = print_status
+    return status
+
+
+def _coordinator(
+    make_coordinator: Callable[..., ElegooDataUpdateCoordinator],
+    snapshots: list[PrinterStatus],
+) -> ElegooDataUpdateCoordinator:
+    client = MagicMock(spec=ElegooCC2Client)
+    client.consume_print_status_transition_queue.return_value = snapshots
+    return make_coordinator(client)
+
+
+class TestTransitionReplay:
+    """Intermediate snapshots go only to print status entities, in order."""
+
+    def test_transitions_written_to_registered_entities_only(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            snapshots = [
+                _status(ElegooPrintStatus.PRINTING),
+                _status(ElegooPrintStatus.COMPLETE),
+                _status(ElegooPrintStatus.IDLE),
+            ]
+            coordinator = _coordinator(make_coordinator, snapshots)
+            api = coordinator.config_entry.runtime_data.api
+            live_data = api.printer_data
+            live_status = live_data.status
+            replayed: list[ElegooPrintStatus] = []
+
+            def _transition_listener() -> None:
+                assert live_data.status is live_status
+                assert coordinator.data is not live_data
+                replayed.append(coordinator.data.status.print_info.status)
+
+            other_listener = MagicMock()
+            coordinator.async_add_listener(
+                _transition_listener, PRINT_STATUS_TRANSITION_CONTEXT
+            )
+            coordinator.async_add_listener(other_listener)
+            coordinator.async_set_updated_data = MagicMock()
+
+            await coordinator._async_update_data()
+
+            # The trailing IDLE snapshot matches the live state and is left to
+            # the regular full update.
+            assert replayed == [ElegooPrintStatus.PRINTING, ElegooPrintStatus.COMPLETE]
+            other_listener.assert_not_called()
+            coordinator.async_set_updated_data.assert_not_called()
+            assert coordinator.data is live_data
+            assert live_data.status is live_status
+            await coordinator.async_shutdown()
+
+        asyncio.run(_run())
+
+    def test_no_registered_entities_skips_replay(
+        self, make_coordinator: Callable[..., ElegooDataUpdateCoordinator]
+    ) -> None:
+        async def _run() -> None:
+            coordinator = _coordinator(
+                make_coordinator, [_status(ElegooPrintStatus.COMPLETE)]
+            )
+            listener = MagicMock()
+            coordinator.async_add_listener(listener)
+
+            await coordinator._async_update_data()
+
+            listener.assert_not_called()
+            assert (
+                coordinator.data
+                is coordinator.config_entry.runtime_data.api.printer_data
+            )
+            await coordinator.async_shutdown()
+
+        asyncio.run(_run())
@@ -0,0 +1,106 @@
+"""Tests for skipping state writes of unchanged entities."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, Mock
+
+from custom_components.elegoo_printer.binary_sensor import ElegooPrinterBinarySensor
+from custom_components.elegoo_printer.definitions import (
+    ElegooPrinterBinarySensorEntityDescription,
+    ElegooPrinterSensorEntityDescription,
+)
+from custom_components.elegoo_printer.sdcp.models.printer import PrinterData
+from custom_components.elegoo_printer.sdcp.models.status import PrinterStatus
+from custom_components.elegoo_printer.sensor import ElegooPrinterSensor
+
+
+def _sensor() -> tuple[ElegooPrinterSensor, MagicMock]:
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.data = PrinterData()
+    coordinator.generate_unique_id.return_value = "test_current_layer"
+    description = ElegooPrinterSensorEntityDescription(
+        key="current_layer",
+        value_fn=lambda printer_data: printer_data.status.print_info.current_layer,
+    )
+    sensor = ElegooPrinterSensor(coordinator, description)
+    sensor.async_write_ha_state = MagicMock()
+    return sensor, coordinator
+
+
+class TestStateChangeDetection:
+    """Sensors only write state when their outputs change."""
+
+    def test_unchanged_value_skips_write(self) -> None:
+        sensor, _ = _sensor()
+
+        sensor._handle_coordinator_update()
+        sensor._handle_coordinator_update()
+
+        sensor.async_write_ha_state.assert_called_once_with()
+
+    def test_unchanged_binary_sensor_skips_write(self) -> None:
+        coordinator = MagicMock()
+        coordinator.last_update_success = True
+        coordinator.data = PrinterData()
+        coordinator.generate_unique_id.return_value = "test_usb_disk_status"
+        description = ElegooPrinterBinarySensorEntityDescription(
+            key="usb_disk_status",
+            value_fn=lambda printer_data: printer_data.attributes.usb_disk_status,
+        )
+        binary_sensor = ElegooPrinterBinarySensor(coordinator, description)
+        binary_sensor.async_write_ha_state = MagicMock()
+
+        binary_sensor._handle_coordinator_update()
+        binary_sensor._handle_coordinator_update()
+
+        binary_sensor.async_write_ha_state.assert_called_once_with()
+
+    def test_changed_value_writes(self) -> None:
+        sensor, coordinator = _sensor()
+        sensor._handle_coordinator_update()
+
+        coordinator.data.status = PrinterStatus({"PrintInfo": {"CurrentLayer": 10}})
+        sensor._handle_coordinator_update()
+
+        assert sensor.async_write_ha_state.call_count == 2
+
+    def test_attribute_changed_in_place_writes(self) -> None:
+        sensor, _ = _sensor()
+        live_attributes = {"slots": [{"color": "red"}]}
+        sensor.entity_description = ElegooPrinterSensorEntityDescription(
+            key="current_layer",
+            value_fn=lambda printer_data: printer_data.status.print_info.current_layer,
+            extra_attributes=lambda _entity: live_attributes,
+        )
+        sensor._handle_coordinator_update()
+
+        live_attributes["slots"][0]["color"] = "blue"
+        sensor._handle_coordinator_update()
+
+        assert sensor.async_write_ha_state.call_count == 2
+
+    def test_availability_change_writes(self) -> None:
+        sensor, coordinator = _sensor()
+        sensor._handle_coordinator_update()
+
+        coordinator.last_update_success = False
+        sensor._handle_coordinator_update()
+
+        assert sensor.async_write_ha_state.call_count == 2
+
+    def test_write_reuses_fingerprint_values(self) -> None:
+        sensor, coordinator = _sensor()
+        value_fn = Mock(return_value=10)
+        sensor.entity_description = ElegooPrinterSensorEntityDescription(
+            key="current_layer", value_fn=value_fn
+        )
+        written = []
+        sensor.async_write_ha_state = lambda: written.append(
+            (sensor.available, sensor.native_value)
+        )
+
+        sensor._handle_coordinator_update()
+
+        assert written == [(True, 10)]
+        value_fn.assert_called_once_with(coordinator.data)
@@ -17,12 +17,12 @@ from aiohttp.client import ClientWSTimeout
 
 from custom_components.elegoo_printer.const import (
     DEFAULT_BROADCAST_ADDRESS,
-    DEFAULT_FALLBACK_IP,
     DISCOVERY_MESSAGE,
     DISCOVERY_PORT,
     DISCOVERY_TIMEOUT,
     WEBSOCKET_PORT,
 )
+from custom_components.elegoo_printer.sdcp import json_codec
 from custom_components.elegoo_printer.sdcp.const import (
     CMD_CONTINUE_PRINT,
     CMD_CONTROL_DEVICE,
@@ -44,6 +44,7 @@ from custom_components.elegoo_printer.sdcp.exceptions import (
     ElegooPrinterNotConnectedError,
     ElegooPrinterTimeoutError,
 )
+from custom_components.elegoo_printer.sdcp.local_route import resolve_local_ip
 from custom_components.elegoo_printer.sdcp.models.ams import AMSStatus
 from custom_components.elegoo_printer.sdcp.models.attributes import PrinterAttributes
 from custom_components.elegoo_printer.sdcp.models.print_history_detail import (
@@ -59,6 +60,7 @@ from custom_components.elegoo_printer.sdcp.models.status import (
     PrinterStatus,
 )
 from custom_components.elegoo_printer.sdcp.models.video import ElegooVideo
+from custom_components.elegoo_printer.sdcp.push import DataListenerMixin
 
 if TYPE_CHECKING:
     from custom_components.elegoo_printer.cc2.gcode_proxy import GCodeProxyClient
@@ -74,7 +76,7 @@ DEFAULT_PORT = 54780
 GCODE_PROXY_RETRY_SECONDS = 60
 
 
-class ElegooPrinterClient:
+class ElegooPrinterClient(DataListenerMixin):
     """
     Client for interacting with an Elegoo printer.
 
@@ -442,7 +444,7 @@ class ElegooPrinterClient:
 
         if self.printer_websocket:
             try:
-                await self.printer_websocket.send_str(json.dumps(payload))
+                await self.printer_websocket.send_str(json_codec.dumps(payload))
                 await asyncio.wait_for(event.wait(), timeout=10)
             except TimeoutError as e:
                 # Command-level timeout: keep the connection alive
@@ -529,13 +531,7 @@ class ElegooPrinterClient:
             The local IP address, or "127.0.0.1" if detection fails.
 
         """
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-                # Doesn't have to be reachable
-                s.connect((self.ip_address or DEFAULT_FALLBACK_IP, 1))
-                return s.getsockname()[0]
-        except (socket.gaierror, OSError):
-            return "127.0.0.1"
+        return resolve_local_ip(self.ip_address) or "127.0.0.1"
 
     def _save_discovered_printer(self, data: bytes) -> Printer | None:
         """
@@ -647,7 +643,7 @@ class ElegooPrinterClient:
 
         """
         try:
-            data = json.loads(response)
+            data = json_codec.loads(response)
             topic = data.get("Topic")
             if topic:
                 match topic.split("/")[1]:
@@ -720,14 +716,13 @@ class ElegooPrinterClient:
         if DEBUG:
             msg = f"status >> \n{json.dumps(data, indent=5)}"
             self.logger.info(msg)
-        printer_status = PrinterStatus.from_json(
-            json.dumps(data), self.printer.printer_type
-        )
+        printer_status = PrinterStatus(data, self.printer.printer_type)
         self.printer_data.status = printer_status
         self._maybe_fetch_gcode_filament(
             printer_status.print_info.filename,
             printer_status.print_info.task_id,
         )
+        self._notify_data_listener()
 
     def _maybe_fetch_gcode_filament(
         self, filename: str | None, task_id: str | None
@@ -794,10 +789,11 @@ class ElegooPrinterClient:
         if DEBUG:
             msg = f"attributes >> \n{json.dumps(data, indent=5)}"
             self.logger.info(msg)
-        printer_attributes = PrinterAttributes.from_json(json.dumps(data))
+        printer_attributes = PrinterAttributes(data)
         self.printer_data.attributes = printer_attributes
         if self.printer:
             self.printer.sync_from_attributes(printer_attributes)
+        self._notify_data_listener()
 
     def _print_history_handler(self, data_data: dict[str, Any]) -> None:
         """Parse and updates the printer's print history details from the data."""
@@ -0,0 +1,143 @@
+"""
+In-memory asset cache for the Elegoo Printer Proxy Server.
+
+The printer's embedded HTTP server is slow, and its web UI ships large
+JavaScript bundles that the proxy has to rewrite. Static assets are kept in a
+small LRU together with their rewritten variants. Fresh entries are served
+without contacting the printer; stale ones are revalidated with a conditional
+request so an unchanged asset costs the printer a 304 instead of the body.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .utils import (
+    ASSET_CACHE_FRESHNESS,
+    ASSET_CACHE_MAX_BYTES,
+    ASSET_CACHE_MAX_ENTRIES,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+
+def variant_etag(etag: str | None, tag: str) -> str | None:
+    """Return the ETag of a rewritten variant of an upstream response."""
+    if not etag:
+        return None
+    opaque = etag.removeprefix("W/").strip('"')
+    return f'W/"{opaque}-{tag}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return True if an If-None-Match header matches an ETag (weakly)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidate = etag.removeprefix("W/")
+    return any(
+        value.strip().removeprefix("W/") == candidate
+        for value in if_none_match.split(",")
+    )
+
+
+@dataclass
+class CachedAsset:
+    """An upstream response body with its validators and rewritten variants."""
+
+    headers: dict[str, str]
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    encoding: str = "utf-8"
+    transformable: bool = False
+    validated_at: float = field(default_factory=time.monotonic)
+    variants: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Return the bytes held by the raw body and all variants."""
+        return len(self.body) + sum(len(body) for body in self.variants.values())
+
+    def is_fresh(
+        self, now: float | None = None, max_age: float = ASSET_CACHE_FRESHNESS
+    ) -> bool:
+        """Return True if the asset can be served without revalidation."""
+        now = time.monotonic() if now is None else now
+        return now - self.validated_at < max_age
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the headers that revalidate this asset upstream."""
+        headers = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+    def not_modified_for(
+        self, request_headers: Mapping[str, str], etag: str | None
+    ) -> bool:
+        """Return True if a client's conditional headers match this asset."""
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            return etag is not None and _etag_matches(if_none_match, etag)
+        if_modified_since = request_headers.get("if-modified-since")
+        return (
+            if_modified_since is not None
+            and self.last_modified is not None
+            and if_modified_since == self.last_modified
+        )
+
+
+class AssetCache:
+    """Least-recently-used cache of assets, bounded by count and total size."""
+
+    def __init__(
+        self,
+        max_entries: int = ASSET_CACHE_MAX_ENTRIES,
+        max_bytes: int = ASSET_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[Hashable, tuple[CachedAsset, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached assets."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> CachedAsset | None:
+        """Return a cached asset and mark it as recently used."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        self._entries.move_to_end(key)
+        return item[0]
+
+    def put(self, key: Hashable, asset: CachedAsset) -> None:
+        """
+        Cache an asset, evicting the least recently used ones to make room.
+
+        Call again after adding a variant so its size is accounted for.
+        """
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        size = asset.size
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (asset, size)
+        self.size += size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+
+    def clear(self) -> None:
+        """Drop every cached asset."""
+        self._entries.clear()
+        self.size = 0
@@ -8,12 +8,12 @@ clients to discover printers through the centralized proxy.
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import time
 from typing import TYPE_CHECKING, Any
 
 from custom_components.elegoo_printer.const import DISCOVERY_MESSAGE
+from custom_components.elegoo_printer.sdcp import json_codec
 
 from .utils import DISCOVERY_RATE_LIMIT_SECONDS
 
@@ -90,9 +90,9 @@ class DiscoveryProtocol(asyncio.DatagramProtocol):
                         },
                     },
                 }
-                json_string = json.dumps(response_payload)
+                message = json_codec.dumps_bytes(response_payload)
                 if self.transport:
-                    self.transport.sendto(json_string.encode(), addr)
+                    self.transport.sendto(message, addr)
                     self.logger.debug(
                         "Sent proxy discovery response (no printers found)"
                     )
@@ -124,9 +124,9 @@ class DiscoveryProtocol(asyncio.DatagramProtocol):
                             },
                         },
                     }
-                    json_string = json.dumps(response_payload)
+                    message = json_codec.dumps_bytes(response_payload)
                     if self.transport:
-                        self.transport.sendto(json_string.encode(), addr)
+                        self.transport.sendto(message, addr)
                         self.logger.debug(
                             "Sent discovery response for %s via centralized proxy",
                             ip,
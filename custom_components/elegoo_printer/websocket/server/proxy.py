@@ -11,26 +11,34 @@ import asyncio
 import json
 import re
 import socket
-from math import floor
+import time
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, NamedTuple
 from urllib.parse import parse_qs, parse_qsl, urlencode, urlsplit, urlunsplit
 
 import aiohttp
-from aiohttp import ClientResponse, ClientSession, WSMsgType, web
+from aiohttp import ClientResponse, ClientSession, WSCloseCode, WSMsgType, web
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from custom_components.elegoo_printer.const import (
     DEFAULT_FALLBACK_IP,
     DISCOVERY_PORT,
+    EVENT_UPLOAD_PROGRESS,
     LOGGER,
     VIDEO_PORT,
     WEBSOCKET_PORT,
 )
+from custom_components.elegoo_printer.sdcp import json_codec
 from custom_components.elegoo_printer.sdcp.models.printer import PrinterData
 
+from .cache import AssetCache, CachedAsset, variant_etag
 from .discovery import DiscoveryProtocol
 from .registry import PrinterRegistry
+from .rewrite import LiteralRewriter, printer_rewriter
+from .upload import UploadProgress, UploadRelay
+from .upstream import SharedPrinterConnection, extract_request_id
 from .utils import (
+    ASSET_CACHE_MAX_ASSET_BYTES,
     CACHEABLE_MIME_TYPES,
     INADDR_ANY,
     MAX_LOG_LENGTH,
@@ -38,7 +46,11 @@ from .utils import (
     MIN_MAINBOARD_ID_LENGTH,
     MIN_PATH_PARTS_FOR_FALLBACK,
     MIN_VIDEO_PATH_PARTS,
+    PRINTER_CONNECT_TIMEOUT,
+    PRINTER_CONNECT_WAIT,
     TRANSFORMABLE_MIME_TYPES,
+    UPLOAD_SLOTS_PER_PRINTER,
+    VIDEO_URL_PATTERN,
     extract_mainboard_id_from_header,
     extract_mainboard_id_from_topic,
     get_local_ip,
@@ -46,6 +58,7 @@ from .utils import (
     get_response_headers,
     set_caching_headers,
 )
+from .video import VideoStreamBusyError, VideoStreamHub
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -53,6 +66,9 @@ if TYPE_CHECKING:
     from custom_components.elegoo_printer.sdcp.models.printer import Printer
 
 
+CHARSET_PATTERN = re.compile(r"charset=(.+?)(;|$)")
+
+
 # Port configuration for cleanup operations
 class PortConfig(NamedTuple):
     """Configuration for port cleanup operations."""
@@ -91,6 +107,16 @@ class ElegooPrinterServer:
         self._is_connected = False
         self.datagram_transport: asyncio.DatagramTransport | None = None
         self.printer_registry = PrinterRegistry()
+        # One shared upstream WebSocket per printer, keyed by MainboardID
+        self._printer_connections: dict[str, SharedPrinterConnection] = {}
+        # One shared MJPEG reader per printer, keyed by MainboardID
+        self._video_hubs: dict[str, VideoStreamHub] = {}
+        # Static web UI assets keyed by printer and upstream URL
+        self._asset_cache = AssetCache()
+        # Upload slots per printer so large uploads do not overlap
+        self._upload_slots: dict[str, asyncio.Semaphore] = {}
+        # Printer connects still in flight for multi-printer clients
+        self._late_attaches: dict[web.WebSocketResponse, set[asyncio.Task]] = {}
 
     @classmethod
     def get_next_available_ports(cls) -> tuple[int, int]:
@@ -325,6 +351,17 @@ class ElegooPrinterServer:
         """Stop the proxy server and cleanup resources."""
         self._is_connected = False
 
+        # Close the shared printer WebSockets
+        for connection in list(self._printer_connections.values()):
+            await connection.close()
+        self._printer_connections.clear()
+
+        # Close the shared video streams
+        for hub in list(self._video_hubs.values()):
+            await hub.close()
+        self._video_hubs.clear()
+        self._asset_cache.clear()
+
         # Stop all HTTP runners
         for runner in self.runners:
             try:
@@ -514,68 +551,27 @@ class ElegooPrinterServer:
         if not printer:
             return web.Response(status=404, text="Printer not found")
 
-        # Clean and forward to printer's video endpoint
-        cleaned_path = self._get_cleaned_path_for_printer(request.path)
-        q = [
-            (k, v)
-            for k, v in parse_qsl(request.query_string, keep_blank_values=True)
-            if k.lower() not in ("id", "mainboard_id")
-        ]
-        query_string = f"?{urlencode(q, doseq=True)}" if q else ""
-        remote_url = (
-            f"http://{printer.ip_address}:{VIDEO_PORT}{cleaned_path}{query_string}"
-        )
+        # All viewers of a printer share one upstream reader. Viewer query
+        # strings (e.g. cache busters) and headers are not forwarded, since
+        # the stream they would select is shared.
+        hub = self._video_hubs.get(printer.id)
+        if hub is None or hub.closed:
+            cleaned_path = self._get_cleaned_path_for_printer(request.path)
+            hub = VideoStreamHub(
+                self.video_session,
+                f"http://{printer.ip_address}:{VIDEO_PORT}{cleaned_path}",
+                {},
+                self.logger,
+                on_close=self._remove_video_hub,
+            )
+            self._video_hubs[printer.id] = hub
+        remote_url = hub.url
 
         try:
-            async with self.video_session.get(
-                remote_url,
-                headers=get_request_headers("GET", request.headers),
-            ) as proxy_response:
-                resp_headers = get_response_headers("GET", proxy_response.headers)
-                resp_headers.pop("content-length", None)
-                response = web.StreamResponse(
-                    status=proxy_response.status,
-                    reason=proxy_response.reason,
-                    headers=resp_headers,
-                )
-                await response.prepare(request)
-                try:
-                    # For MJPEG streams, use iter_any() to avoid breaking boundaries
-                    content_type = proxy_response.headers.get("content-type", "")
-                    if (
-                        "multipart" in content_type.lower()
-                        or "mjpeg" in content_type.lower()
-                        or "mjpeg" in request.path.lower()
-                    ):
-                        # Use iter_any() for MJPEG to preserve multipart boundaries
-                        async for chunk in proxy_response.content.iter_any():
-                            if (
-                                request.transport is None
-                                or request.transport.is_closing()
-                            ):
-                                self.logger.debug(
-                                    "Client disconnected, stopping video stream."
-                                )
-                                break
-                            await response.write(chunk)
-                    else:
-                        # Use chunked reading for other content types
-                        async for chunk in proxy_response.content.iter_chunked(8192):
-                            if (
-                                request.transport is None
-                                or request.transport.is_closing()
-                            ):
-                                self.logger.debug(
-                                    "Client disconnected, stopping video stream."
-                                )
-                                break
-                            await response.write(chunk)
-                    await response.write_eof()
-                except (ConnectionResetError, asyncio.CancelledError) as e:
-                    self.logger.debug("Video stream stopped: %s", e)
-                except (aiohttp.ClientError, TimeoutError, OSError):
-                    self.logger.exception("Unexpected video streaming error")
-                return response
+            queue = await hub.subscribe()
+        except VideoStreamBusyError as e:
+            self.logger.debug("Video stream busy: %s", e)
+            return web.Response(status=503, text="Video stream in use")
         except TimeoutError as e:
             self.logger.debug("Video stream timeout from %s: %s", remote_url, e)
             return web.Response(status=504, text="Video stream not available")
@@ -583,31 +579,81 @@ class ElegooPrinterServer:
             self.logger.debug("Video stream not available from %s: %s", remote_url, e)
             return web.Response(status=502, text="Video stream not available")
 
-    async def _connect_to_printer(
-        self, request: web.Request, printer: Printer
-    ) -> aiohttp.ClientWebSocketResponse | None:
-        """Connect to a specific printer's WebSocket."""
         try:
-            remote_ws_url = (
-                f"ws://{printer.ip_address}:{WEBSOCKET_PORT}{request.path_qs}"
-            )
-            remote_ws = await self.api_session.ws_connect(
-                remote_ws_url,
-                headers=get_request_headers("WS", request.headers),
-                heartbeat=10.0,
+            response = web.StreamResponse(
+                status=hub.status,
+                reason=hub.reason,
+                headers=hub.response_headers,
             )
-            self.logger.debug(
-                "Connected to printer %s (%s)", printer.name, printer.ip_address
-            )
-        except aiohttp.ClientError:
-            self.logger.warning(
-                "Failed to connect to printer %s (%s)",
-                printer.name,
-                printer.ip_address,
+            await response.prepare(request)
+            while (frame := await queue.get()) is not None:
+                if request.transport is None or request.transport.is_closing():
+                    self.logger.debug("Client disconnected, stopping video stream.")
+                    break
+                await response.write(frame)
+            await response.write_eof()
+        except (ConnectionResetError, asyncio.CancelledError) as e:
+            self.logger.debug("Video stream stopped: %s", e)
+        except (aiohttp.ClientError, TimeoutError, OSError):
+            self.logger.exception("Unexpected video streaming error")
+        finally:
+            hub.unsubscribe(queue)
+        return response
+
+    def _remove_video_hub(self, hub: VideoStreamHub) -> None:
+        """Forget a video hub once it has shut down."""
+        for mainboard_id, existing in list(self._video_hubs.items()):
+            if existing is hub:
+                del self._video_hubs[mainboard_id]
+
+    def _get_printer_connection(self, printer: Printer) -> SharedPrinterConnection:
+        """Return the shared upstream connection for a printer, creating it."""
+        connection = self._printer_connections.get(printer.id)
+        if connection is None:
+            mainboard_id = printer.id
+            connection = SharedPrinterConnection(
+                printer,
+                self.api_session,
+                self.logger,
+                lambda payload: self._rewrite_video_url(mainboard_id, payload),
             )
-            return None
-        else:
-            return remote_ws
+            self._printer_connections[printer.id] = connection
+        return connection
+
+    async def _attach_to_printer(
+        self,
+        request: web.Request,
+        printer: Printer,
+        client_ws: web.WebSocketResponse,
+    ) -> SharedPrinterConnection | None:
+        """Attach a client to the printer's shared upstream WebSocket."""
+        connection = self._get_printer_connection(printer)
+        # Attach before connecting so a concurrent detach never closes the
+        # connection between the two steps.
+        connection.attach(client_ws)
+        try:
+            connected = await connection.connect(request)
+        except asyncio.CancelledError:
+            await self._detach_from_printer(printer.id, connection, client_ws)
+            raise
+        if connected:
+            return connection
+        await self._detach_from_printer(printer.id, connection, client_ws)
+        return None
+
+    async def _detach_from_printer(
+        self,
+        mainboard_id: str,
+        connection: SharedPrinterConnection,
+        client_ws: web.WebSocketResponse,
+    ) -> None:
+        """Detach a client, closing the upstream once nobody is left on it."""
+        connection.detach(client_ws)
+        if connection.clients:
+            return
+        if self._printer_connections.get(mainboard_id) is connection:
+            del self._printer_connections[mainboard_id]
+        await connection.close()
 
     def _find_video_url_in_data(
         self, data: dict, max_depth: int = 3
@@ -631,191 +677,239 @@ class ElegooPrinterServer:
 
         return search(data)
 
-    async def _route_printer_to_client(
-        self,
-        mainboard_id: str,
-        remote_ws: aiohttp.ClientWebSocketResponse,
-        client_ws: web.WebSocketResponse,
-        printer_connections: dict[str, aiohttp.ClientWebSocketResponse],
-    ) -> None:
-        """Route messages from specific printer to client."""
-        try:
-            async for message in remote_ws:
-                if message.type == WSMsgType.TEXT:
-                    payload = message.data
-                    try:
-                        data = json.loads(payload)
-                        # Find and rewrite VideoUrl in nested data structures
-                        video_url, target = self._find_video_url_in_data(data)
-                        if video_url:
-                            video_url_str = str(video_url)
-
-                            # Get printer and external_ip from registry
-                            printer = self.printer_registry.get_printer_by_mainboard_id(
-                                mainboard_id
-                            )
-                            external_ip = (
-                                getattr(printer, "external_ip", None)
-                                if printer
-                                else None
-                            )
+    def _proxied_video_url(self, mainboard_id: str) -> str:
+        """Return the proxy's video URL for a printer, without a scheme."""
+        # Get printer and external_ip from registry
+        printer = self.printer_registry.get_printer_by_mainboard_id(mainboard_id)
+        external_ip = getattr(printer, "external_ip", None) if printer else None
 
-                            # Use external_ip if configured
-                            target_ip = (
-                                printer.ip_address if printer else DEFAULT_FALLBACK_IP
-                            )
-                            proxy_ip = PrinterData.get_local_ip(target_ip, external_ip)
+        # Use external_ip if configured
+        target_ip = printer.ip_address if printer else DEFAULT_FALLBACK_IP
+        proxy_ip = PrinterData.get_local_ip(target_ip, external_ip)
 
-                            # Handle URLs without scheme (e.g., "10.0.0.184:3031/video")
-                            if not video_url_str.startswith(("http://", "https://")):
-                                video_url_str = f"http://{video_url_str}"
+        # Build URL without scheme to match the printer's format
+        return f"{proxy_ip}:{VIDEO_PORT}/video?id={mainboard_id}"
 
-                            # Build URL without scheme to match original format
-                            modified_url = (
-                                f"{proxy_ip}:{VIDEO_PORT}/video?id={mainboard_id}"
-                            )
-                            target["VideoUrl"] = modified_url
-                            payload = json.dumps(data)
-                            self.logger.debug(
-                                "Rewrote VideoUrl from %s -> %s",
-                                video_url,
-                                modified_url,
-                            )
-                    except (
-                        json.JSONDecodeError,
-                        ValueError,
-                        TypeError,
-                        KeyError,
-                        AttributeError,
-                    ):
-                        # Not JSON or malformed: forward original payload
-                        self.logger.debug("Could not parse or rewrite VideoUrl")
-                    await client_ws.send_str(payload)
-                elif message.type == WSMsgType.BINARY:
-                    await client_ws.send_bytes(message.data)
-                elif message.type in (WSMsgType.CLOSE, WSMsgType.ERROR):
-                    break
-        except aiohttp.ClientError:
-            self.logger.exception(
-                "Error in printer-to-client routing for %s", mainboard_id
+    def _rewrite_video_url(self, mainboard_id: str, payload: str) -> str:
+        """
+        Point a VideoUrl in a printer frame at the proxy's video port.
+
+        Only video stream responses carry a VideoUrl, so every other frame is
+        returned untouched without being parsed. For the rest, the parsed frame
+        decides whether a VideoUrl sits on the Data path. If the key appears
+        only once, the URL is spliced into the frame in place; otherwise the
+        frame is re-serialized.
+        """
+        if '"VideoUrl"' not in payload:
+            return payload
+
+        try:
+            data = json_codec.loads(payload)
+            # Find and rewrite VideoUrl in nested data structures
+            video_url, target = self._find_video_url_in_data(data)
+            if not video_url:
+                return payload
+            modified_url = self._proxied_video_url(mainboard_id)
+            self.logger.debug(
+                "Rewrote VideoUrl from %s -> %s",
+                video_url,
+                modified_url,
             )
-        finally:
-            # Clean up this connection from the dict when done
-            printer_connections.pop(mainboard_id, None)
+            if payload.count('"VideoUrl"') == 1:
+                match = VIDEO_URL_PATTERN.search(payload)
+                if match is not None:
+                    # Keep the value JSON-escaped, without its quotes
+                    escaped = json_codec.dumps(modified_url)[1:-1]
+                    return payload[: match.start(1)] + escaped + payload[match.end(1) :]
+            target["VideoUrl"] = modified_url
+            return json_codec.dumps(data)
+        except (
+            json.JSONDecodeError,
+            ValueError,
+            TypeError,
+            KeyError,
+            AttributeError,
+        ):
+            # Not JSON or malformed: forward original payload
+            self.logger.debug("Could not parse or rewrite VideoUrl")
+            return payload
 
     async def _route_client_to_printers(
         self,
         client_ws: web.WebSocketResponse,
-        printer_connections: dict[str, aiohttp.ClientWebSocketResponse],
+        printer_connections: dict[str, SharedPrinterConnection],
     ) -> None:
-        """Route messages from client to appropriate printers."""
+        """
+        Route messages from client to appropriate printers.
+
+        Frames are only queued here; each printer connection has its own
+        writer, so a slow printer does not delay the others. A printer whose
+        queue is full makes this client wait for room instead of losing frames.
+        """
         try:
             async for message in client_ws:
                 if message.type == WSMsgType.TEXT:
                     message_data = message.data
                     try:
-                        data = json.loads(message_data)
+                        data = json_codec.loads(message_data)
                         topic = data.get("Topic", "")
                         mainboard_id = extract_mainboard_id_from_topic(topic)
+                        request_id = extract_request_id(data)
 
                         if mainboard_id and mainboard_id in printer_connections:
                             # Inject MainboardID into outgoing message if missing
                             if isinstance(data.get("Data"), dict):
                                 data["Data"]["MainboardID"] = mainboard_id
-                                message_data = json.dumps(data)
+                                message_data = json_codec.dumps(data)
                                 self.logger.debug(
                                     "Injected MainboardID %s into outgoing message",
                                     mainboard_id,
                                 )
                             await printer_connections[mainboard_id].send_str(
-                                message_data
+                                client_ws, message_data, request_id
                             )
                         else:
                             # Broadcast to all connected printers
-                            for remote_ws in printer_connections.values():
-                                await remote_ws.send_str(message_data)
-                    except (json.JSONDecodeError, KeyError, TypeError):
+                            await self._fan_out(
+                                client_ws, printer_connections, message_data, request_id
+                            )
+                    except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
                         # If we can't parse/modify the message, send it as-is
-                        for remote_ws in printer_connections.values():
-                            await remote_ws.send_str(message_data)
+                        await self._fan_out(
+                            client_ws, printer_connections, message_data
+                        )
                 elif message.type == WSMsgType.BINARY:
                     # Broadcast binary data to all printers
-                    for remote_ws in printer_connections.values():
-                        await remote_ws.send_bytes(message.data)
+                    await self._fan_out(client_ws, printer_connections, message.data)
                 elif message.type in (WSMsgType.CLOSE, WSMsgType.ERROR):
                     break
         except aiohttp.ClientError:
             self.logger.exception("Error in client-to-printer routing")
 
+    @staticmethod
+    async def _fan_out(
+        client_ws: web.WebSocketResponse,
+        printer_connections: dict[str, SharedPrinterConnection],
+        payload: str | bytes,
+        request_id: str | None = None,
+    ) -> None:
+        """Queue a client frame for every printer the client is attached to."""
+        # Late printers may be added while routing; iterate over a snapshot.
+        # Queue for all printers at once, so one full queue does not hold the
+        # frame back from the others.
+        await asyncio.gather(
+            *(
+                connection.send_bytes(client_ws, payload)
+                if isinstance(payload, bytes)
+                else connection.send_str(client_ws, payload, request_id)
+                for connection in list(printer_connections.values())
+            )
+        )
+
     async def _handle_specific_printer_connection(
         self,
         mainboard_id: str,
         request: web.Request,
         client_ws: web.WebSocketResponse,
-    ) -> list[asyncio.Task[None]]:
-        """Handle connection to a specific printer by MainboardID."""
+    ) -> dict[str, SharedPrinterConnection]:
+        """Attach a client to a specific printer by MainboardID."""
         printer = self.printer_registry.get_printer_by_mainboard_id(mainboard_id)
         if not printer:
             self.logger.warning("Printer with MainboardID %s not found", mainboard_id)
-            return []
-
-        remote_ws = await self._connect_to_printer(request, printer)
-        if not remote_ws:
-            return []
+            return {}
 
-        printer_connections = {mainboard_id: remote_ws}
-
-        # Start bidirectional routing tasks
-        tasks = []
-        tasks.append(
-            asyncio.create_task(
-                self._route_printer_to_client(
-                    mainboard_id, remote_ws, client_ws, printer_connections
-                )
-            )
-        )
-        tasks.append(
-            asyncio.create_task(
-                self._route_client_to_printers(client_ws, printer_connections)
-            )
-        )
-        return tasks
+        connection = await self._attach_to_printer(request, printer, client_ws)
+        if not connection:
+            return {}
+        return {printer.id: connection}
 
     async def _handle_multi_printer_connection(
         self,
         request: web.Request,
         client_ws: web.WebSocketResponse,
-    ) -> list[asyncio.Task[None]]:
-        """Handle connection to all available printers."""
-        printers = self.printer_registry.get_all_printers()
-        printer_connections: dict[str, aiohttp.ClientWebSocketResponse] = {}
-
-        for printer in printers.values():
-            if printer.id:
-                remote_ws = await self._connect_to_printer(request, printer)
-                if remote_ws:
-                    printer_connections[printer.id] = remote_ws
+    ) -> dict[str, SharedPrinterConnection]:
+        """
+        Attach a client to all available printers.
 
-        if not printer_connections:
-            return []
-
-        # Start routing tasks for all connected printers
-        tasks = []
-        for printer_id, remote_ws in printer_connections.items():
-            tasks.append(
-                asyncio.create_task(
-                    self._route_printer_to_client(
-                        printer_id, remote_ws, client_ws, printer_connections
-                    )
+        Printers are connected concurrently. The client waits at most
+        ``PRINTER_CONNECT_WAIT`` seconds; printers that come up later are
+        added to the returned mapping as they connect. Frames are delivered
+        from each printer as soon as its connection is open. If no printer
+        connects at all, the client is closed with an error.
+        """
+        printers = [
+            printer
+            for printer in self.printer_registry.get_all_printers().values()
+            if printer.id
+        ]
+        printer_connections: dict[str, SharedPrinterConnection] = {}
+        if not printers:
+            return printer_connections
+
+        def add_connection(printer: Printer, task: asyncio.Task) -> None:
+            if task.cancelled():
+                return
+            if task.exception() is not None:
+                self.logger.debug(
+                    "Gave up connecting to printer %s: %r",
+                    printer.name,
+                    task.exception(),
+                )
+                return
+            connection = task.result()
+            if connection is not None:
+                printer_connections[printer.id] = connection
+
+        # Tracked per client so cleanup can cancel connects still in flight
+        tasks = self._late_attaches.setdefault(client_ws, set())
+        for printer in printers:
+            task = asyncio.create_task(
+                asyncio.wait_for(
+                    self._attach_to_printer(request, printer, client_ws),
+                    PRINTER_CONNECT_TIMEOUT,
                 )
             )
+            task.add_done_callback(
+                lambda task, printer=printer: add_connection(printer, task)
+            )
+            task.add_done_callback(tasks.discard)
+            tasks.add(task)
 
-        tasks.append(
-            asyncio.create_task(
-                self._route_client_to_printers(client_ws, printer_connections)
+        _, pending = await asyncio.wait(set(tasks), timeout=PRINTER_CONNECT_WAIT)
+        if pending:
+            self.logger.debug(
+                "Still connecting to %d printer(s) for WebSocket client", len(pending)
+            )
+            watcher = asyncio.create_task(
+                self._close_if_no_printer_attaches(
+                    client_ws, pending, printer_connections
+                )
             )
+            watcher.add_done_callback(tasks.discard)
+            tasks.add(watcher)
+        elif not printer_connections:
+            await self._close_without_printers(client_ws)
+        return printer_connections
+
+    async def _close_if_no_printer_attaches(
+        self,
+        client_ws: web.WebSocketResponse,
+        attaches: set[asyncio.Task],
+        printer_connections: dict[str, SharedPrinterConnection],
+    ) -> None:
+        """Close a client once its printer connects have all failed."""
+        await asyncio.wait(attaches)
+        if not printer_connections:
+            await self._close_without_printers(client_ws)
+
+    async def _close_without_printers(self, client_ws: web.WebSocketResponse) -> None:
+        """Close a client that could not be attached to any printer."""
+        if client_ws.closed:
+            return
+        self.logger.warning("Could not connect WebSocket client to any printer")
+        await client_ws.close(
+            code=WSCloseCode.TRY_AGAIN_LATER, message=b"No printer available"
         )
-        return tasks
 
     async def _centralized_websocket_handler(
         self, request: web.Request
@@ -831,59 +925,50 @@ class ElegooPrinterServer:
             or query_params.get("mainboard_id", [None])[0]
         )
 
-        tasks: list[asyncio.Task[None]] = []
+        printer_connections: dict[str, SharedPrinterConnection] = {}
 
         try:
             if mainboard_id:
-                tasks = await self._handle_specific_printer_connection(
+                printer_connections = await self._handle_specific_printer_connection(
                     mainboard_id, request, client_ws
                 )
             else:
-                tasks = await self._handle_multi_printer_connection(request, client_ws)
-
-            if tasks:
-                # Wait for any task to complete
-                _, pending = await asyncio.wait(
-                    tasks, return_when=asyncio.FIRST_COMPLETED
+                printer_connections = await self._handle_multi_printer_connection(
+                    request, client_ws
                 )
 
-                # Cancel remaining tasks
-                for task in pending:
-                    task.cancel()
+            if printer_connections or self._late_attaches.get(client_ws):
+                # Printer frames are delivered by the shared connections; this
+                # returns once the client leaves or a printer closes it.
+                await self._route_client_to_printers(client_ws, printer_connections)
 
         except (aiohttp.ClientError, TimeoutError, OSError):
             self.logger.exception("Error in centralized WebSocket handler")
         finally:
             # Cleanup
-            await self._cleanup_websocket_connections(tasks, {}, client_ws)
+            await self._cleanup_websocket_connections(printer_connections, client_ws)
 
         return client_ws
 
     async def _cleanup_websocket_connections(
         self,
-        tasks: list[asyncio.Task[None]],
-        printer_connections: dict[str, aiohttp.ClientWebSocketResponse],
+        printer_connections: dict[str, SharedPrinterConnection],
         client_ws: web.WebSocketResponse,
     ) -> None:
-        """Clean up WebSocket connections and tasks."""
-        # Cancel any remaining tasks
-        for task in tasks:
-            if not task.done():
-                task.cancel()
+        """Detach a client from its printers and close it."""
+        late_attaches = self._late_attaches.pop(client_ws, set())
+        for task in late_attaches:
+            task.cancel()
+        if late_attaches:
+            await asyncio.gather(*late_attaches, return_exceptions=True)
 
-        # Close all printer connections (copy values to avoid iteration issues)
-        for remote_ws in list(printer_connections.values()):
-            if not remote_ws.closed:
-                await remote_ws.close()
+        for mainboard_id, connection in list(printer_connections.items()):
+            await self._detach_from_printer(mainboard_id, connection, client_ws)
 
         # Close client connection
         if not client_ws.closed:
             await client_ws.close()
 
-        # Wait for all tasks to complete
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-
     def _try_query_param_routing(self, request: web.Request) -> Printer | None:
         """Try to route based on query parameters."""
         query_params = parse_qs(request.query_string)
@@ -1071,7 +1156,7 @@ class ElegooPrinterServer:
         # Handle regular HTTP requests
         return await self._centralized_http_proxy_handler(request)
 
-    async def _centralized_http_proxy_handler(
+    async def _centralized_http_proxy_handler(  # noqa: PLR0911
         self, request: web.Request
     ) -> web.StreamResponse:
         """Handle HTTP requests by forwarding to the specified printer."""
@@ -1112,12 +1197,24 @@ class ElegooPrinterServer:
             cleaned_path,
         )
 
+        # Static assets are served from the proxy cache while fresh and
+        # revalidated upstream with our own validators once stale
+        cache_key = (printer.id, target_url) if request.method == "GET" else None
+        cached = self._asset_cache.get(cache_key) if cache_key else None
+        if cached is not None and cached.is_fresh():
+            return self._cached_asset_response(request, cached, cache_key, printer)
+        request_headers = get_request_headers(request.method, request.headers)
+        if cached is not None:
+            request_headers.pop("if-none-match", None)
+            request_headers.pop("if-modified-since", None)
+            request_headers.update(cached.conditional_headers())
+
         try:
             # Forward the request
             async with self.api_session.request(
                 request.method,
                 target_url,
-                headers=get_request_headers(request.method, request.headers),
+                headers=request_headers,
                 data=(
                     request.content
                     if request.method in ("POST", "PUT", "PATCH")
@@ -1127,6 +1224,15 @@ class ElegooPrinterServer:
                     total=None, sock_connect=10, sock_read=None
                 ),
             ) as upstream_response:
+                if (
+                    cached is not None
+                    and upstream_response.status == HTTPStatus.NOT_MODIFIED
+                ):
+                    cached.validated_at = time.monotonic()
+                    return self._cached_asset_response(
+                        request, cached, cache_key, printer
+                    )
+
                 # Determine response type and handle appropriately
                 content_type = upstream_response.headers.get("content-type", "")
                 is_transformable = any(
@@ -1136,6 +1242,14 @@ class ElegooPrinterServer:
                     mime_type in content_type for mime_type in CACHEABLE_MIME_TYPES
                 )
 
+                if cache_key and is_cacheable and self._is_storable(upstream_response):
+                    asset = await self._store_asset(
+                        cache_key, upstream_response, is_transformable=is_transformable
+                    )
+                    return self._cached_asset_response(
+                        request, asset, cache_key, printer
+                    )
+
                 # Prepare response headers
                 resp_headers = get_response_headers(
                     request.method, upstream_response.headers
@@ -1176,30 +1290,88 @@ class ElegooPrinterServer:
     ) -> web.StreamResponse:
         client_response.headers.pop("content-length", None)
         await client_response.prepare(request)
-        encoding = "utf-8"
-        content_type = client_response.headers.get("content-type")
-        if content_type:
-            matches = re.search(r"charset=(.+?)(;|$)", content_type)
-            if matches and matches[1]:
-                encoding = matches[1]
-        previous = ""
+        encoding = self._get_charset(client_response.headers.get("content-type"))
+        stream = self._get_rewriter(printer, encoding).stream()
         async for chunk in upstream_response.content.iter_any():
-            current = chunk.decode(encoding)
-            previous_length = len(previous)
-            if previous_length > 0:
-                combined = previous + current
-                replaced = self._process_replacements(combined, printer)
-                half_len = floor(len(replaced) / 2)
-                replaced_previous = replaced[:half_len]
-                await client_response.write(replaced_previous.encode(encoding))
-                previous = replaced[half_len:]
-            else:
-                previous = current
-
-        await client_response.write(previous.encode(encoding))
+            rewritten = stream.feed(chunk)
+            if rewritten:
+                await client_response.write(rewritten)
+        await client_response.write(stream.flush())
         await client_response.write_eof()
         return client_response
 
+    @staticmethod
+    def _get_charset(content_type: str | None) -> str:
+        """Return the charset declared in a Content-Type header."""
+        if content_type:
+            matches = CHARSET_PATTERN.search(content_type)
+            if matches and matches[1]:
+                return matches[1]
+        return "utf-8"
+
+    @staticmethod
+    def _is_storable(upstream_response: ClientResponse) -> bool:
+        """Return True if an upstream response can go in the asset cache."""
+        if (
+            upstream_response.status != HTTPStatus.OK
+            or "content-encoding" in upstream_response.headers
+        ):
+            return False
+        content_length = upstream_response.headers.get("content-length")
+        return (
+            content_length is not None
+            and content_length.isdigit()
+            and int(content_length) <= ASSET_CACHE_MAX_ASSET_BYTES
+        )
+
+    async def _store_asset(
+        self,
+        cache_key: tuple[str | None, str],
+        upstream_response: ClientResponse,
+        *,
+        is_transformable: bool,
+    ) -> CachedAsset:
+        """Read an upstream asset into the cache."""
+        headers = get_response_headers("GET", upstream_response.headers)
+        headers.pop("content-length", None)
+        asset = CachedAsset(
+            headers=headers,
+            body=await upstream_response.read(),
+            etag=upstream_response.headers.get("etag"),
+            last_modified=upstream_response.headers.get("last-modified"),
+            encoding=self._get_charset(upstream_response.headers.get("content-type")),
+            transformable=is_transformable,
+        )
+        self._asset_cache.put(cache_key, asset)
+        return asset
+
+    def _cached_asset_response(
+        self,
+        request: web.Request,
+        asset: CachedAsset,
+        cache_key: tuple[str | None, str],
+        printer: Printer,
+    ) -> web.Response:
+        """Serve a cached asset, rewriting it once per rewriter."""
+        body = asset.body
+        etag = asset.etag
+        if asset.transformable:
+            rewriter = self._get_rewriter(printer, asset.encoding)
+            etag = variant_etag(asset.etag, rewriter.tag)
+            body = asset.variants.get(rewriter.tag)
+            if body is None:
+                body = rewriter.rewrite(asset.body)
+                asset.variants[rewriter.tag] = body
+                # Re-insert so the variant counts towards the cache size
+                self._asset_cache.put(cache_key, asset)
+
+        headers = set_caching_headers(dict(asset.headers))
+        if etag:
+            headers["etag"] = etag
+        if asset.not_modified_for(request.headers, etag):
+            return web.Response(status=304, headers=headers)
+        return web.Response(status=200, body=body, headers=headers)
+
     async def _streamed_response(
         self,
         request: web.Request,
@@ -1224,47 +1396,23 @@ class ElegooPrinterServer:
             self.logger.exception("Unexpected error during streaming")
         return client_response
 
-    def _process_replacements(self, content: str, printer: Printer) -> str:
-        # Apply existing IP address and port replacements
-        replacements = [
-            (printer.ip_address or DEFAULT_FALLBACK_IP, get_local_ip()),
-            (f"{get_local_ip()}/", f"{get_local_ip()}:{WEBSOCKET_PORT}/"),
-            (
-                "${this.webSocketService.hostName}:80",
-                f"${{this.webSocketService.hostName}}:{WEBSOCKET_PORT}",
-            ),
-        ]
-
-        processed_content = content
-        for old, new in replacements:
-            processed_content = processed_content.replace(old, new)
-
-        # Apply JavaScript WebSocket URL transformations (for MainboardID routing)
-        if printer.id and f"?id={printer.id}" not in processed_content:
-            ws_replacements = [
-                (
-                    "ws://${this.hostName}:3030/websocket",
-                    f"ws://${{this.hostName}}:3030/websocket?id={printer.id}",
-                ),
-                (
-                    "http://${this.hostName}:3030/",
-                    f"http://${{this.hostName}}:3030/?id={printer.id}&",
-                ),
-                (
-                    'ws://" + this.hostName + ":3030/websocket',
-                    f'ws://" + this.hostName + ":3030/websocket?id={printer.id}',
-                ),
-                (
-                    "ws://localhost:3030/websocket",
-                    f"ws://localhost:3030/websocket?id={printer.id}",
-                ),
-            ]
-            for old, new in ws_replacements:
-                processed_content = processed_content.replace(old, new)
+    def _get_rewriter(
+        self, printer: Printer, encoding: str = "utf-8"
+    ) -> LiteralRewriter:
+        """Return the compiled web UI rewriter for a printer."""
+        return printer_rewriter(
+            printer.id,
+            printer.ip_address or DEFAULT_FALLBACK_IP,
+            get_local_ip(),
+            encoding,
+        )
 
-        return processed_content
+    def _process_replacements(self, content: str, printer: Printer) -> str:
+        return self._get_rewriter(printer).rewrite_str(content)
 
-    async def _centralized_file_handler(self, request: web.Request) -> web.Response:
+    async def _centralized_file_handler(
+        self, request: web.Request
+    ) -> web.StreamResponse:
         """Handle file upload requests by forwarding to the specified printer."""
         if not self.file_session or self.file_session.closed:
             return web.Response(
@@ -1289,25 +1437,96 @@ class ElegooPrinterServer:
         )
 
         try:
-            async with self.file_session.post(
+            return await self._relay_upload(
+                request,
+                printer,
                 remote_url,
-                headers=get_request_headers("POST", request.headers),
-                data=request.content,
-            ) as upstream_response:
-                # Read response content
-                response_content = await upstream_response.read()
-
-                # Return response to client
-                return web.Response(
-                    status=upstream_response.status,
-                    body=response_content,
-                    headers=get_response_headers("POST", upstream_response.headers),
-                )
-
+                get_request_headers("POST", request.headers),
+            )
         except aiohttp.ClientError as e:
             self.logger.debug("File upload proxy error: %s", e)
             return web.Response(status=502, text="Bad Gateway")
 
+    async def _relay_upload(
+        self,
+        request: web.Request,
+        printer: Printer,
+        remote_url: str,
+        headers: dict[str, str],
+    ) -> web.StreamResponse:
+        """Relay one upload POST to a printer, one upload per printer at a time."""
+        relay = UploadRelay(
+            request.content,
+            lambda progress: self._fire_upload_progress(printer, progress, "uploading"),
+        )
+        # Take the slot before reading any of the body, so the read timeout
+        # never runs while this upload waits for the one ahead of it
+        async with self._get_upload_slot(printer):
+            try:
+                await relay.read_fields()
+            except TimeoutError:
+                self.logger.debug("Upload client for %s stalled", printer.id)
+                return web.Response(status=408, text="Request Timeout")
+            try:
+                async with self.file_session.post(
+                    remote_url, headers=headers, data=relay.body()
+                ) as upstream_response:
+                    if upstream_response.status != HTTPStatus.OK:
+                        state = "failed"
+                    elif (
+                        relay.progress.total_size is not None
+                        and relay.progress.position >= relay.progress.total_size
+                    ):
+                        state = "complete"
+                    else:
+                        state = "uploading"
+                    self._fire_upload_progress(printer, relay.progress, state)
+
+                    client_response = web.StreamResponse(
+                        status=upstream_response.status,
+                        reason=upstream_response.reason,
+                        headers=get_response_headers("POST", upstream_response.headers),
+                    )
+                    return await self._streamed_response(
+                        request, client_response, upstream_response
+                    )
+            except (TimeoutError, aiohttp.ClientError):
+                self._fire_upload_progress(printer, relay.progress, "failed")
+                if not relay.timed_out:
+                    raise
+                # Leaving the slot lets the next upload to this printer start
+                self.logger.debug("Upload client for %s stalled", printer.id)
+                return web.Response(status=408, text="Request Timeout")
+
+    def _get_upload_slot(self, printer: Printer) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent uploads to a printer."""
+        key = printer.id or printer.ip_address
+        slot = self._upload_slots.get(key)
+        if slot is None:
+            slot = asyncio.Semaphore(UPLOAD_SLOTS_PER_PRINTER)
+            self._upload_slots[key] = slot
+        return slot
+
+    def _fire_upload_progress(
+        self, printer: Printer, progress: UploadProgress, state: str
+    ) -> None:
+        """Fire an upload progress event on the Home Assistant bus."""
+        self.hass.bus.async_fire(
+            EVENT_UPLOAD_PROGRESS,
+            {
+                "mainboard_id": printer.id,
+                "uuid": progress.uuid,
+                "state": state,
+                "position": progress.position,
+                "total_size": progress.total_size,
+                "progress": (
+                    round(progress.fraction * 100, 1)
+                    if progress.fraction is not None
+                    else None
+                ),
+            },
+        )
+
     async def _printer_http_proxy_handler(
         self, request: web.Request, printer: Printer
     ) -> web.StreamResponse:
@@ -1361,7 +1580,7 @@ class ElegooPrinterServer:
 
     async def _printer_file_handler(
         self, request: web.Request, printer: Printer
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Handle file upload requests for a specific printer (direct pass-through)."""
         if not self.file_session or self.file_session.closed:
             return web.Response(status=502, text="Bad Gateway: Proxy not configured")
@@ -1394,16 +1613,7 @@ class ElegooPrinterServer:
         }
 
         try:
-            async with self.file_session.post(
-                remote_url, headers=headers, data=request.content
-            ) as upstream_response:
-                response_content = await upstream_response.read()
-                return web.Response(
-                    status=upstream_response.status,
-                    body=response_content,
-                    headers=get_response_headers("POST", upstream_response.headers),
-                )
-
+            return await self._relay_upload(request, printer, remote_url, headers)
         except aiohttp.ClientError as e:
             self.logger.debug("Direct file upload proxy error: %s", e)
             return web.Response(status=502, text="Bad Gateway")
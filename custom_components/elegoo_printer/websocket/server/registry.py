@@ -14,6 +14,7 @@ from custom_components.elegoo_printer.const import (
     VIDEO_PORT,
     WEBSOCKET_PORT,
 )
+from custom_components.elegoo_printer.sdcp import json_codec
 from custom_components.elegoo_printer.sdcp.models.printer import Printer
 
 
@@ -32,6 +33,9 @@ class PrinterRegistry:
         self._printer_ports: dict[
             str, tuple[int, int]
         ] = {}  # IP -> (websocket_port, video_port)
+        # Case-folded MainboardID -> first printer in _printers with that ID.
+        # Two IPs can report one ID while a printer's old-IP entry lingers.
+        self._printers_by_id: dict[str, Printer] = {}
 
     def add_printer(self, printer: Printer) -> tuple[int, int]:
         """
@@ -44,7 +48,11 @@ class PrinterRegistry:
             Tuple of (websocket_port, video_port) assigned to this printer
 
         """
+        previous = self._printers.get(printer.ip_address)
         self._printers[printer.ip_address] = printer
+        if previous is not None:
+            self._reindex(previous)
+        self._reindex(printer)
 
         # For centralized routing, all printers use the same proxy ports
         ws_port = WEBSOCKET_PORT  # Centralized proxy port
@@ -65,19 +73,11 @@ class PrinterRegistry:
         """Get a printer by its MainboardID."""
         if not mainboard_id:
             return None
-
-        for printer in self._printers.values():
-            if printer.id and printer.id.lower() == mainboard_id.lower():
-                return printer
-        return None
+        return self._printers_by_id.get(mainboard_id.casefold())
 
     def get_all_printers_by_mainboard_id(self) -> dict[str, Printer]:
         """Get all printers mapped by their MainboardID."""
-        printers_by_id = {}
-        for printer in self._printers.values():
-            if printer.id:
-                printers_by_id[printer.id.lower()] = printer
-        return printers_by_id
+        return self._printers_by_id.copy()
 
     def count(self) -> int:
         """Return the number of registered printers."""
@@ -94,17 +94,29 @@ class PrinterRegistry:
             True if printer was removed, False if not found
 
         """
-        removed = ip_address in self._printers
-        if removed:
-            del self._printers[ip_address]
-            if ip_address in self._printer_ports:
-                del self._printer_ports[ip_address]
-        return removed
+        printer = self._printers.pop(ip_address, None)
+        if printer is None:
+            return False
+        self._reindex(printer)
+        self._printer_ports.pop(ip_address, None)
+        return True
 
     def clear(self) -> None:
         """Clear all registered printers."""
         self._printers.clear()
         self._printer_ports.clear()
+        self._printers_by_id.clear()
+
+    def _reindex(self, printer: Printer) -> None:
+        """Point the index entry for a printer's MainboardID at its first match."""
+        if not printer.id:
+            return
+        key = printer.id.casefold()
+        for registered in self._printers.values():
+            if registered.id and registered.id.casefold() == key:
+                self._printers_by_id[key] = registered
+                return
+        self._printers_by_id.pop(key, None)
 
     def _parse_discovery_response(self, data: bytes, logger: Any) -> Printer | None:
         """
@@ -119,7 +131,7 @@ class PrinterRegistry:
 
         """
         try:
-            response = json.loads(data.decode())
+            response = json_codec.loads(data)
             printer_data = response.get("Data", {})
 
             # Extract printer information
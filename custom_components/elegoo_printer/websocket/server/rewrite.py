@@ -0,0 +1,191 @@
+"""
+Streaming rewrite of the printer web UI for the Elegoo Printer Proxy Server.
+
+The printer's JavaScript hardcodes its own address and WebSocket URLs. The
+proxy rewrites them in one pass over the raw bytes with a single compiled
+pattern per printer, keeping only a carry-over window as long as the longest
+pattern between chunks.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from custom_components.elegoo_printer.const import WEBSOCKET_PORT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# (literal, replacement, literal is left alone when followed by this)
+RewriteRule = tuple[str, str, str | None]
+
+ID_QUERY = "?id="
+
+
+class LiteralRewriter:
+    """Replace many literals in a single pass over bytes."""
+
+    def __init__(self, rules: Iterable[RewriteRule], encoding: str = "utf-8") -> None:
+        """
+        Compile the rules into one pattern.
+
+        Args:
+            rules: The literals to replace. Longer literals win over shorter
+                ones starting at the same position.
+            encoding: The encoding of the content being rewritten.
+
+        """
+        self.encoding = encoding
+        self._replacements: dict[bytes, bytes] = {}
+        alternatives: list[tuple[bytes, bytes]] = []
+        self.window = 0
+        for old, new, unless_followed_by in rules:
+            old_bytes = old.encode(encoding)
+            if not old_bytes or old_bytes in self._replacements:
+                continue
+            self._replacements[old_bytes] = new.encode(encoding)
+            alternative = re.escape(old_bytes)
+            guard = b""
+            if unless_followed_by:
+                guard = unless_followed_by.encode(encoding)
+                alternative += b"(?!" + re.escape(guard) + b")"
+            alternatives.append((old_bytes, alternative))
+            self.window = max(self.window, len(old_bytes) + len(guard))
+        alternatives.sort(key=lambda item: len(item[0]), reverse=True)
+        self.pattern = (
+            re.compile(b"|".join(alternative for _, alternative in alternatives))
+            if alternatives
+            else None
+        )
+        # Stable identifier of the output, used to tag rewritten ETags
+        digest = hashlib.blake2s(digest_size=6)
+        for old, new in self._replacements.items():
+            digest.update(old + b"\0" + new + b"\0")
+        if self.pattern is not None:
+            digest.update(self.pattern.pattern)
+        self.tag = digest.hexdigest()
+
+    def rewrite(self, content: bytes) -> bytes:
+        """Rewrite a complete document."""
+        if self.pattern is None:
+            return content
+        return self.pattern.sub(self.replacement, content)
+
+    def rewrite_str(self, content: str) -> str:
+        """Rewrite a complete document held as text."""
+        return self.rewrite(content.encode(self.encoding)).decode(self.encoding)
+
+    def stream(self) -> RewriteStream:
+        """Return a stream that rewrites a document chunk by chunk."""
+        return RewriteStream(self)
+
+    def replacement(self, match: re.Match[bytes]) -> bytes:
+        """Return the replacement for a match of ``pattern``."""
+        return self._replacements[match[0]]
+
+
+class RewriteStream:
+    """Incremental rewrite of one document."""
+
+    def __init__(self, rewriter: LiteralRewriter) -> None:
+        """Initialize the stream with an empty carry-over window."""
+        self.rewriter = rewriter
+        self._carry = b""
+
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        Rewrite the next chunk.
+
+        Returns:
+            The rewritten output that can no longer be affected by later
+            chunks. Up to ``window`` bytes are held back.
+
+        """
+        pattern = self.rewriter.pattern
+        buffer = self._carry + chunk if self._carry else chunk
+        if pattern is None:
+            return buffer
+
+        # Matches starting before this point are complete, including any
+        # lookahead guard, so they can be rewritten now.
+        safe = len(buffer) - self.rewriter.window
+        if safe <= 0:
+            self._carry = buffer
+            return b""
+
+        output: list[bytes] = []
+        position = 0
+        for match in pattern.finditer(buffer):
+            if match.start() >= safe:
+                break
+            output.append(buffer[position : match.start()])
+            output.append(self.rewriter.replacement(match))
+            position = match.end()
+        flushed = max(position, safe)
+        output.append(buffer[position:flushed])
+        self._carry = buffer[flushed:]
+        return b"".join(output)
+
+    def flush(self) -> bytes:
+        """Rewrite and return whatever is left at the end of the document."""
+        carry, self._carry = self._carry, b""
+        return self.rewriter.rewrite(carry)
+
+
+@lru_cache(maxsize=32)
+def printer_rewriter(
+    printer_id: str | None,
+    printer_ip: str,
+    local_ip: str,
+    encoding: str = "utf-8",
+) -> LiteralRewriter:
+    """
+    Return the rewriter for a printer's web UI.
+
+    Args:
+        printer_id: The printer's MainboardID, injected into WebSocket URLs.
+        printer_ip: The printer's address, replaced by the proxy's.
+        local_ip: The proxy's address.
+        encoding: The encoding of the content being rewritten.
+
+    """
+    proxied = f"{local_ip}:{WEBSOCKET_PORT}/"
+    rules: list[RewriteRule] = [
+        # Point the printer's own address at the proxy port
+        (f"{printer_ip}/", proxied, None),
+        (printer_ip, local_ip, None),
+        (f"{local_ip}/", proxied, None),
+        (
+            "${this.webSocketService.hostName}:80",
+            f"${{this.webSocketService.hostName}}:{WEBSOCKET_PORT}",
+            None,
+        ),
+    ]
+    if printer_id:
+        # Route WebSocket and API URLs by MainboardID unless already routed
+        rules += [
+            (
+                "ws://${this.hostName}:3030/websocket",
+                f"ws://${{this.hostName}}:3030/websocket?id={printer_id}",
+                ID_QUERY,
+            ),
+            (
+                "http://${this.hostName}:3030/",
+                f"http://${{this.hostName}}:3030/?id={printer_id}&",
+                ID_QUERY,
+            ),
+            (
+                'ws://" + this.hostName + ":3030/websocket',
+                f'ws://" + this.hostName + ":3030/websocket?id={printer_id}',
+                ID_QUERY,
+            ),
+            (
+                "ws://localhost:3030/websocket",
+                f"ws://localhost:3030/websocket?id={printer_id}",
+                ID_QUERY,
+            ),
+        ]
+    return LiteralRewriter(rules, encoding)
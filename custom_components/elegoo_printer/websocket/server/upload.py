@@ -0,0 +1,158 @@
+"""
+File upload relay for the Elegoo Printer Proxy Server.
+
+SDCP clients upload files as a series of multipart POSTs to
+``/uploadFile/upload``. Each POST carries one piece of the file with its
+``Offset``, the file ``TotalSize``, the upload ``Uuid`` and the file MD5, so
+an interrupted upload resumes by re-sending the failed piece. The relay
+forwards each POST in bounded chunks and reads the small form fields that
+precede the file data to report progress, without decoding the multipart body.
+A client that sends nothing for ``UPLOAD_READ_TIMEOUT`` seconds is given up on,
+so a stalled upload cannot hold the printer's upload slot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .utils import (
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_FIELD_PEEK_BYTES,
+    UPLOAD_PROGRESS_INTERVAL,
+    UPLOAD_READ_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from aiohttp import StreamReader
+
+FIELD_PATTERN = re.compile(rb'name="([^"]+)"\r\n\r\n([^\r\n]*)\r\n')
+FILE_PART_MARKER = b'name="File"'
+
+
+@dataclass
+class UploadProgress:
+    """Progress of one upload POST within the whole file."""
+
+    uuid: str | None = None
+    offset: int = 0
+    total_size: int | None = None
+    bytes_sent: int = 0
+
+    @property
+    def position(self) -> int:
+        """Return the approximate position in the file reached so far."""
+        position = self.offset + self.bytes_sent
+        return min(position, self.total_size) if self.total_size else position
+
+    @property
+    def fraction(self) -> float | None:
+        """Return the uploaded fraction of the file, if its size is known."""
+        if not self.total_size:
+            return None
+        return self.position / self.total_size
+
+
+def parse_upload_fields(head: bytes) -> dict[str, str]:
+    """Return the simple form fields found in the start of a multipart body."""
+    fields = {}
+    for name, value in FIELD_PATTERN.findall(head):
+        fields[name.decode(errors="replace")] = value.decode(errors="replace")
+    return fields
+
+
+def _to_int(value: str | None) -> int | None:
+    return int(value) if value and value.isdigit() else None
+
+
+class UploadRelay:
+    """Relay one upload request body in bounded chunks, reporting progress."""
+
+    def __init__(
+        self,
+        content: StreamReader,
+        on_progress: Callable[[UploadProgress], None] | None = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        progress_interval: float = UPLOAD_PROGRESS_INTERVAL,
+        read_timeout: float = UPLOAD_READ_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the relay.
+
+        Args:
+            content: The incoming request body.
+            on_progress: Called at most every ``progress_interval`` seconds
+                while relaying.
+            chunk_size: Largest chunk read from the client at a time.
+            progress_interval: Minimum seconds between progress reports.
+            read_timeout: Seconds to wait for each read from the client.
+
+        """
+        self.content = content
+        self.on_progress = on_progress
+        self.chunk_size = chunk_size
+        self.progress_interval = progress_interval
+        self.read_timeout = read_timeout
+        self.progress = UploadProgress()
+        self.timed_out = False
+        self._head = b""
+        self._preamble = 0
+
+    async def read_fields(self) -> dict[str, str]:
+        """
+        Read the form fields that precede the file data.
+
+        At most ``UPLOAD_FIELD_PEEK_BYTES`` are read; they are replayed first
+        by ``body``.
+        """
+        head = bytearray()
+        while FILE_PART_MARKER not in head and len(head) < UPLOAD_FIELD_PEEK_BYTES:
+            chunk = await self._read(UPLOAD_FIELD_PEEK_BYTES - len(head))
+            if not chunk:
+                break
+            head += chunk
+        self._head = bytes(head)
+        marker = self._head.find(FILE_PART_MARKER)
+        data_start = self._head.find(b"\r\n\r\n", marker) if marker >= 0 else -1
+        # Only count file data towards progress, not the form fields
+        self._preamble = data_start + 4 if data_start >= 0 else 0
+        fields = parse_upload_fields(self._head)
+        self.progress.uuid = fields.get("Uuid")
+        self.progress.offset = _to_int(fields.get("Offset")) or 0
+        self.progress.total_size = _to_int(fields.get("TotalSize"))
+        return fields
+
+    async def body(self) -> AsyncIterator[bytes]:
+        """Yield the request body in chunks of at most ``chunk_size`` bytes."""
+        last_report = time.monotonic()
+        if self._head:
+            head, self._head = self._head, b""
+            self.progress.bytes_sent += len(head) - self._preamble
+            yield head
+        while chunk := await self._read(self.chunk_size):
+            self.progress.bytes_sent += len(chunk)
+            yield chunk
+            now = time.monotonic()
+            if self.on_progress and now - last_report >= self.progress_interval:
+                last_report = now
+                self.on_progress(self.progress)
+
+    async def _read(self, size: int) -> bytes:
+        """
+        Read up to ``size`` bytes from the client.
+
+        Raises:
+            TimeoutError: If the client sends nothing within ``read_timeout``.
+
+        """
+        try:
+            async with asyncio.timeout(self.read_timeout):
+                return await self.content.read(size)
+        except TimeoutError:
+            self.timed_out = True
+            raise
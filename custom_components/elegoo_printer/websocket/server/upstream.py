@@ -0,0 +1,429 @@
+"""
+Shared upstream WebSocket connections for the Elegoo Printer Proxy Server.
+
+SDCP printers only accept a handful of WebSocket connections, so the proxy
+keeps a single upstream connection per printer and fans it out to every
+downstream client. Responses are routed back to the client that sent the
+request by their RequestID; status, attributes and notice frames (and any
+response whose RequestID is unknown) are broadcast to all clients.
+
+Frames from clients are queued per printer and written by one writer task
+per connection, so a slow printer never holds up the clients or the other
+printers. Printer frames are likewise queued per client, so a slow client
+never holds up the printer or the other clients. Each queue is bounded. A
+client frame can be a print control such as stop or pause, so it is never
+dropped: when the printer's queue is full the sender waits for room, and a
+sender that still cannot queue its frame in time is closed. When a client's
+queue is full its oldest printer frame is dropped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from aiohttp import WSMsgType
+
+from custom_components.elegoo_printer.const import WEBSOCKET_PORT
+from custom_components.elegoo_printer.sdcp import json_codec
+
+from .utils import (
+    CLIENT_SEND_QUEUE_SIZE,
+    CLIENT_SEND_TIMEOUT,
+    PENDING_REQUEST_MAX,
+    PENDING_REQUEST_TTL,
+    PRINTER_SEND_QUEUE_SIZE,
+    PRINTER_SEND_TIMEOUT,
+    get_request_headers,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aiohttp import ClientSession, web
+
+    from custom_components.elegoo_printer.sdcp.models.printer import Printer
+
+
+def extract_request_id(data: Any) -> str | None:
+    """Return the RequestID of a decoded SDCP frame, if it has one."""
+    if not isinstance(data, dict):
+        return None
+    inner = data.get("Data")
+    if not isinstance(inner, dict):
+        return None
+    request_id = inner.get("RequestID")
+    return request_id if isinstance(request_id, str) and request_id else None
+
+
+@dataclass
+class SendStats:
+    """Counters for the frames sent in one direction of a connection."""
+
+    sent: int = 0
+    dropped: int = 0
+    timeouts: int = 0
+    failures: int = 0
+
+
+class SharedPrinterConnection:
+    """
+    One upstream WebSocket to a printer, shared by any number of clients.
+
+    The connection is opened by the first client that attaches and is closed
+    by the proxy once the last client detaches. If the printer drops the
+    connection, every attached client is closed so it can reconnect.
+    """
+
+    def __init__(
+        self,
+        printer: Printer,
+        session: ClientSession,
+        logger: Any,
+        transform: Callable[[str], str] | None = None,
+    ) -> None:
+        """
+        Initialize the shared connection.
+
+        Args:
+            printer: The printer to connect to.
+            session: The client session used to open the WebSocket.
+            logger: The logger to use.
+            transform: Optional rewrite applied once to each text frame before
+                it is sent to the clients.
+
+        """
+        self.printer = printer
+        self.session = session
+        self.logger = logger
+        self.transform = transform
+        self.clients: set[web.WebSocketResponse] = set()
+        # RequestID -> (client, monotonic time the request was sent)
+        self._pending: dict[str, tuple[web.WebSocketResponse, float]] = {}
+        # Printer frames waiting for each client, and the task writing them
+        self._client_outboxes: dict[
+            web.WebSocketResponse,
+            tuple[asyncio.Queue[tuple[str | bytes, bool]], asyncio.Task[None]],
+        ] = {}
+        self._remote_ws: aiohttp.ClientWebSocketResponse | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._connect_lock = asyncio.Lock()
+        self._outbox: asyncio.Queue[tuple[str | bytes, str | None]] = asyncio.Queue(
+            PRINTER_SEND_QUEUE_SIZE
+        )
+        self._writer_task: asyncio.Task[None] | None = None
+        self.stats = SendStats()
+        self.client_stats = SendStats()
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the upstream WebSocket is open."""
+        return self._remote_ws is not None and not self._remote_ws.closed
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of frames waiting to be sent to the printer."""
+        return self._outbox.qsize()
+
+    async def connect(self, request: web.Request) -> bool:
+        """
+        Open the upstream WebSocket unless it is already open.
+
+        Args:
+            request: The client request whose path and headers are forwarded.
+
+        Returns:
+            True if the upstream connection is open.
+
+        """
+        async with self._connect_lock:
+            if self.connected:
+                return True
+            remote_ws_url = (
+                f"ws://{self.printer.ip_address}:{WEBSOCKET_PORT}{request.path_qs}"
+            )
+            try:
+                self._remote_ws = await self.session.ws_connect(
+                    remote_ws_url,
+                    headers=get_request_headers("WS", request.headers),
+                    heartbeat=10.0,
+                )
+            except aiohttp.ClientError:
+                self.logger.warning(
+                    "Failed to connect to printer %s (%s)",
+                    self.printer.name,
+                    self.printer.ip_address,
+                )
+                return False
+            self.logger.debug(
+                "Connected to printer %s (%s)",
+                self.printer.name,
+                self.printer.ip_address,
+            )
+            # Frames a sender queued while the last connection was going away
+            self._clear_outbox()
+            self._reader_task = asyncio.create_task(self._read_loop(self._remote_ws))
+            self._writer_task = asyncio.create_task(self._write_loop(self._remote_ws))
+            return True
+
+    def attach(self, client_ws: web.WebSocketResponse) -> None:
+        """Start delivering printer frames to a client."""
+        if client_ws in self.clients:
+            return
+        self.clients.add(client_ws)
+        outbox: asyncio.Queue[tuple[str | bytes, bool]] = asyncio.Queue(
+            CLIENT_SEND_QUEUE_SIZE
+        )
+        task = asyncio.create_task(self._client_write_loop(client_ws, outbox))
+        self._client_outboxes[client_ws] = (outbox, task)
+
+    def detach(self, client_ws: web.WebSocketResponse) -> None:
+        """Stop delivering printer frames to a client."""
+        self.clients.discard(client_ws)
+        entry = self._client_outboxes.pop(client_ws, None)
+        # A writer detaching its own client finishes on its own
+        if entry is not None and entry[1] is not asyncio.current_task():
+            entry[1].cancel()
+        for request_id in [
+            request_id
+            for request_id, (owner, _) in self._pending.items()
+            if owner is client_ws
+        ]:
+            del self._pending[request_id]
+
+    async def send_str(
+        self,
+        client_ws: web.WebSocketResponse,
+        payload: str,
+        request_id: str | None = None,
+    ) -> None:
+        """
+        Queue a text frame for the printer on behalf of a client.
+
+        Args:
+            client_ws: The client that sent the frame.
+            payload: The frame to forward.
+            request_id: The frame's RequestID; its response is sent back to
+                ``client_ws`` only.
+
+        """
+        if not self.connected:
+            return
+        if request_id:
+            self._add_pending(request_id, client_ws)
+        await self._enqueue(client_ws, payload, request_id)
+
+    async def send_bytes(
+        self, client_ws: web.WebSocketResponse, payload: bytes
+    ) -> None:
+        """Queue a binary frame for the printer on behalf of a client."""
+        if self.connected:
+            await self._enqueue(client_ws, payload, None)
+
+    def _add_pending(self, request_id: str, client_ws: web.WebSocketResponse) -> None:
+        """Remember who sent a request, forgetting requests never answered."""
+        now = time.monotonic()
+        self._pending.pop(request_id, None)
+        # Entries are in send order, so expired ones are at the front
+        while self._pending:
+            oldest_id, (_, sent_at) = next(iter(self._pending.items()))
+            if (
+                now - sent_at < PENDING_REQUEST_TTL
+                and len(self._pending) < PENDING_REQUEST_MAX
+            ):
+                break
+            del self._pending[oldest_id]
+        self._pending[request_id] = (client_ws, now)
+
+    async def _enqueue(
+        self,
+        client_ws: web.WebSocketResponse,
+        payload: str | bytes,
+        request_id: str | None,
+    ) -> None:
+        """Queue a frame, waiting for room if the printer is behind."""
+        if not self._outbox.full():
+            self._outbox.put_nowait((payload, request_id))
+            return
+        try:
+            async with asyncio.timeout(PRINTER_SEND_TIMEOUT):
+                await self._outbox.put((payload, request_id))
+        except TimeoutError:
+            # Never drop the frame silently; closing tells the sender it was lost
+            if request_id:
+                self._pending.pop(request_id, None)
+            self.stats.dropped += 1
+            self.logger.warning(
+                "Printer %s is not keeping up, closing a WebSocket client whose "
+                "frame could not be queued (%d dropped)",
+                self.printer.ip_address,
+                self.stats.dropped,
+            )
+            self.detach(client_ws)
+            with contextlib.suppress(ConnectionResetError, aiohttp.ClientError):
+                await client_ws.close()
+
+    async def close(self) -> None:
+        """Close the upstream WebSocket and stop the reader."""
+        remote_ws = self._remote_ws
+        self._remote_ws = None
+        if remote_ws is not None and not remote_ws.closed:
+            await remote_ws.close()
+        for task in (self._reader_task, self._writer_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        for client_ws in list(self._client_outboxes):
+            self.detach(client_ws)
+        self._reader_task = None
+        self._writer_task = None
+        self._pending.clear()
+        self._clear_outbox()
+
+    def _clear_outbox(self) -> None:
+        """Forget every frame still waiting to be sent."""
+        while not self._outbox.empty():
+            self._outbox.get_nowait()
+
+    async def _write_loop(self, remote_ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Send queued client frames to the printer in order."""
+        while True:
+            payload, _ = await self._outbox.get()
+            try:
+                async with asyncio.timeout(PRINTER_SEND_TIMEOUT):
+                    if isinstance(payload, bytes):
+                        await remote_ws.send_bytes(payload)
+                    else:
+                        await remote_ws.send_str(payload)
+            except TimeoutError:
+                # A printer that cannot take a frame in time is treated as gone
+                self.stats.timeouts += 1
+                self.logger.warning(
+                    "Timed out sending to printer %s, closing its connection",
+                    self.printer.ip_address,
+                )
+                await remote_ws.close()
+                return
+            except (ConnectionResetError, aiohttp.ClientError) as e:
+                # Close the half-open socket so the read loop cleans up
+                self.stats.failures += 1
+                self.logger.debug(
+                    "Failed to send to printer %s, closing its connection: %s",
+                    self.printer.ip_address,
+                    e,
+                )
+                with contextlib.suppress(ConnectionResetError, aiohttp.ClientError):
+                    await remote_ws.close()
+                return
+            self.stats.sent += 1
+
+    async def _read_loop(self, remote_ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Fan printer frames out to the attached clients."""
+        try:
+            async for message in remote_ws:
+                if message.type == WSMsgType.TEXT:
+                    self._dispatch_text(message.data)
+                elif message.type == WSMsgType.BINARY:
+                    self._broadcast(message.data, binary=True)
+                elif message.type in (WSMsgType.CLOSE, WSMsgType.ERROR):
+                    break
+        except aiohttp.ClientError:
+            self.logger.exception(
+                "Error reading from printer %s", self.printer.ip_address
+            )
+        finally:
+            if self._remote_ws is remote_ws:
+                self._remote_ws = None
+                self._pending.clear()
+                if self._writer_task is not None:
+                    self._writer_task.cancel()
+                    self._writer_task = None
+                self._clear_outbox()
+                await self._close_clients()
+
+    def _dispatch_text(self, payload: str) -> None:
+        """Send a text frame to the client that asked for it, or to everyone."""
+        request_id = None
+        # Status and notice frames carry no RequestID; skip parsing them
+        if "RequestID" in payload:
+            with contextlib.suppress(json_codec.JSONDecodeError, ValueError, TypeError):
+                request_id = extract_request_id(json_codec.loads(payload))
+        if self.transform is not None:
+            payload = self.transform(payload)
+
+        pending = self._pending.pop(request_id, None) if request_id else None
+        owner = pending[0] if pending is not None else None
+        if owner is not None and owner in self.clients:
+            self._send(owner, payload, binary=False)
+        else:
+            self._broadcast(payload, binary=False)
+
+    def _broadcast(self, payload: str | bytes, *, binary: bool) -> None:
+        """Queue a frame for every attached client."""
+        for client_ws in list(self.clients):
+            self._send(client_ws, payload, binary=binary)
+
+    def _send(
+        self, client_ws: web.WebSocketResponse, payload: str | bytes, *, binary: bool
+    ) -> None:
+        """Queue a frame for one client, detaching it if it has gone away."""
+        entry = self._client_outboxes.get(client_ws)
+        if client_ws.closed or entry is None:
+            self.detach(client_ws)
+            return
+        outbox = entry[0]
+        if outbox.full():
+            outbox.get_nowait()
+            self.client_stats.dropped += 1
+            self.logger.debug(
+                "WebSocket client is not keeping up with printer %s, "
+                "dropped a frame (%d dropped)",
+                self.printer.ip_address,
+                self.client_stats.dropped,
+            )
+        outbox.put_nowait((payload, binary))
+
+    async def _client_write_loop(
+        self,
+        client_ws: web.WebSocketResponse,
+        outbox: asyncio.Queue[tuple[str | bytes, bool]],
+    ) -> None:
+        """Send queued printer frames to one client in order."""
+        while True:
+            payload, binary = await outbox.get()
+            try:
+                async with asyncio.timeout(CLIENT_SEND_TIMEOUT):
+                    if binary:
+                        await client_ws.send_bytes(payload)
+                    else:
+                        await client_ws.send_str(payload)
+            except TimeoutError:
+                # Closing the client ends its handler, which cleans up after it
+                self.client_stats.timeouts += 1
+                self.logger.warning(
+                    "Timed out sending printer %s frames to a WebSocket client, "
+                    "closing it",
+                    self.printer.ip_address,
+                )
+                self.detach(client_ws)
+                with contextlib.suppress(ConnectionResetError, aiohttp.ClientError):
+                    await client_ws.close()
+                return
+            except (ConnectionResetError, aiohttp.ClientError) as e:
+                self.client_stats.failures += 1
+                self.logger.debug("Dropping disconnected WebSocket client: %s", e)
+                self.detach(client_ws)
+                return
+            self.client_stats.sent += 1
+
+    async def _close_clients(self) -> None:
+        """Close every attached client after the printer went away."""
+        for client_ws in list(self.clients):
+            if not client_ws.closed:
+                with contextlib.suppress(ConnectionResetError, aiohttp.ClientError):
+                    await client_ws.close()
@@ -8,13 +8,13 @@ used across the proxy server components.
 from __future__ import annotations
 
 import re
-import socket
 from typing import TYPE_CHECKING
 
 from custom_components.elegoo_printer.const import (
     DEFAULT_FALLBACK_IP,
     PROXY_HOST,
 )
+from custom_components.elegoo_printer.sdcp.local_route import resolve_local_ip
 
 if TYPE_CHECKING:
     from multidict import CIMultiDictProxy
@@ -29,6 +29,35 @@ MIN_PATH_PARTS_FOR_FALLBACK = 2  # Minimum path parts needed for MainboardID fal
 MIN_API_PATH_PARTS = 3  # Minimum parts for /api/{MainboardID}/... pattern
 MIN_VIDEO_PATH_PARTS = 2  # Minimum parts for /video/{MainboardID} pattern
 MAX_LOG_LENGTH = 50  # Maximum length for log message truncation
+PRINTER_CONNECT_WAIT = 2.0  # Seconds a multi-printer client waits for slow printers
+PRINTER_CONNECT_TIMEOUT = 15.0  # Seconds before a pending printer connect is dropped
+PRINTER_SEND_QUEUE_SIZE = 32  # Client frames queued per printer before senders wait
+PRINTER_SEND_TIMEOUT = 10.0  # Seconds a printer may take to accept one frame
+CLIENT_SEND_QUEUE_SIZE = 64  # Printer frames queued per client before dropping
+CLIENT_SEND_TIMEOUT = 10.0  # Seconds a client may take to accept one frame
+PENDING_REQUEST_TTL = 60.0  # Seconds a RequestID is routed back to its client
+PENDING_REQUEST_MAX = 256  # RequestIDs remembered per printer connection
+
+# Matches the string value of a "VideoUrl" key in a raw printer frame
+VIDEO_URL_PATTERN = re.compile(r'"VideoUrl"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Video Streaming Configuration
+VIDEO_HUB_GRACE_PERIOD = 5.0  # Seconds an upstream stream outlives its last viewer
+VIDEO_HUB_QUEUE_SIZE = 2  # Frames buffered per viewer before dropping the oldest
+VIDEO_HUB_MAX_FRAME_SIZE = 4 * 1024 * 1024  # Discard partial frames beyond this
+
+# Upload Relay Configuration
+UPLOAD_CHUNK_SIZE = 256 * 1024  # Largest piece of an upload relayed at once
+UPLOAD_FIELD_PEEK_BYTES = 64 * 1024  # Read ahead to find the SDCP upload fields
+UPLOAD_PROGRESS_INTERVAL = 1.0  # Seconds between upload progress events
+UPLOAD_SLOTS_PER_PRINTER = 1  # Concurrent upload POSTs relayed to one printer
+UPLOAD_READ_TIMEOUT = 30.0  # Seconds a client may stall before its upload is dropped
+
+# Asset Cache Configuration
+ASSET_CACHE_MAX_ENTRIES = 64  # Rewritten web UI assets kept in memory
+ASSET_CACHE_MAX_BYTES = 32 * 1024 * 1024  # Total size of cached assets
+ASSET_CACHE_MAX_ASSET_BYTES = 8 * 1024 * 1024  # Larger assets are streamed
+ASSET_CACHE_FRESHNESS = 60.0  # Seconds an asset is served without revalidation
 
 # HTTP Header Configuration
 ALLOWED_REQUEST_HEADERS = {
@@ -188,12 +217,7 @@ def extract_mainboard_id_from_header(referer: str) -> str | None:
 
 def get_local_ip() -> str:
     """Determine the local IP address for outbound communication."""
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-            s.connect((DEFAULT_FALLBACK_IP, 1))
-            return s.getsockname()[0]
-    except Exception:  # noqa: BLE001
-        return PROXY_HOST
+    return resolve_local_ip(DEFAULT_FALLBACK_IP) or PROXY_HOST
 
 
 def get_request_headers(method: str, headers: CIMultiDictProxy[str]) -> dict[str, str]:
@@ -0,0 +1,284 @@
+"""
+MJPEG broadcast hubs for the Elegoo Printer Proxy Server.
+
+Printers only allow a small number of concurrent video streams (often one),
+so the proxy reads each printer stream once and fans the frames out to every
+viewer. Each viewer gets a small bounded queue; a slow viewer drops its oldest
+frames instead of holding back the others.
+
+A stream that is not multipart cannot be split into frames, so dropping data
+would corrupt it. Such a stream is relayed to a single viewer with
+backpressure, and further viewers are turned away while it lasts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import re
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from .utils import (
+    VIDEO_HUB_GRACE_PERIOD,
+    VIDEO_HUB_MAX_FRAME_SIZE,
+    VIDEO_HUB_QUEUE_SIZE,
+    get_response_headers,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from aiohttp import ClientResponse, ClientSession
+
+BOUNDARY_PATTERN = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+
+
+class VideoStreamBusyError(Exception):
+    """The printer stream cannot be shared and already has a viewer."""
+
+
+def extract_boundary(content_type: str) -> bytes | None:
+    """Return the multipart boundary declared in a Content-Type header."""
+    match = BOUNDARY_PATTERN.search(content_type)
+    if not match:
+        return None
+    boundary = match[1].strip()
+    # Some servers already include the leading dashes in the parameter
+    return boundary.removeprefix("--").encode() or None
+
+
+class MJPEGFrameParser:
+    """
+    Split a multipart MJPEG byte stream into complete parts.
+
+    Each part is returned with its leading boundary delimiter, so any part can
+    be the first thing a newly attached viewer receives.
+    """
+
+    def __init__(
+        self, boundary: bytes, max_frame_size: int = VIDEO_HUB_MAX_FRAME_SIZE
+    ) -> None:
+        """Initialize the parser for a boundary (without the leading dashes)."""
+        self.delimiter = b"--" + boundary
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk of the stream and return the parts it completed."""
+        buffer = self._buffer
+        buffer += chunk
+        start = buffer.find(self.delimiter)
+        if start < 0:
+            # Keep just enough to match a delimiter split across chunks
+            del buffer[: max(0, len(buffer) - len(self.delimiter))]
+            return []
+
+        frames: list[bytes] = []
+        while True:
+            end = buffer.find(self.delimiter, start + len(self.delimiter))
+            if end < 0:
+                break
+            frames.append(bytes(buffer[start:end]))
+            start = end
+        del buffer[:start]
+
+        if len(buffer) > self.max_frame_size:
+            buffer.clear()
+        return frames
+
+
+class VideoStreamHub:
+    """
+    One upstream MJPEG stream shared by every viewer of a printer.
+
+    The upstream is opened by the first subscriber and closed a grace period
+    after the last one leaves, so a page reload does not renegotiate the
+    printer's only stream slot.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        session: ClientSession,
+        url: str,
+        headers: Mapping[str, str],
+        logger: Any,
+        *,
+        on_close: Callable[[VideoStreamHub], None] | None = None,
+        grace_period: float = VIDEO_HUB_GRACE_PERIOD,
+        queue_size: int = VIDEO_HUB_QUEUE_SIZE,
+    ) -> None:
+        """
+        Initialize the hub.
+
+        Args:
+            session: The client session used to open the upstream stream.
+            url: The printer video URL.
+            headers: Request headers forwarded to the printer.
+            logger: The logger to use.
+            on_close: Called once the hub has shut down for good.
+            grace_period: Seconds to keep the upstream open without viewers.
+            queue_size: Frames buffered per viewer.
+
+        """
+        self.session = session
+        self.url = url
+        self.headers = headers
+        self.logger = logger
+        self.on_close = on_close
+        self.grace_period = grace_period
+        self.queue_size = queue_size
+        self.status = 200
+        self.reason: str | None = None
+        self.response_headers: dict[str, str] = {}
+        self.closed = False
+        # Set once the stream turned out not to be multipart MJPEG
+        self.exclusive = False
+        self._subscribers: set[asyncio.Queue[bytes | None]] = set()
+        self._upstream: ClientResponse | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._teardown_task: asyncio.Task[None] | None = None
+        self._close_task: asyncio.Task[None] | None = None
+        self._latest_frame: bytes | None = None
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Return the number of attached viewers."""
+        return len(self._subscribers)
+
+    async def subscribe(self) -> asyncio.Queue[bytes | None]:
+        """
+        Attach a viewer, opening the upstream stream if needed.
+
+        Returns:
+            A queue of frames for the viewer; ``None`` marks the end of stream.
+
+        Raises:
+            aiohttp.ClientError: If the printer stream cannot be opened.
+            TimeoutError: If the printer does not answer in time.
+            VideoStreamBusyError: If the stream is not MJPEG and already has
+                a viewer.
+
+        """
+        self._cancel_teardown()
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=self.queue_size)
+        async with self._start_lock:
+            if self.closed:
+                msg = f"Video stream {self.url} is closed"
+                raise aiohttp.ClientConnectionError(msg)
+            if self.exclusive:
+                msg = f"Video stream {self.url} cannot be shared"
+                raise VideoStreamBusyError(msg)
+            if self._latest_frame is not None:
+                queue.put_nowait(self._latest_frame)
+            # Subscribe before opening so no data is read before the first
+            # viewer is listening
+            self._subscribers.add(queue)
+            if self._upstream is None:
+                try:
+                    await self._open()
+                except BaseException:
+                    # Do not keep a hub around that never got a stream
+                    self._subscribers.discard(queue)
+                    await self.close()
+                    raise
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """Detach a viewer and schedule teardown if it was the last one."""
+        self._subscribers.discard(queue)
+        if self._subscribers or self.closed:
+            return
+        if self.exclusive:
+            # A raw stream cannot be joined midway, so there is nothing to keep
+            if self._close_task is None:
+                self._close_task = asyncio.create_task(self.close())
+        elif self._teardown_task is None:
+            self._teardown_task = asyncio.create_task(self._teardown_later())
+
+    async def close(self) -> None:
+        """Close the upstream stream and end every viewer's queue."""
+        if self.closed:
+            return
+        self.closed = True
+        self._cancel_teardown()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader_task
+            self._reader_task = None
+        self._release_upstream()
+        for queue in list(self._subscribers):
+            self._push(queue, None)
+        self._subscribers.clear()
+        if self.on_close is not None:
+            self.on_close(self)
+
+    async def _open(self) -> None:
+        """Open the upstream stream and start the reader."""
+        upstream = await self.session.get(self.url, headers=self.headers)
+        self.status = upstream.status
+        self.reason = upstream.reason
+        self.response_headers = get_response_headers("GET", upstream.headers)
+        self.response_headers.pop("content-length", None)
+        self._upstream = upstream
+        boundary = extract_boundary(upstream.headers.get("content-type", ""))
+        parser = MJPEGFrameParser(boundary) if boundary else None
+        self.exclusive = parser is None
+        self._reader_task = asyncio.create_task(self._read_loop(upstream, parser))
+        self.logger.debug("Opened shared video stream %s", self.url)
+
+    async def _read_loop(
+        self, upstream: ClientResponse, parser: MJPEGFrameParser | None
+    ) -> None:
+        """Read the printer stream and publish frames to the viewers."""
+        try:
+            async for chunk in upstream.content.iter_any():
+                if parser is None:
+                    # Not a multipart stream: relay every byte to its one viewer
+                    for queue in list(self._subscribers):
+                        await queue.put(chunk)
+                    continue
+                for frame in parser.feed(chunk):
+                    self._publish(frame)
+        except (aiohttp.ClientError, TimeoutError, OSError) as e:
+            self.logger.debug("Video stream %s stopped: %s", self.url, e)
+        if not self.closed:
+            # The printer ended the stream; let viewers finish and reconnect.
+            self._reader_task = None
+            await self.close()
+
+    def _publish(self, frame: bytes) -> None:
+        """Push a frame to every viewer."""
+        self._latest_frame = frame
+        for queue in self._subscribers:
+            self._push(queue, frame)
+
+    @staticmethod
+    def _push(queue: asyncio.Queue[bytes | None], frame: bytes | None) -> None:
+        """Put a frame on a viewer queue, dropping the oldest if it is full."""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(frame)
+
+    async def _teardown_later(self) -> None:
+        """Close the hub if nobody subscribes within the grace period."""
+        await asyncio.sleep(self.grace_period)
+        self._teardown_task = None
+        if not self._subscribers:
+            self.logger.debug("Closing idle video stream %s", self.url)
+            await self.close()
+
+    def _cancel_teardown(self) -> None:
+        """Cancel a pending teardown."""
+        if self._teardown_task is not None:
+            self._teardown_task.cancel()
+            self._teardown_task = None
+
+    def _release_upstream(self) -> None:
+        """Close the upstream response."""
+        if self._upstream is not None:
+            self._upstream.close()
+            self._upstream = None
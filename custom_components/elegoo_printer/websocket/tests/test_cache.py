@@ -0,0 +1,93 @@
+"""Tests for the proxy asset cache."""
+
+from custom_components.elegoo_printer.websocket.server.cache import (
+    AssetCache,
+    CachedAsset,
+    variant_etag,
+)
+
+
+def _asset(body: bytes, **kwargs: object) -> CachedAsset:
+    return CachedAsset(headers={}, body=body, **kwargs)
+
+
+class TestAssetCache:
+    """The asset cache is an LRU bounded by entry count and total size."""
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Test that reading an entry protects it from eviction."""
+        cache = AssetCache(max_entries=2)
+        cache.put("a", _asset(b"1"))
+        cache.put("b", _asset(b"2"))
+        assert cache.get("a").body == b"1"
+
+        cache.put("c", _asset(b"3"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").body == b"1"
+        assert cache.get("c").body == b"3"
+
+    def test_total_size_counts_variants(self) -> None:
+        """Test that rewritten variants count towards the size limit."""
+        cache = AssetCache(max_bytes=10)
+        first = _asset(b"x" * 4)
+        cache.put("a", first)
+        cache.put("b", _asset(b"y" * 4))
+
+        first.variants["tag"] = b"z" * 4
+        cache.put("a", first)
+
+        assert cache.get("b") is None
+        assert cache.size == 8
+
+    def test_oversized_asset_is_not_cached(self) -> None:
+        """Test that an asset larger than the cache is skipped."""
+        cache = AssetCache(max_bytes=4)
+        cache.put("a", _asset(b"12345"))
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+class TestCachedAsset:
+    """Cached assets carry validators for both directions."""
+
+    def test_freshness(self) -> None:
+        """Test that assets go stale after max_age seconds."""
+        asset = _asset(b"", validated_at=100.0)
+
+        assert asset.is_fresh(now=159.0, max_age=60.0)
+        assert not asset.is_fresh(now=160.0, max_age=60.0)
+
+    def test_conditional_headers(self) -> None:
+        """Test that revalidation sends the stored validators."""
+        asset = _asset(b"", etag='"v1"', last_modified="Mon, 01 Jan 2024 GMT")
+
+        assert asset.conditional_headers() == {
+            "if-none-match": '"v1"',
+            "if-modified-since": "Mon, 01 Jan 2024 GMT",
+        }
+        assert _asset(b"").conditional_headers() == {}
+
+    def test_client_validators(self) -> None:
+        """Test that If-None-Match wins over If-Modified-Since."""
+        asset = _asset(b"", etag='"v1"', last_modified="Mon, 01 Jan 2024 GMT")
+
+        assert asset.not_modified_for({"if-none-match": 'W/"v1", "v0"'}, '"v1"')
+        assert not asset.not_modified_for(
+            {
+                "if-none-match": '"v0"',
+                "if-modified-since": "Mon, 01 Jan 2024 GMT",
+            },
+            '"v1"',
+        )
+        assert asset.not_modified_for(
+            {"if-modified-since": "Mon, 01 Jan 2024 GMT"}, None
+        )
+        assert not asset.not_modified_for({}, '"v1"')
+
+    def test_variant_etag(self) -> None:
+        """Test that rewritten variants get their own weak ETag."""
+        assert variant_etag('"v1"', "abc") == 'W/"v1-abc"'
+        assert variant_etag('W/"v1"', "abc") == 'W/"v1-abc"'
+        assert variant_etag(None, "abc") is None
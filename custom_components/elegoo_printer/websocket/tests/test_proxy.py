@@ -1,13 +1,22 @@
 """Tests for ElegooPrinterServer utility functions."""
 
+import asyncio
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from aiohttp import WSCloseCode, web
+from multidict import CIMultiDict
 
-from custom_components.elegoo_printer.sdcp.models.printer import Printer
+from custom_components.elegoo_printer.sdcp import json_codec
+from custom_components.elegoo_printer.sdcp.models.printer import Printer, PrinterData
 from custom_components.elegoo_printer.websocket.server.proxy import ElegooPrinterServer
 from custom_components.elegoo_printer.websocket.server.registry import PrinterRegistry
+from custom_components.elegoo_printer.websocket.server.video import (
+    VideoStreamBusyError,
+)
+
+PROXY_MODULE = "custom_components.elegoo_printer.websocket.server.proxy"
 
 
 @pytest.fixture
@@ -453,6 +462,82 @@ class TestElegooPrinterServerUtilities:
         assert video_url is None
         assert target is None
 
+    def test_rewrite_video_url_splices_value_in_place(
+        self, proxy_server: ElegooPrinterServer, sample_printer: Printer
+    ) -> None:
+        """Test that only the VideoUrl value changes in a video response."""
+        proxy_server.printer_registry.get_printer_by_mainboard_id.return_value = (
+            sample_printer
+        )
+        payload = (
+            '{"Id": "x", "Data": {"Cmd": 386, "Data": {"Ack": 0, '
+            '"VideoUrl": "192.168.1.100:3031/video"}, "RequestID": "r1"}}'
+        )
+
+        with patch.object(PrinterData, "get_local_ip", return_value="192.168.1.10"):
+            result = proxy_server._rewrite_video_url("abc", payload)
+
+        assert result == payload.replace(
+            "192.168.1.100:3031/video", "192.168.1.10:3031/video?id=abc"
+        )
+
+    def test_rewrite_video_url_skips_frames_without_video_url(
+        self, proxy_server: ElegooPrinterServer
+    ) -> None:
+        """Test that status frames are forwarded without being parsed."""
+        payload = '{"Status": {"CurrentStatus": [0]}, "Topic": "sdcp/status/abc"}'
+
+        with patch.object(json_codec, "loads") as loads:
+            result = proxy_server._rewrite_video_url("abc", payload)
+
+        loads.assert_not_called()
+        assert result is payload
+
+    def test_rewrite_video_url_falls_back_to_parsing(
+        self, proxy_server: ElegooPrinterServer, sample_printer: Printer
+    ) -> None:
+        """Test that a VideoUrl the splice cannot handle is still rewritten."""
+        proxy_server.printer_registry.get_printer_by_mainboard_id.return_value = (
+            sample_printer
+        )
+        payload = '{"Data": {"Data": {"VideoUrl": ["192.168.1.100:3031/video"]}}}'
+
+        with patch.object(PrinterData, "get_local_ip", return_value="192.168.1.10"):
+            result = proxy_server._rewrite_video_url("abc", payload)
+
+        assert json.loads(result)["Data"]["Data"]["VideoUrl"] == (
+            "192.168.1.10:3031/video?id=abc"
+        )
+
+    def test_rewrite_video_url_ignores_keys_outside_data(
+        self, proxy_server: ElegooPrinterServer, sample_printer: Printer
+    ) -> None:
+        """Test that only the VideoUrl on the Data path is rewritten."""
+        proxy_server.printer_registry.get_printer_by_mainboard_id.return_value = (
+            sample_printer
+        )
+        payload = (
+            '{"Extra": {"VideoUrl": "other:1/feed"}, '
+            '"Data": {"Data": {"VideoUrl": "192.168.1.100:3031/video"}}}'
+        )
+
+        with patch.object(PrinterData, "get_local_ip", return_value="192.168.1.10"):
+            result = proxy_server._rewrite_video_url("abc", payload)
+
+        frame = json.loads(result)
+        assert frame["Extra"]["VideoUrl"] == "other:1/feed"
+        assert frame["Data"]["Data"]["VideoUrl"] == "192.168.1.10:3031/video?id=abc"
+
+    def test_rewrite_video_url_leaves_stray_key_alone(
+        self, proxy_server: ElegooPrinterServer
+    ) -> None:
+        """Test that a lone VideoUrl off the Data path is not rewritten."""
+        payload = '{"Extra": {"VideoUrl": "other:1/feed"}, "Data": {}}'
+
+        result = proxy_server._rewrite_video_url("abc", payload)
+
+        assert result is payload
+
     def test_constructor_allows_multiple_instances(
         self, mock_logger: Mock, mock_hass: Mock, mock_session: Mock
     ) -> None:
@@ -477,3 +562,274 @@ class TestElegooPrinterServerUtilities:
         expected_video_port = 3031  # VIDEO_PORT
         assert ws_port == expected_ws_port
         assert video_port == expected_video_port
+
+    def test_printer_connection_is_shared_and_released(
+        self, proxy_server: ElegooPrinterServer, sample_printer: Printer
+    ) -> None:
+        """Test that clients share one upstream that closes with the last client."""
+
+        async def _run() -> None:
+            proxy_server.api_session = Mock()
+            remote_ws = Mock(closed=False)
+            remote_ws.close = AsyncMock()
+            remote_ws.__aiter__ = Mock(return_value=remote_ws)
+            remote_ws.__anext__ = AsyncMock(side_effect=asyncio.Event().wait)
+            proxy_server.api_session.ws_connect = AsyncMock(return_value=remote_ws)
+            request = Mock(path_qs="/websocket", headers={})
+            first, second = Mock(), Mock()
+
+            first_conn = await proxy_server._attach_to_printer(
+                request, sample_printer, first
+            )
+            second_conn = await proxy_server._attach_to_printer(
+                request, sample_printer, second
+            )
+            assert first_conn is second_conn
+            proxy_server.api_session.ws_connect.assert_awaited_once()
+
+            await proxy_server._detach_from_printer(
+                sample_printer.id, first_conn, first
+            )
+            remote_ws.close.assert_not_awaited()
+            await proxy_server._detach_from_printer(
+                sample_printer.id, second_conn, second
+            )
+            remote_ws.close.assert_awaited_once()
+            assert proxy_server._printer_connections == {}
+
+        asyncio.run(_run())
+
+    def test_video_viewers_share_one_hub_per_printer(
+        self, proxy_server: ElegooPrinterServer, sample_printer: Printer
+    ) -> None:
+        """Test that viewer query strings do not create extra upstream streams."""
+        proxy_server.video_session = Mock(closed=False)
+        hub = Mock(closed=False)
+        hub.subscribe = AsyncMock(side_effect=VideoStreamBusyError("in use"))
+
+        async def _run() -> list[web.Response]:
+            return [
+                await proxy_server._centralized_video_handler(
+                    Mock(
+                        path="/video",
+                        query_string=f"id={sample_printer.id}&_={i}",
+                        headers={"Cookie": f"viewer={i}"},
+                    )
+                )
+                for i in range(2)
+            ]
+
+        with (
+            patch.object(
+                proxy_server,
+                "_get_target_printer_from_request",
+                return_value=sample_printer,
+            ),
+            patch(f"{PROXY_MODULE}.VideoStreamHub", return_value=hub) as hub_cls,
+        ):
+            responses = asyncio.run(_run())
+
+        assert [response.status for response in responses] == [503, 503]
+        hub_cls.assert_called_once()
+        assert hub_cls.call_args.args[1:3] == ("http://192.168.1.100:3031/video", {})
+        assert proxy_server._video_hubs == {sample_printer.id: hub}
+
+    def test_multi_printer_connect_does_not_wait_for_slow_printers(
+        self, proxy_server: ElegooPrinterServer
+    ) -> None:
+        """Test that late printers are added after the client is served."""
+        printers = {}
+        for mainboard_id in ("fast_printer", "slow_printer", "dead_printer"):
+            printer = Printer()
+            printer.id = mainboard_id
+            printers[mainboard_id] = printer
+        proxy_server.printer_registry.get_all_printers.return_value = printers
+        slow_up = asyncio.Event()
+        connections = {mainboard_id: Mock() for mainboard_id in printers}
+        dead_cancelled = []
+
+        async def _attach(
+            _request: Mock, printer: Printer, _client_ws: Mock
+        ) -> Mock | None:
+            if printer.id == "slow_printer":
+                await slow_up.wait()
+            elif printer.id == "dead_printer":
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    dead_cancelled.append(printer.id)
+                    raise
+            return connections[printer.id]
+
+        async def _run() -> None:
+            client_ws = Mock(closed=True)
+            with (
+                patch.object(proxy_server, "_attach_to_printer", side_effect=_attach),
+                patch(
+                    "custom_components.elegoo_printer.websocket.server.proxy."
+                    "PRINTER_CONNECT_WAIT",
+                    0.01,
+                ),
+            ):
+                result = await proxy_server._handle_multi_printer_connection(
+                    Mock(), client_ws
+                )
+                assert result == {"fast_printer": connections["fast_printer"]}
+
+                slow_up.set()
+                await asyncio.sleep(0.01)
+                assert set(result) == {"fast_printer", "slow_printer"}
+
+                await proxy_server._cleanup_websocket_connections({}, client_ws)
+
+            assert dead_cancelled == ["dead_printer"]
+            assert proxy_server._late_attaches == {}
+
+        asyncio.run(_run())
+
+    def test_multi_printer_client_closed_when_no_printer_attaches(
+        self, proxy_server: ElegooPrinterServer
+    ) -> None:
+        """Test that a client is closed once every printer connect failed."""
+        printers = {}
+        for mainboard_id in ("offline_printer", "late_printer"):
+            printer = Printer()
+            printer.id = mainboard_id
+            printers[mainboard_id] = printer
+        proxy_server.printer_registry.get_all_printers.return_value = printers
+        late_fails = asyncio.Event()
+
+        async def _attach(_request: Mock, printer: Printer, _client_ws: Mock) -> None:
+            if printer.id == "late_printer":
+                await late_fails.wait()
+                raise TimeoutError
+
+        async def _run() -> None:
+            client_ws = Mock(closed=False, close=AsyncMock())
+            with (
+                patch.object(proxy_server, "_attach_to_printer", side_effect=_attach),
+                patch(f"{PROXY_MODULE}.PRINTER_CONNECT_WAIT", 0.01),
+            ):
+                result = await proxy_server._handle_multi_printer_connection(
+                    Mock(), client_ws
+                )
+                assert result == {}
+                client_ws.close.assert_not_called()
+
+                late_fails.set()
+                await asyncio.sleep(0.01)
+
+            client_ws.close.assert_awaited_once_with(
+                code=WSCloseCode.TRY_AGAIN_LATER, message=b"No printer available"
+            )
+            await proxy_server._cleanup_websocket_connections({}, client_ws)
+            assert proxy_server._late_attaches == {}
+
+        asyncio.run(_run())
+
+    def _asset_session(
+        self, proxy_server: ElegooPrinterServer, status: int = 200
+    ) -> Mock:
+        """Return an API session answering with a small JavaScript asset."""
+        body = b'new WebSocket("ws://localhost:3030/websocket");'
+        upstream = Mock(status=status, reason="OK")
+        upstream.headers = CIMultiDict(
+            {
+                "content-type": "text/javascript",
+                "content-length": str(len(body)),
+                "etag": '"v1"',
+            }
+        )
+        upstream.read = AsyncMock(return_value=body)
+        context = AsyncMock()
+        context.__aenter__.return_value = upstream
+        proxy_server.api_session = Mock(closed=False)
+        proxy_server.api_session.request = Mock(return_value=context)
+        return proxy_server.api_session
+
+    def _asset_request(self, headers: dict[str, str] | None = None) -> Mock:
+        """Return a GET request for the test asset."""
+        return Mock(
+            method="GET",
+            path="/app.js",
+            query_string="",
+            headers=CIMultiDict(headers or {}),
+        )
+
+    def test_static_asset_is_served_from_cache(
+        self, proxy_server: ElegooPrinterServer, sample_printer: Printer
+    ) -> None:
+        """Test that a fresh asset is rewritten once and not fetched again."""
+        proxy_server.printer_registry.get_printer_by_mainboard_id.return_value = None
+        proxy_server.printer_registry.get_all_printers.return_value = {
+            "192.168.1.100": sample_printer
+        }
+        session = self._asset_session(proxy_server)
+
+        async def _run() -> list:
+            return [
+                await proxy_server._centralized_http_proxy_handler(
+                    self._asset_request()
+                )
+                for _ in range(2)
+            ]
+
+        first, second = asyncio.run(_run())
+
+        session.request.assert_called_once()
+        assert first.body == second.body
+        assert b"websocket?id=test_mainboard_id_12345" in first.body
+        assert first.headers["etag"].startswith('W/"v1-')
+
+    def test_stale_asset_is_revalidated(
+        self, proxy_server: ElegooPrinterServer, sample_printer: Printer
+    ) -> None:
+        """Test that a stale asset is revalidated with a conditional request."""
+        proxy_server.printer_registry.get_printer_by_mainboard_id.return_value = None
+        proxy_server.printer_registry.get_all_printers.return_value = {
+            "192.168.1.100": sample_printer
+        }
+        session = self._asset_session(proxy_server)
+
+        async def _run() -> web.Response:
+            first = await proxy_server._centralized_http_proxy_handler(
+                self._asset_request()
+            )
+            for asset, _ in proxy_server._asset_cache._entries.values():
+                asset.validated_at -= 3600
+            upstream = session.request.return_value.__aenter__.return_value
+            upstream.status = 304
+            upstream.read.reset_mock()
+
+            second = await proxy_server._centralized_http_proxy_handler(
+                self._asset_request()
+            )
+            upstream.read.assert_not_awaited()
+            assert second.body == first.body
+            return first
+
+        first = asyncio.run(_run())
+
+        headers = session.request.call_args.kwargs["headers"]
+        assert headers["if-none-match"] == '"v1"'
+        assert first.status == 200
+
+    def test_client_revalidation_gets_not_modified(
+        self, proxy_server: ElegooPrinterServer, sample_printer: Printer
+    ) -> None:
+        """Test that a client holding the rewritten ETag gets a 304."""
+        proxy_server.printer_registry.get_printer_by_mainboard_id.return_value = None
+        proxy_server.printer_registry.get_all_printers.return_value = {
+            "192.168.1.100": sample_printer
+        }
+        self._asset_session(proxy_server)
+
+        async def _run() -> web.Response:
+            first = await proxy_server._centralized_http_proxy_handler(
+                self._asset_request()
+            )
+            return await proxy_server._centralized_http_proxy_handler(
+                self._asset_request({"If-None-Match": first.headers["etag"]})
+            )
+
+        assert asyncio.run(_run()).status == 304
@@ -237,3 +237,66 @@ class TestPrinterRegistry:
         # Add printer
         printer_registry.add_printer(sample_printer)
         assert printer_registry.count() == 1
+
+    def test_mainboard_id_lookup_is_case_insensitive(
+        self, printer_registry: PrinterRegistry, sample_printer: Printer
+    ) -> None:
+        """Test MainboardID lookups ignore case."""
+        printer_registry.add_printer(sample_printer)
+
+        assert (
+            printer_registry.get_printer_by_mainboard_id("TEST_MAINBOARD_ID_12345")
+            is sample_printer
+        )
+        assert printer_registry.get_all_printers_by_mainboard_id() == {
+            "test_mainboard_id_12345": sample_printer
+        }
+
+    def test_mainboard_id_index_follows_registry_changes(
+        self, printer_registry: PrinterRegistry, sample_printer: Printer
+    ) -> None:
+        """Test the MainboardID index is updated on re-add, remove and clear."""
+        printer_registry.add_printer(sample_printer)
+        replacement = Printer()
+        replacement.ip_address = sample_printer.ip_address
+        replacement.id = "new_id_1234"
+
+        # Re-registering an IP drops the old printer's MainboardID
+        printer_registry.add_printer(replacement)
+        assert (
+            printer_registry.get_printer_by_mainboard_id("test_mainboard_id_12345")
+            is None
+        )
+        assert (
+            printer_registry.get_printer_by_mainboard_id("new_id_1234") is replacement
+        )
+
+        printer_registry.remove_printer(sample_printer.ip_address)
+        assert printer_registry.get_printer_by_mainboard_id("new_id_1234") is None
+
+        printer_registry.add_printer(sample_printer)
+        printer_registry.clear()
+        assert printer_registry.get_all_printers_by_mainboard_id() == {}
+
+    def test_mainboard_id_shared_by_two_ips_survives_removal(
+        self, printer_registry: PrinterRegistry, sample_printer: Printer
+    ) -> None:
+        """Test a MainboardID still resolves while another IP reports it."""
+        moved = Printer()
+        moved.ip_address = "192.168.1.200"
+        moved.id = sample_printer.id
+        printer_registry.add_printer(sample_printer)
+        printer_registry.add_printer(moved)
+
+        # Like the old scan, the first registered printer wins
+        assert (
+            printer_registry.get_printer_by_mainboard_id(sample_printer.id)
+            is sample_printer
+        )
+
+        printer_registry.remove_printer(sample_printer.ip_address)
+        assert printer_registry.get_printer_by_mainboard_id(sample_printer.id) is moved
+
+        printer_registry.add_printer(sample_printer)
+        printer_registry.remove_printer(sample_printer.ip_address)
+        assert printer_registry.get_printer_by_mainboard_id(sample_printer.id) is moved
@@ -0,0 +1,92 @@
+"""Tests for the streaming web UI rewriter."""
+
+import pytest
+
+from custom_components.elegoo_printer.websocket.server.rewrite import (
+    LiteralRewriter,
+    printer_rewriter,
+)
+
+PRINTER_ID = "test_mainboard_id_12345"
+PRINTER_IP = "192.168.1.100"
+LOCAL_IP = "10.0.0.5"
+
+BUNDLE = (
+    'var api = "http://192.168.1.100/api";\n'
+    'var ws = new WebSocket("ws://${this.hostName}:3030/websocket");\n'
+    'var again = "ws://${this.hostName}:3030/websocket?id=other";\n'
+    "var host = `${this.webSocketService.hostName}:80`;\n"
+    'var local = "ws://localhost:3030/websocket";\n'
+    "var video = 'http://192.168.1.100:3031/video';\n"
+    "// ünïcödé stays intact\n"
+).encode()
+
+
+@pytest.fixture
+def rewriter() -> LiteralRewriter:
+    """Return the rewriter for the test printer."""
+    return printer_rewriter(PRINTER_ID, PRINTER_IP, LOCAL_IP)
+
+
+def test_rewrites_addresses_and_websocket_urls(rewriter: LiteralRewriter) -> None:
+    """Test that one pass applies every printer rewrite."""
+    result = rewriter.rewrite(BUNDLE).decode()
+
+    assert PRINTER_IP not in result
+    assert f'"http://{LOCAL_IP}:3030/api"' in result
+    assert f"'http://{LOCAL_IP}:3031/video'" in result
+    assert f"ws://${{this.hostName}}:3030/websocket?id={PRINTER_ID}" in result
+    assert f"ws://localhost:3030/websocket?id={PRINTER_ID}" in result
+    assert "${this.webSocketService.hostName}:3030" in result
+    assert "ünïcödé" in result
+
+
+def test_routed_urls_are_not_rewritten_again(rewriter: LiteralRewriter) -> None:
+    """Test that URLs already carrying ?id= are left alone."""
+    result = rewriter.rewrite(BUNDLE).decode()
+
+    assert "ws://${this.hostName}:3030/websocket?id=other" in result
+    assert rewriter.rewrite(rewriter.rewrite(BUNDLE)) == rewriter.rewrite(BUNDLE)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 16, 64, len(BUNDLE)])
+def test_stream_matches_whole_document(
+    rewriter: LiteralRewriter, chunk_size: int
+) -> None:
+    """Test that chunked rewriting matches rewriting the whole document."""
+    stream = rewriter.stream()
+    output = [
+        stream.feed(BUNDLE[i : i + chunk_size])
+        for i in range(0, len(BUNDLE), chunk_size)
+    ]
+    output.append(stream.flush())
+
+    assert b"".join(output) == rewriter.rewrite(BUNDLE)
+
+
+def test_stream_holds_back_at_most_one_window(rewriter: LiteralRewriter) -> None:
+    """Test that the carry-over never exceeds the longest pattern."""
+    stream = rewriter.stream()
+    emitted = 0
+    for i in range(0, len(BUNDLE), 5):
+        emitted += len(stream.feed(BUNDLE[i : i + 5]))
+        assert len(stream._carry) <= rewriter.window
+
+    assert emitted + len(stream.flush()) == len(rewriter.rewrite(BUNDLE))
+
+
+def test_printer_without_id_keeps_websocket_urls() -> None:
+    """Test that MainboardID injection is skipped without an id."""
+    rewriter = printer_rewriter(None, PRINTER_IP, LOCAL_IP)
+
+    result = rewriter.rewrite(BUNDLE).decode()
+
+    assert "websocket?id=test" not in result
+    assert PRINTER_IP not in result
+
+
+def test_rewriter_is_compiled_once_per_printer() -> None:
+    """Test that the compiled rewriter is reused across requests."""
+    assert printer_rewriter(PRINTER_ID, PRINTER_IP, LOCAL_IP) is printer_rewriter(
+        PRINTER_ID, PRINTER_IP, LOCAL_IP
+    )
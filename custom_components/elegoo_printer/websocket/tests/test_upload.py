@@ -0,0 +1,246 @@
+"""Tests for the proxy file upload relay."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from functools import partial
+from unittest.mock import AsyncMock, Mock, patch
+
+from aiohttp import StreamReader
+from multidict import CIMultiDict
+
+from custom_components.elegoo_printer.const import EVENT_UPLOAD_PROGRESS
+from custom_components.elegoo_printer.sdcp.models.printer import Printer
+from custom_components.elegoo_printer.websocket.server.proxy import ElegooPrinterServer
+from custom_components.elegoo_printer.websocket.server.upload import (
+    UploadRelay,
+    parse_upload_fields,
+)
+
+BOUNDARY = b"----boundary"
+PROXY_MODULE = "custom_components.elegoo_printer.websocket.server.proxy"
+
+
+def _field(name: str, value: str) -> bytes:
+    return (
+        b"--" + BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="'
+        + name.encode()
+        + b'"\r\n\r\n'
+        + value.encode()
+        + b"\r\n"
+    )
+
+
+def _upload_body(offset: int, total: int, data: bytes) -> bytes:
+    return (
+        _field("S-File-MD5", "d41d8cd98f00b204e9800998ecf8427e")
+        + _field("Check", "1")
+        + _field("Offset", str(offset))
+        + _field("Uuid", "upload-1")
+        + _field("TotalSize", str(total))
+        + b"--"
+        + BOUNDARY
+        + b"\r\n"
+        b'Content-Disposition: form-data; name="File"; filename="model.goo"\r\n'
+        b"Content-Type: application/octet-stream\r\n\r\n" + data + b"\r\n"
+        b"--" + BOUNDARY + b"--\r\n"
+    )
+
+
+def _stream(body: bytes, *, eof: bool = True) -> StreamReader:
+    reader = StreamReader(
+        Mock(_reading_paused=False), 2**16, loop=asyncio.get_running_loop()
+    )
+    reader.feed_data(body)
+    if eof:
+        reader.feed_eof()
+    return reader
+
+
+def test_parse_upload_fields() -> None:
+    """Test that the SDCP upload fields are read from the multipart head."""
+    fields = parse_upload_fields(_upload_body(1024, 4096, b"x"))
+
+    assert fields["Offset"] == "1024"
+    assert fields["TotalSize"] == "4096"
+    assert fields["Uuid"] == "upload-1"
+    assert "File" not in fields
+
+
+class TestUploadRelay:
+    """The relay forwards the body unchanged in bounded chunks."""
+
+    def test_body_is_relayed_unchanged_in_bounded_chunks(self) -> None:
+        """Test that the peeked head and the rest add up to the original body."""
+        body = _upload_body(0, 300_000, b"x" * 300_000)
+
+        async def _run() -> list[bytes]:
+            relay = UploadRelay(_stream(body), chunk_size=64 * 1024)
+            fields = await relay.read_fields()
+            assert fields["TotalSize"] == "300000"
+            return [chunk async for chunk in relay.body()]
+
+        chunks = asyncio.run(_run())
+
+        assert b"".join(chunks) == body
+        assert all(len(chunk) <= 64 * 1024 for chunk in chunks)
+
+    def test_progress_tracks_offset_and_total(self) -> None:
+        """Test that progress starts at the piece offset within the file."""
+        body = _upload_body(1000, 4000, b"x" * 1000)
+
+        async def _run() -> UploadRelay:
+            relay = UploadRelay(_stream(body), Mock(), progress_interval=0)
+            await relay.read_fields()
+            async for _ in relay.body():
+                pass
+            return relay
+
+        relay = asyncio.run(_run())
+
+        assert relay.progress.offset == 1000
+        # Form fields are not counted, the closing boundary is
+        assert 1000 <= relay.progress.bytes_sent < len(body)
+        assert relay.progress.position == 1000 + relay.progress.bytes_sent
+        assert relay.progress.fraction == relay.progress.position / 4000
+
+    def test_stalled_client_times_out(self) -> None:
+        """Test that a client sending nothing more ends the relay."""
+        body = _upload_body(0, 4000, b"x" * 1000)
+
+        async def _run() -> UploadRelay:
+            relay = UploadRelay(_stream(body, eof=False), read_timeout=0.01)
+            await relay.read_fields()
+            try:
+                async for _ in relay.body():
+                    pass
+            except TimeoutError:
+                return relay
+            raise AssertionError
+
+        relay = asyncio.run(_run())
+
+        assert relay.timed_out
+
+
+class TestUploadHandler:
+    """The proxy relays uploads one at a time per printer."""
+
+    def _server(self) -> tuple[ElegooPrinterServer, list]:
+        server = ElegooPrinterServer(Mock(), Mock(), None)
+        events: list = []
+        server.hass.bus.async_fire = Mock(
+            side_effect=lambda event, data: events.append((event, data))
+        )
+        active = 0
+        peak = 0
+
+        class _Upstream:
+            status = 200
+            reason = "OK"
+            headers = CIMultiDict({"content-type": "application/json"})
+
+        def _post(_url: str, *, data: AsyncIterator[bytes], **_: object) -> AsyncMock:
+            async def _enter(*_args: object) -> _Upstream:
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                async for _chunk in data:
+                    await asyncio.sleep(0)
+                active -= 1
+                return _Upstream()
+
+            context = AsyncMock()
+            context.__aenter__.side_effect = _enter
+            return context
+
+        server.file_session = Mock(closed=False, post=Mock(side_effect=_post))
+        server._streamed_response = AsyncMock(side_effect=lambda *args: args[1])
+        server.peak = lambda: peak
+        return server, events
+
+    def test_uploads_to_one_printer_are_serialized(self) -> None:
+        """Test that concurrent uploads to one printer do not overlap."""
+        printer = Printer()
+        printer.id = "test_mainboard_id_12345"
+        printer.ip_address = "192.168.1.100"
+        server, events = self._server()
+
+        async def _run() -> None:
+            requests = [
+                Mock(content=_stream(_upload_body(i * 1000, 2000, b"x" * 1000)))
+                for i in range(2)
+            ]
+            await asyncio.gather(
+                *(
+                    server._relay_upload(request, printer, "http://printer", {})
+                    for request in requests
+                )
+            )
+
+        asyncio.run(_run())
+
+        assert server.peak() == 1
+        states = [data["state"] for event, data in events]
+        assert all(event == EVENT_UPLOAD_PROGRESS for event, _ in events)
+        assert states.count("complete") == 1
+        assert events[-1][1]["uuid"] == "upload-1"
+
+    def test_stalled_upload_releases_slot(self) -> None:
+        """Test that a stalled upload gives its slot to the next one."""
+        printer = Printer()
+        printer.id = "test_mainboard_id_12345"
+        printer.ip_address = "192.168.1.100"
+        server, events = self._server()
+
+        async def _run() -> list:
+            stalled = Mock(
+                content=_stream(_upload_body(0, 2000, b"x" * 1000), eof=False)
+            )
+            healthy = Mock(content=_stream(_upload_body(1000, 2000, b"x" * 1000)))
+            return await asyncio.gather(
+                server._relay_upload(stalled, printer, "http://printer", {}),
+                server._relay_upload(healthy, printer, "http://printer", {}),
+            )
+
+        with patch(
+            f"{PROXY_MODULE}.UploadRelay", partial(UploadRelay, read_timeout=0.01)
+        ):
+            stalled, healthy = asyncio.run(_run())
+
+        assert stalled.status == 408
+        assert healthy.status == 200
+        states = [data["state"] for _, data in events]
+        assert "failed" in states
+        assert states[-1] == "complete"
+
+    def test_waiting_upload_is_not_read_before_its_slot(self) -> None:
+        """Test that the read timeout only starts once the upload has its slot."""
+        printer = Printer()
+        printer.id = "test_mainboard_id_12345"
+        printer.ip_address = "192.168.1.100"
+        server, _ = self._server()
+
+        async def _run() -> object:
+            slot = server._get_upload_slot(printer)
+            await slot.acquire()
+            content = _stream(b"", eof=False)
+            waiting = asyncio.create_task(
+                server._relay_upload(
+                    Mock(content=content), printer, "http://printer", {}
+                )
+            )
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+
+            slot.release()
+            content.feed_data(_upload_body(0, 1000, b"x" * 1000))
+            content.feed_eof()
+            return await waiting
+
+        with patch(
+            f"{PROXY_MODULE}.UploadRelay", partial(UploadRelay, read_timeout=0.01)
+        ):
+            response = asyncio.run(_run())
+
+        assert response.status == 200
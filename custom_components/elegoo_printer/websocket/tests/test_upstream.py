@@ -0,0 +1,456 @@
+"""Tests for the shared upstream printer WebSocket."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from aiohttp import WSMsgType
+
+from custom_components.elegoo_printer.websocket.server.upstream import (
+    SharedPrinterConnection,
+    extract_request_id,
+)
+
+MAINBOARD_ID = "test_mainboard_id_12345"
+
+
+class _FakeRemoteWebSocket:
+    """Upstream WebSocket fed from a queue of (type, data) messages."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.sent: list[str] = []
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    def __aiter__(self) -> "_FakeRemoteWebSocket":
+        return self
+
+    async def __anext__(self) -> Mock:
+        msg_type, data = await self.messages.get()
+        if msg_type is None:
+            raise StopAsyncIteration
+        return Mock(type=msg_type, data=data)
+
+    async def send_str(self, payload: str) -> None:
+        self.sent.append(payload)
+
+    async def send_bytes(self, payload: bytes) -> None:
+        self.sent.append(payload)
+
+    async def close(self) -> None:
+        self.closed = True
+        self.messages.put_nowait((None, None))
+
+
+class _StalledRemoteWebSocket(_FakeRemoteWebSocket):
+    """Upstream WebSocket whose sends block until ``accept`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.accept = asyncio.Event()
+
+    async def send_str(self, payload: str) -> None:
+        await self.accept.wait()
+        await super().send_str(payload)
+
+
+class _ResetRemoteWebSocket(_FakeRemoteWebSocket):
+    """Upstream WebSocket whose peer has gone away."""
+
+    async def send_str(self, _payload: str) -> None:
+        raise ConnectionResetError
+
+
+def _client_ws() -> Mock:
+    client_ws = Mock(closed=False)
+    client_ws.send_str = AsyncMock()
+    client_ws.send_bytes = AsyncMock()
+    client_ws.close = AsyncMock()
+    return client_ws
+
+
+def _frame(topic: str, request_id: str | None = None) -> str:
+    data = {"MainboardID": MAINBOARD_ID}
+    if request_id:
+        data["RequestID"] = request_id
+    return json.dumps({"Data": data, "Topic": f"sdcp/{topic}/{MAINBOARD_ID}"})
+
+
+def _connection(
+    remote_ws: _FakeRemoteWebSocket,
+) -> tuple[SharedPrinterConnection, MagicMock]:
+    printer = Mock(ip_address="192.168.1.100", id=MAINBOARD_ID)
+    printer.name = "Test Printer"
+    session = MagicMock()
+    session.ws_connect = AsyncMock(return_value=remote_ws)
+    return SharedPrinterConnection(printer, session, Mock()), session
+
+
+def _request() -> Mock:
+    return Mock(path_qs="/websocket", headers={})
+
+
+async def _never(_payload: object) -> None:
+    await asyncio.Event().wait()
+
+
+async def _drain() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_extract_request_id() -> None:
+    """Only frames carrying Data.RequestID have a request id."""
+    assert extract_request_id(json.loads(_frame("response", "abc"))) == "abc"
+    assert extract_request_id(json.loads(_frame("status"))) is None
+    assert extract_request_id({"Data": "nope"}) is None
+    assert extract_request_id([]) is None
+
+
+class TestSharedPrinterConnection:
+    """One upstream WebSocket is shared by every client of a printer."""
+
+    def test_clients_share_one_upstream(self) -> None:
+        """A second client reuses the open upstream connection."""
+
+        async def _run() -> None:
+            remote_ws = _FakeRemoteWebSocket()
+            connection, session = _connection(remote_ws)
+            first, second = _client_ws(), _client_ws()
+
+            connection.attach(first)
+            assert await connection.connect(_request())
+            connection.attach(second)
+            assert await connection.connect(_request())
+
+            session.ws_connect.assert_awaited_once()
+            await connection.close()
+
+        asyncio.run(_run())
+
+    def test_response_goes_to_requesting_client(self) -> None:
+        """Responses are routed back to the client that sent the RequestID."""
+
+        async def _run() -> None:
+            remote_ws = _FakeRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            first, second = _client_ws(), _client_ws()
+            connection.attach(first)
+            connection.attach(second)
+            await connection.connect(_request())
+
+            request = _frame("request", "req-1")
+            await connection.send_str(second, request, "req-1")
+            response = _frame("response", "req-1")
+            remote_ws.messages.put_nowait((WSMsgType.TEXT, response))
+            await _drain()
+
+            assert remote_ws.sent == [request]
+            second.send_str.assert_awaited_once_with(response)
+            first.send_str.assert_not_awaited()
+            await connection.close()
+
+        asyncio.run(_run())
+
+    def test_status_is_broadcast(self) -> None:
+        """Frames without a pending RequestID go to every client."""
+
+        async def _run() -> None:
+            remote_ws = _FakeRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            clients = [_client_ws(), _client_ws(), _client_ws()]
+            for client_ws in clients:
+                connection.attach(client_ws)
+            await connection.connect(_request())
+
+            status = _frame("status")
+            remote_ws.messages.put_nowait((WSMsgType.TEXT, status))
+            remote_ws.messages.put_nowait((WSMsgType.BINARY, b"\x00"))
+            await _drain()
+
+            for client_ws in clients:
+                client_ws.send_str.assert_awaited_once_with(status)
+                client_ws.send_bytes.assert_awaited_once_with(b"\x00")
+            await connection.close()
+
+        asyncio.run(_run())
+
+    def test_transform_is_applied_once_per_frame(self) -> None:
+        """The rewrite runs once per printer frame, not once per client."""
+
+        async def _run() -> None:
+            remote_ws = _FakeRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            connection.transform = Mock(return_value="rewritten")
+            clients = [_client_ws(), _client_ws()]
+            for client_ws in clients:
+                connection.attach(client_ws)
+            await connection.connect(_request())
+
+            remote_ws.messages.put_nowait((WSMsgType.TEXT, _frame("attributes")))
+            await _drain()
+
+            connection.transform.assert_called_once()
+            for client_ws in clients:
+                client_ws.send_str.assert_awaited_once_with("rewritten")
+            await connection.close()
+
+        asyncio.run(_run())
+
+    def test_detach_forgets_pending_requests(self) -> None:
+        """A detached client's pending responses are broadcast instead."""
+
+        async def _run() -> None:
+            remote_ws = _FakeRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            first, second = _client_ws(), _client_ws()
+            connection.attach(first)
+            connection.attach(second)
+            await connection.connect(_request())
+
+            await connection.send_str(first, _frame("request", "req-1"), "req-1")
+            connection.detach(first)
+            response = _frame("response", "req-1")
+            remote_ws.messages.put_nowait((WSMsgType.TEXT, response))
+            await _drain()
+
+            first.send_str.assert_not_awaited()
+            second.send_str.assert_awaited_once_with(response)
+            await connection.close()
+
+        asyncio.run(_run())
+
+    def test_printer_disconnect_closes_clients(self) -> None:
+        """Clients are closed when the printer drops the upstream connection."""
+
+        async def _run() -> None:
+            remote_ws = _FakeRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            client_ws = _client_ws()
+            connection.attach(client_ws)
+            await connection.connect(_request())
+
+            remote_ws.messages.put_nowait((WSMsgType.CLOSE, None))
+            await _drain()
+
+            assert not connection.connected
+            client_ws.close.assert_awaited_once()
+
+        asyncio.run(_run())
+
+
+class TestPrinterSendQueue:
+    """Client frames are queued per printer and written by a writer task."""
+
+    def test_slow_printer_does_not_block_sender(self) -> None:
+        """Sending returns at once and frames arrive in order later."""
+
+        async def _run() -> None:
+            remote_ws = _StalledRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            client_ws = _client_ws()
+            connection.attach(client_ws)
+            await connection.connect(_request())
+
+            frames = [_frame("request", f"req-{i}") for i in range(3)]
+            for frame in frames:
+                await asyncio.wait_for(connection.send_str(client_ws, frame), 0.1)
+            await _drain()
+            assert remote_ws.sent == []
+            assert connection.queue_depth == 2
+
+            remote_ws.accept.set()
+            await _drain()
+            assert remote_ws.sent == frames
+            assert connection.stats.sent == 3
+            await connection.close()
+
+        asyncio.run(_run())
+
+    def test_full_queue_never_loses_a_command(self) -> None:
+        """A sender waits for room instead of dropping queued commands."""
+
+        async def _run() -> None:
+            remote_ws = _StalledRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            client_ws = _client_ws()
+            connection.attach(client_ws)
+            await connection.connect(_request())
+
+            with patch.object(connection, "_outbox", asyncio.Queue(1)):
+                await connection.send_str(client_ws, "pause", "req-1")
+                await _drain()
+                await connection.send_str(client_ws, "stop", "req-2")
+                blocked = asyncio.create_task(
+                    connection.send_bytes(client_ws, b"cancel")
+                )
+                await _drain()
+                assert not blocked.done()
+
+                remote_ws.accept.set()
+                await asyncio.wait_for(blocked, 1)
+                await _drain()
+
+            assert remote_ws.sent == ["pause", "stop", b"cancel"]
+            assert connection.stats.dropped == 0
+            assert {"req-1", "req-2"} <= connection._pending.keys()
+            client_ws.close.assert_not_awaited()
+            await connection.close()
+
+        asyncio.run(_run())
+
+    def test_full_queue_closes_sender_after_timeout(self) -> None:
+        """A frame that cannot be queued in time closes its sender."""
+
+        async def _run() -> None:
+            remote_ws = _StalledRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            sender = _client_ws()
+            other = _client_ws()
+            connection.attach(sender)
+            connection.attach(other)
+            await connection.connect(_request())
+
+            with patch.object(connection, "_outbox", asyncio.Queue(1)):
+                await connection.send_str(other, "first")
+                await _drain()
+                await connection.send_str(other, "second")
+                # The writer is already waiting on "first" with the real timeout
+                with patch(
+                    "custom_components.elegoo_printer.websocket.server.upstream."
+                    "PRINTER_SEND_TIMEOUT",
+                    0.01,
+                ):
+                    await connection.send_str(sender, "stop", "req-1")
+
+            assert connection.stats.dropped == 1
+            assert "req-1" not in connection._pending
+            sender.close.assert_awaited_once()
+            assert sender not in connection.clients
+            other.close.assert_not_awaited()
+            await connection.close()
+
+        asyncio.run(_run())
+
+    def test_send_timeout_closes_upstream(self) -> None:
+        """A printer that stops accepting frames is disconnected."""
+
+        async def _run() -> None:
+            remote_ws = _StalledRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            client_ws = _client_ws()
+            connection.attach(client_ws)
+
+            with patch(
+                "custom_components.elegoo_printer.websocket.server.upstream."
+                "PRINTER_SEND_TIMEOUT",
+                0.01,
+            ):
+                await connection.connect(_request())
+                await connection.send_str(client_ws, "stuck")
+                await asyncio.sleep(0.05)
+
+            assert connection.stats.timeouts == 1
+            assert not connection.connected
+            client_ws.close.assert_awaited_once()
+
+        asyncio.run(_run())
+
+    def test_send_failure_closes_upstream(self) -> None:
+        """A printer whose socket fails on send is disconnected."""
+
+        async def _run() -> None:
+            remote_ws = _ResetRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            client_ws = _client_ws()
+            connection.attach(client_ws)
+            await connection.connect(_request())
+
+            await connection.send_str(client_ws, "lost")
+            await asyncio.sleep(0.01)
+
+            assert connection.stats.failures == 1
+            assert remote_ws.closed
+            assert not connection.connected
+            client_ws.close.assert_awaited_once()
+
+        asyncio.run(_run())
+
+
+class TestClientSendQueue:
+    """Printer frames are queued per client and written by a writer task."""
+
+    def test_stalled_client_does_not_block_others(self) -> None:
+        """A client that stops reading does not delay the other clients."""
+
+        async def _run() -> None:
+            remote_ws = _FakeRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            stalled, healthy = _client_ws(), _client_ws()
+            stalled.send_str = AsyncMock(side_effect=_never)
+            connection.attach(stalled)
+            connection.attach(healthy)
+            await connection.connect(_request())
+
+            frames = [_frame("status") for _ in range(3)]
+            for frame in frames:
+                remote_ws.messages.put_nowait((WSMsgType.TEXT, frame))
+            await _drain()
+
+            assert [c.args[0] for c in healthy.send_str.await_args_list] == frames
+            assert stalled.send_str.await_count == 1
+            await connection.close()
+
+        asyncio.run(_run())
+
+    def test_send_timeout_closes_client(self) -> None:
+        """A client that cannot take a frame in time is detached and closed."""
+
+        async def _run() -> None:
+            remote_ws = _FakeRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            client_ws = _client_ws()
+            client_ws.send_str = AsyncMock(side_effect=_never)
+            connection.attach(client_ws)
+            await connection.connect(_request())
+
+            with patch(
+                "custom_components.elegoo_printer.websocket.server.upstream."
+                "CLIENT_SEND_TIMEOUT",
+                0.01,
+            ):
+                remote_ws.messages.put_nowait((WSMsgType.TEXT, _frame("status")))
+                await asyncio.sleep(0.05)
+
+            assert connection.client_stats.timeouts == 1
+            assert client_ws not in connection.clients
+            client_ws.close.assert_awaited_once()
+            assert connection.connected
+            await connection.close()
+
+        asyncio.run(_run())
+
+    def test_unanswered_requests_expire(self) -> None:
+        """RequestIDs without a response are forgotten after a while."""
+
+        async def _run() -> None:
+            remote_ws = _FakeRemoteWebSocket()
+            connection, _ = _connection(remote_ws)
+            client_ws = _client_ws()
+            connection.attach(client_ws)
+            await connection.connect(_request())
+
+            module = "custom_components.elegoo_printer.websocket.server.upstream"
+            with patch(f"{module}.time.monotonic", return_value=0.0):
+                await connection.send_str(client_ws, "a", "req-1")
+            with patch(f"{module}.time.monotonic", return_value=1000.0):
+                await connection.send_str(client_ws, "b", "req-2")
+            assert list(connection._pending) == ["req-2"]
+
+            with patch(f"{module}.PENDING_REQUEST_MAX", 2):
+                for i in range(3, 6):
+                    await connection.send_str(client_ws, "c", f"req-{i}")
+            assert list(connection._pending) == ["req-4", "req-5"]
+            await connection.close()
+
+        asyncio.run(_run())
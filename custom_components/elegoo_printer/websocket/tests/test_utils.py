@@ -1,8 +1,12 @@
 """Tests for the server utils module."""
 
+from collections.abc import Iterator
 from unittest.mock import Mock, patch
 
+import pytest
+
 from custom_components.elegoo_printer.const import DEFAULT_FALLBACK_IP, PROXY_HOST
+from custom_components.elegoo_printer.sdcp.local_route import invalidate_local_routes
 from custom_components.elegoo_printer.websocket.server.utils import (
     MIN_API_PATH_PARTS,
     MIN_MAINBOARD_ID_LENGTH,
@@ -103,6 +107,13 @@ class TestExtractMainboardIdFromTopic:
 class TestGetLocalIp:
     """Test cases for get_local_ip function."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_route_cache(self) -> Iterator[None]:
+        """Start and end each test with an empty route cache."""
+        invalidate_local_routes()
+        yield
+        invalidate_local_routes()
+
     @patch("socket.socket")
     def test_get_local_ip_success(self, mock_socket_class: Mock) -> None:
         """Test successful local IP retrieval."""
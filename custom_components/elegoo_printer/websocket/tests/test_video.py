@@ -0,0 +1,235 @@
+"""Tests for the shared MJPEG video hub."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from aiohttp import ClientConnectionError
+
+from custom_components.elegoo_printer.websocket.server.video import (
+    MJPEGFrameParser,
+    VideoStreamBusyError,
+    VideoStreamHub,
+    extract_boundary,
+)
+
+BOUNDARY = b"frame"
+CONTENT_TYPE = "multipart/x-mixed-replace; boundary=frame"
+
+
+def _part(body: bytes) -> bytes:
+    return b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + body + b"\r\n"
+
+
+class _FakeStreamReader:
+    """Upstream body fed from a queue; None ends the stream."""
+
+    def __init__(self) -> None:
+        self.chunks: asyncio.Queue = asyncio.Queue()
+
+    async def iter_any(self) -> AsyncIterator[bytes]:
+        while (chunk := await self.chunks.get()) is not None:
+            yield chunk
+
+
+def _session(
+    content_type: str = CONTENT_TYPE,
+) -> tuple[MagicMock, _FakeStreamReader]:
+    reader = _FakeStreamReader()
+    upstream = Mock(status=200, reason="OK", content=reader)
+    upstream.headers = {"content-type": content_type}
+    session = MagicMock()
+    session.get = AsyncMock(return_value=upstream)
+    return session, reader
+
+
+def _hub(session: MagicMock, **kwargs: float) -> VideoStreamHub:
+    return VideoStreamHub(
+        session, "http://192.168.1.100:3031/video", {}, Mock(), **kwargs
+    )
+
+
+async def _drain() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestMJPEGFrameParser:
+    """The parser splits a multipart stream at its boundaries."""
+
+    def test_extract_boundary(self) -> None:
+        """Boundaries are read with or without quotes and leading dashes."""
+        assert extract_boundary(CONTENT_TYPE) == BOUNDARY
+        assert extract_boundary('multipart/x-mixed-replace;boundary="--frame"') == (
+            BOUNDARY
+        )
+        assert extract_boundary("image/jpeg") is None
+
+    def test_frames_split_across_chunks(self) -> None:
+        """Parts are emitted once the next boundary arrives."""
+        parser = MJPEGFrameParser(BOUNDARY)
+        stream = b"preamble" + _part(b"one") + _part(b"two") + _part(b"three")
+
+        frames = []
+        for i in range(0, len(stream), 7):
+            frames.extend(parser.feed(stream[i : i + 7]))
+
+        assert frames == [_part(b"one"), _part(b"two")]
+
+    def test_oversized_partial_frame_is_dropped(self) -> None:
+        """A part that never ends does not grow the buffer without bound."""
+        parser = MJPEGFrameParser(BOUNDARY, max_frame_size=64)
+
+        assert parser.feed(_part(b"x" * 100)) == []
+        assert parser.feed(_part(b"ok") + _part(b"next")) == [_part(b"ok")]
+
+
+class TestVideoStreamHub:
+    """Viewers of one printer share a single upstream stream."""
+
+    def test_viewers_share_one_upstream(self) -> None:
+        """Every viewer receives each frame from one upstream request."""
+
+        async def _run() -> None:
+            session, reader = _session()
+            hub = _hub(session)
+            first = await hub.subscribe()
+            second = await hub.subscribe()
+
+            reader.chunks.put_nowait(_part(b"one") + _part(b"two"))
+            await _drain()
+
+            session.get.assert_awaited_once()
+            assert first.get_nowait() == _part(b"one")
+            assert second.get_nowait() == _part(b"one")
+            await hub.close()
+
+        asyncio.run(_run())
+
+    def test_late_viewer_gets_latest_frame(self) -> None:
+        """A new viewer starts from the most recent complete frame."""
+
+        async def _run() -> None:
+            session, reader = _session()
+            hub = _hub(session)
+            await hub.subscribe()
+            reader.chunks.put_nowait(_part(b"one") + _part(b"two") + _part(b"3"))
+            await _drain()
+
+            late = await hub.subscribe()
+
+            assert late.get_nowait() == _part(b"two")
+            await hub.close()
+
+        asyncio.run(_run())
+
+    def test_slow_viewer_drops_oldest_frames(self) -> None:
+        """A full viewer queue keeps only the newest frames."""
+
+        async def _run() -> None:
+            session, reader = _session()
+            hub = _hub(session, queue_size=2)
+            queue = await hub.subscribe()
+
+            frames = [_part(str(i).encode()) for i in range(5)]
+            reader.chunks.put_nowait(b"".join(frames))
+            await _drain()
+
+            assert [queue.get_nowait(), queue.get_nowait()] == frames[2:4]
+            await hub.close()
+
+        asyncio.run(_run())
+
+    def test_upstream_closes_after_grace_period(self) -> None:
+        """The upstream outlives its last viewer only for the grace period."""
+
+        async def _run() -> None:
+            session, _ = _session()
+            on_close = Mock()
+            hub = VideoStreamHub(
+                session,
+                "http://192.168.1.100:3031/video",
+                {},
+                Mock(),
+                on_close=on_close,
+                grace_period=0.01,
+            )
+            queue = await hub.subscribe()
+            hub.unsubscribe(queue)
+
+            # Re-subscribing inside the grace period keeps the stream open
+            queue = await hub.subscribe()
+            await asyncio.sleep(0.02)
+            assert not hub.closed
+
+            hub.unsubscribe(queue)
+            await asyncio.sleep(0.02)
+            assert hub.closed
+            on_close.assert_called_once_with(hub)
+            session.get.assert_awaited_once()
+
+        asyncio.run(_run())
+
+    def test_upstream_end_finishes_viewers(self) -> None:
+        """Viewers get an end-of-stream marker when the printer stops."""
+
+        async def _run() -> None:
+            session, reader = _session()
+            hub = _hub(session)
+            queue = await hub.subscribe()
+
+            reader.chunks.put_nowait(None)
+            await _drain()
+
+            assert hub.closed
+            assert queue.get_nowait() is None
+
+        asyncio.run(_run())
+
+    def test_failed_open_closes_hub(self) -> None:
+        """A hub whose upstream cannot be opened is closed and forgotten."""
+
+        async def _run() -> None:
+            session, _ = _session()
+            session.get = AsyncMock(side_effect=ClientConnectionError("refused"))
+            on_close = Mock()
+            hub = VideoStreamHub(
+                session,
+                "http://192.168.1.100:3031/video",
+                {},
+                Mock(),
+                on_close=on_close,
+            )
+
+            with pytest.raises(ClientConnectionError):
+                await hub.subscribe()
+
+            assert hub.closed
+            assert hub.subscriber_count == 0
+            on_close.assert_called_once_with(hub)
+
+        asyncio.run(_run())
+
+    def test_raw_stream_has_one_lossless_viewer(self) -> None:
+        """A stream without a boundary is relayed intact to a single viewer."""
+
+        async def _run() -> None:
+            session, reader = _session("image/jpeg")
+            hub = _hub(session, queue_size=2)
+            queue = await hub.subscribe()
+
+            with pytest.raises(VideoStreamBusyError):
+                await hub.subscribe()
+
+            chunks = [bytes([i]) * 10 for i in range(5)]
+            for chunk in chunks:
+                reader.chunks.put_nowait(chunk)
+            received = [await asyncio.wait_for(queue.get(), 1) for _ in chunks]
+
+            assert received == chunks
+            hub.unsubscribe(queue)
+            await _drain()
+            assert hub.closed
+
+        asyncio.run(_run())
@@ -0,0 +1,102 @@
+"""Benchmark MQTT packet framing in the embedded broker.
+
+Compares the old framing loop, which read 1024 bytes at a time, grew a bytes
+buffer with ``data += d`` and re-sliced it after every packet, with the
+PacketFramer the broker uses now, which reads as much as the current packet
+still needs. Reads never return more than the socket buffer holds.
+
+Usage:
+    python scripts/benchmark_mqtt_framing.py [--packets N] [--socket-buffer B]
+"""
+
+import argparse
+import struct
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import from custom_components
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from custom_components.elegoo_printer.mqtt.framing import (
+    PacketFramer,
+    decode_length,
+    encode_packet,
+)
+
+TOPIC = b"sdcp/status/000000000001d354"
+OLD_READ_SIZE = 1024
+
+
+def _publish(payload_size: int) -> bytes:
+    header = struct.pack("!H", len(TOPIC)) + TOPIC
+    return b"".join(encode_packet(3, payload=[header, b"x" * payload_size]))
+
+
+def _frame_before(stream: bytes, socket_buffer: int) -> int:
+    count = 0
+    data = b""
+    read_size = min(OLD_READ_SIZE, socket_buffer)
+    for i in range(0, len(stream), read_size):
+        data += stream[i : i + read_size]
+        while len(data) >= 2:  # noqa: PLR2004
+            length, length_bytes = decode_length(data, 1) or (0, 0)
+            if not length_bytes:
+                break
+            head_len = length_bytes + 1
+            if length + head_len > len(data):
+                break
+            _message = data[head_len : head_len + length]
+            data = data[head_len + length :]
+            count += 1
+    return count
+
+
+def _frame_after(stream: bytes, socket_buffer: int) -> int:
+    count = 0
+    framer = PacketFramer()
+    position = 0
+    while position < len(stream):
+        read_size = min(framer.read_size, socket_buffer)
+        framer.feed(stream[position : position + read_size])
+        position += read_size
+        for _ in framer.packets():
+            count += 1
+    return count
+
+
+def _packets_per_second(
+    frame, stream: bytes, socket_buffer: int, packets: int
+) -> float:
+    start = time.perf_counter()
+    framed = frame(stream, socket_buffer)
+    elapsed = time.perf_counter() - start
+    if framed != packets:
+        msg = f"framed {framed} of {packets} packets"
+        raise RuntimeError(msg)
+    return packets / elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print packets framed per second."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packets", type=int, default=20_000)
+    parser.add_argument("--socket-buffer", type=int, default=65_536)
+    args = parser.parse_args()
+
+    cases = [
+        ("status 1 KiB", 1024),
+        ("attributes 16 KiB", 16 * 1024),
+        ("history 256 KiB", 256 * 1024),
+    ]
+    print(f"{'payload':<20}{'before (p/s)':>16}{'after (p/s)':>16}{'speedup':>10}")
+    for name, payload_size in cases:
+        packets = max(args.packets * 1024 // payload_size, 100)
+        stream = _publish(payload_size) * packets
+        before = _packets_per_second(_frame_before, stream, args.socket_buffer, packets)
+        after = _packets_per_second(_frame_after, stream, args.socket_buffer, packets)
+        print(f"{name:<20}{before:>16,.0f}{after:>16,.0f}{after / before:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark SDCP status/attributes frame ingest.
+
+Compares the old handler path, which re-serialised every already-parsed frame
+with json.dumps() so PrinterStatus.from_json() could json.loads() it again,
+with the dict-native constructors the handlers use now.
+
+Usage:
+    python scripts/benchmark_status_ingest.py [--frames N]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import from custom_components
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from custom_components.elegoo_printer.sdcp.models.attributes import PrinterAttributes
+from custom_components.elegoo_printer.sdcp.models.enums import PrinterType
+from custom_components.elegoo_printer.sdcp.models.status import PrinterStatus
+
+STATUS_FRAME = json.dumps(
+    {
+        "Status": {
+            "CurrentStatus": [1],
+            "PreviousStatus": 0,
+            "TempOfNozzle": 210.5,
+            "TempTargetNozzle": 210.0,
+            "TempOfHotbed": 60.1,
+            "TempTargetHotbed": 60.0,
+            "TempOfBox": 31.2,
+            "TempTargetBox": 0,
+            "CurrenCoord": "120.00,95.50,12.40",
+            "CurrentFanSpeed": {"ModelFan": 100, "AuxiliaryFan": 0, "BoxFan": 30},
+            "ZOffset": 0.0,
+            "LightStatus": {"SecondLight": 1, "RgbLight": [0, 0, 0]},
+            "PrintInfo": {
+                "Status": 13,
+                "CurrentLayer": 150,
+                "TotalLayer": 500,
+                "CurrentTicks": 60000,
+                "TotalTicks": 200000,
+                "Filename": "benchy.gcode",
+                "ErrorNumber": 0,
+                "TaskId": "b9a8b8f8-8b8b-4b8b-8b8b-8b8b8b8b8b8b",
+                "PrintSpeedPct": 100,
+            },
+        },
+        "MainboardID": "000000000001d354",
+        "TimeStamp": 1687069655,
+        "Topic": "sdcp/status/000000000001d354",
+    }
+)
+
+ATTRIBUTES_FRAME = json.dumps(
+    {
+        "Attributes": {
+            "Name": "Centauri Carbon",
+            "MachineName": "Centauri Carbon",
+            "BrandName": "ELEGOO",
+            "ProtocolVersion": "V3.0.0",
+            "FirmwareVersion": "V1.1.29",
+            "MainboardIP": "192.168.1.10",
+            "MainboardID": "000000000001d354",
+            "Capabilities": ["FILE_TRANSFER", "PRINT_CONTROL", "VIDEO_STREAM"],
+            "SupportFileType": ["GCODE"],
+            "DevicesStatus": {"ZMotorStatus": 1, "XMotorStatus": 1},
+        },
+        "MainboardID": "000000000001d354",
+        "TimeStamp": 1687069655,
+        "Topic": "sdcp/attributes/000000000001d354",
+    }
+)
+
+
+def _status_before(raw: str) -> PrinterStatus:
+    data = json.loads(raw)
+    return PrinterStatus.from_json(json.dumps(data), PrinterType.FDM)
+
+
+def _status_after(raw: str) -> PrinterStatus:
+    return PrinterStatus(json.loads(raw), PrinterType.FDM)
+
+
+def _attributes_before(raw: str) -> PrinterAttributes:
+    return PrinterAttributes.from_json(json.dumps(json.loads(raw)))
+
+
+def _attributes_after(raw: str) -> PrinterAttributes:
+    return PrinterAttributes(json.loads(raw))
+
+
+def _frames_per_second(parse, raw: str, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        parse(raw)
+    return frames / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print frames parsed per second."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=50_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("status", _status_before, _status_after, STATUS_FRAME),
+        ("attributes", _attributes_before, _attributes_after, ATTRIBUTES_FRAME),
+    ]
+    print(f"{'frame':<12}{'before (f/s)':>16}{'after (f/s)':>16}{'speedup':>10}")
+    for name, before, after, raw in cases:
+        before_fps = _frames_per_second(before, raw, args.frames)
+        after_fps = _frames_per_second(after, raw, args.frames)
+        print(
+            f"{name:<12}{before_fps:>16,.0f}{after_fps:>16,.0f}"
+            f"{after_fps / before_fps:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
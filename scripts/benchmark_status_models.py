@@ -0,0 +1,169 @@
+"""Benchmark memory and allocations of the slotted status/history models.
+
+For each model class this builds N instances with the real slotted class and
+with a __dict__-backed copy of it (same __init__, no __slots__), and reports
+the memory retained per instance. It then reports the allocations made while
+decoding one SDCP status frame and one CC2 status snapshot.
+
+Usage:
+    python scripts/benchmark_status_models.py [--instances N]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path to import from custom_components
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from custom_components.elegoo_printer.cc2.models import CC2StatusMapper
+from custom_components.elegoo_printer.sdcp.models.enums import PrinterType
+from custom_components.elegoo_printer.sdcp.models.print_history_detail import (
+    PrintHistoryDetail,
+    SliceInformation,
+)
+from custom_components.elegoo_printer.sdcp.models.status import (
+    CurrentFanSpeed,
+    LightStatus,
+    PrinterStatus,
+    PrintInfo,
+)
+
+PRINT_INFO = {
+    "Status": 13,
+    "CurrentLayer": 150,
+    "TotalLayer": 500,
+    "CurrentTicks": 60000,
+    "TotalTicks": 200000,
+    "Filename": "benchy.gcode",
+    "ErrorNumber": 0,
+    "TaskId": "b9a8b8f8-8b8b-4b8b-8b8b-8b8b8b8b8b8b",
+    "PrintSpeedPct": 100,
+}
+
+STATUS_FRAME = {
+    "Status": {
+        "CurrentStatus": [1],
+        "TempOfNozzle": 210.5,
+        "TempTargetNozzle": 210.0,
+        "TempOfHotbed": 60.1,
+        "TempTargetHotbed": 60.0,
+        "CurrenCoord": "120.00,95.50,12.40",
+        "CurrentFanSpeed": {"ModelFan": 100, "AuxiliaryFan": 0, "BoxFan": 30},
+        "LightStatus": {"SecondLight": 1, "RgbLight": [0, 0, 0]},
+        "PrintInfo": PRINT_INFO,
+    },
+    "MainboardID": "000000000001d354",
+    "Topic": "sdcp/status/000000000001d354",
+}
+
+CC2_STATUS = {
+    "machine_status": {"status": 2, "sub_status": 1066, "progress": 30},
+    "extruder": {"temperature": 210.5, "target": 210},
+    "heater_bed": {"temperature": 60.1, "target": 60},
+    "ztemperature_sensor": {"temperature": 31.2},
+    "fans": {"fan": {"speed": 255}, "aux_fan": {"speed": 0}, "box_fan": {"speed": 77}},
+    "led": {"status": 255},
+    "gcode_move_inf": {"x": 120.0, "y": 95.5, "z": 12.4, "speed_mode": 1, "e": 812.3},
+    "print_status": {
+        "filename": "benchy.gcode",
+        "uuid": "b9a8b8f8-8b8b-4b8b-8b8b-8b8b8b8b8b8b",
+        "current_layer": 150,
+        "total_layer": 500,
+        "print_duration": 600,
+        "total_duration": 2000,
+        "remaining_time_sec": 1400,
+    },
+}
+
+HISTORY_ENTRY = {
+    "TaskName": "benchy.gcode",
+    "BeginTime": 1687069655,
+    "EndTime": 1687079655,
+    "TaskStatus": 1,
+    "SliceInformation": {"layer_height": 0.2, "total_layer_numbers": 500},
+    "AlreadyPrintLayer": 500,
+    "TaskId": "b9a8b8f8-8b8b-4b8b-8b8b-8b8b8b8b8b8b",
+    "MD5": "d41d8cd98f00b204e9800998ecf8427e",
+}
+
+CASES = [
+    (CurrentFanSpeed, STATUS_FRAME["Status"]["CurrentFanSpeed"]),
+    (LightStatus, STATUS_FRAME["Status"]["LightStatus"]),
+    (PrintInfo, PRINT_INFO),
+    (PrinterStatus, STATUS_FRAME),
+    (SliceInformation, HISTORY_ENTRY["SliceInformation"]),
+    (PrintHistoryDetail, HISTORY_ENTRY),
+]
+
+
+def _dict_backed(cls: type) -> type:
+    """Return a copy of a slotted class that stores attributes in __dict__."""
+    namespace = {
+        key: value
+        for key, value in vars(cls).items()
+        if key not in {"__slots__", *cls.__slots__}
+    }
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+def _retained_bytes(cls: type, data: dict, instances: int) -> float:
+    """Return the memory retained per instance of cls."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [cls(data) for _ in range(instances)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return retained / instances
+
+
+def _allocations(build) -> tuple[int, int]:
+    """Return the (blocks, bytes) allocated by one call of build."""
+    build()  # warm caches
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    stats = after.compare_to(before, "filename")
+    return (
+        sum(stat.count_diff for stat in stats),
+        sum(stat.size_diff for stat in stats),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the retained and allocated memory."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instances", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'model':<20}{'dict (B/obj)':>14}{'slots (B/obj)':>15}{'saved':>8}")
+    for cls, data in CASES:
+        dict_bytes = _retained_bytes(_dict_backed(cls), data, args.instances)
+        slot_bytes = _retained_bytes(cls, data, args.instances)
+        print(
+            f"{cls.__name__:<20}{dict_bytes:>14,.0f}{slot_bytes:>15,.0f}"
+            f"{1 - slot_bytes / dict_bytes:>8.0%}"
+        )
+
+    print()
+    print(f"{'decode':<20}{'blocks':>14}{'bytes':>15}")
+    for name, build in (
+        ("sdcp status frame", lambda: PrinterStatus(STATUS_FRAME, PrinterType.FDM)),
+        (
+            "cc2 status",
+            lambda: CC2StatusMapper.map_status(CC2_STATUS, PrinterType.FDM),
+        ),
+    ):
+        blocks, size = _allocations(build)
+        print(f"{name:<20}{blocks:>14,}{size:>15,}")
+
+
+if __name__ == "__main__":
+    main()